@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Check of warm verifier processes with the stand-in verifier (verifier.py in the same directory):
+verdicts, CPU time, wall time and memory limits, incomplete replies and crashes of the verifier.
+"""
+
+import os
+import sys
+import tempfile
+
+EXAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(EXAMPLE_DIR, os.pardir, os.pardir, os.pardir, "scripts"))
+
+# pylint: disable=wrong-import-position
+from aux.warm_verifier import COLUMN_STATUS, WarmVerifier
+from components import TERMINATION_ERROR, TERMINATION_OUT_OF_MEMORY, TERMINATION_TIMEOUT
+
+TIME_LIMIT = 2
+WALL_TIME_LIMIT = 4
+MEMORY_LIMIT = 100 * 10 ** 6
+
+# Input file -> expected status. Tasks are solved in the given order by the same verifier.
+TASKS = [
+    ("safe", "true"),
+    ("unsafe", "false(unreach-call)"),
+    ("spin", TERMINATION_TIMEOUT),
+    ("hang", TERMINATION_TIMEOUT),
+    ("eat", TERMINATION_OUT_OF_MEMORY),
+    ("partial", "true"),
+    ("crash", TERMINATION_ERROR),
+    ("safe", "true")
+]
+
+
+def check(verifier: WarmVerifier, work_dir: str, task: str, expected_status: str,
+          memory_limit: int = MEMORY_LIMIT) -> bool:
+    """
+    Solve a single task and compare its status with the expected one.
+    """
+    output_dir = tempfile.mkdtemp(dir=work_dir)
+    columns = verifier.solve(["-setprop", f"output.path={output_dir}", task],
+                             os.path.join(output_dir, "log.txt"), TIME_LIMIT, memory_limit,
+                             WALL_TIME_LIMIT)
+    is_correct = columns[COLUMN_STATUS] == expected_status
+    print(f"{task}: {columns} - {'OK' if is_correct else f'expected {expected_status}'}")
+    return is_correct
+
+
+def main() -> int:
+    """
+    Run all checks.
+    :return: number of failed checks.
+    """
+    command = f"{sys.executable} {os.path.join(EXAMPLE_DIR, 'verifier.py')}"
+    failed = 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        verifier = WarmVerifier(command)
+        try:
+            for task, expected_status in TASKS:
+                if not check(verifier, work_dir, task, expected_status):
+                    failed += 1
+            # Memory, which was kept after the previous task, is not counted for the next one.
+            if not check(verifier, work_dir, "keep", "true", 0) or \
+                    not check(verifier, work_dir, "safe", "true"):
+                failed += 1
+        finally:
+            verifier.stop(force=True)
+    print(f"{failed} checks failed" if failed else "All checks passed")
+    return failed
+
+
+if __name__ == '__main__':
+    sys.exit(main())
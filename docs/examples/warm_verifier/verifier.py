@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Stand-in for a warm verifier, which follows the protocol of scripts/aux/warm_verifier.py.
+Instead of verification it behaves in accordance with the name of the input file (the last
+verifier option):
+    safe, unsafe - replies with the corresponding verdict;
+    spin - spends CPU time forever;
+    hang - waits forever without spending CPU time;
+    eat - allocates memory for the task;
+    keep - allocates memory, which is kept after the task (as a heap of JVM);
+    partial - prints a part of the reply and completes it later;
+    crash - exits without a reply.
+"""
+
+import json
+import os
+import sys
+import time
+
+ALLOCATION_SIZE = 300 * 10 ** 6
+
+KEPT_MEMORY = []
+
+
+def solve(args: list) -> str:
+    """
+    Solve a single task.
+    :return: verdict in BenchExec format.
+    """
+    output_dir = "."
+    for arg in args:
+        if arg.startswith("output.path="):
+            output_dir = arg[len("output.path="):]
+    task = os.path.basename(args[-1]) if args else ""
+    if task == "unsafe":
+        with open(os.path.join(output_dir, "witness.0.graphml"), "w", encoding="ascii") as file_obj:
+            file_obj.write("<graphml/>\n")
+        return "false(unreach-call)"
+    if task == "spin":
+        while True:
+            pass
+    if task == "hang":
+        while True:
+            time.sleep(1)
+    if task == "eat":
+        memory = [b"\x01" * ALLOCATION_SIZE]
+        time.sleep(2)
+        memory.clear()
+    elif task == "keep":
+        KEPT_MEMORY.append(b"\x01" * ALLOCATION_SIZE)
+    elif task == "partial":
+        # Reader should not be blocked by an incomplete line.
+        sys.stdout.write('{"status": ')
+        sys.stdout.flush()
+        time.sleep(2)
+    elif task == "crash":
+        sys.exit(1)
+    return "true"
+
+
+def main():
+    """
+    Solve tasks from the standard input until it is closed.
+    """
+    for line in sys.stdin:
+        task_desc = json.loads(line)
+        with open(task_desc["log"], "w", encoding="ascii") as log:
+            log.write(f"Stand-in verifier {os.getpid()}: {' '.join(task_desc['args'])}\n")
+        status = solve(task_desc["args"])
+        if task_desc["args"][-1] == "partial":
+            print(f"{json.dumps(status)}}}", flush=True)
+        else:
+            print(json.dumps({"status": status}), flush=True)
+
+
+if __name__ == '__main__':
+    main()
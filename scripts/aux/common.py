@@ -21,6 +21,7 @@
 Common functions.
 """
 
+import multiprocessing.connection
 import os
 import sys
 
@@ -38,6 +39,38 @@ def wait_for_launches(processes):
         kill_launches(processes)
 
 
+def wait_for_any(processes, queues=None, timeout=None) -> list:
+    """
+    Block until at least one of the given processes is terminated or one of the given queues
+    has data to be read (instead of busy waiting). Already terminated processes are ignored.
+    Only queues, which are read by the caller, should be passed here.
+    :param processes: list of processes (None elements are ignored).
+    :param queues: list of multiprocessing queues or connections.
+    :param timeout: maximum time to wait in seconds (None - wait without limit).
+    :return: list of terminated (and joined) processes.
+    """
+    sentinels = {}
+    for process in processes:
+        if process and process.exitcode is None:
+            sentinels[process.sentinel] = process
+    objects = list(sentinels.keys())
+    for queue in queues or []:
+        if isinstance(queue, multiprocessing.connection.Connection):
+            objects.append(queue)
+        else:
+            # Queue does not provide its reading end in public interface.
+            objects.append(queue._reader)  # pylint: disable=protected-access
+    if not objects:
+        return []
+    terminated = []
+    for obj in multiprocessing.connection.wait(objects, timeout):
+        if obj in sentinels:
+            # Sentinel may become ready slightly before the process can be reaped.
+            sentinels[obj].join()
+            terminated.append(sentinels[obj])
+    return terminated
+
+
 def kill_launches(processes):
     """
     Kill all created processes.
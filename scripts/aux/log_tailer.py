@@ -0,0 +1,60 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Incremental reading of growing log files.
+"""
+
+import os
+
+
+class LogTailer:
+    """
+    Reads only lines, which were appended to log files since the previous call, so that each
+    file is read once regardless of the number of polls.
+    """
+
+    def __init__(self):
+        # File name -> (offset of the next byte, incomplete last line).
+        self.__positions = {}
+
+    def read_lines(self, file_name: str) -> list:
+        """
+        Returns new complete lines of the given file.
+        """
+        offset, tail = self.__positions.get(file_name, (0, b""))
+        try:
+            with open(file_name, "rb") as file_obj:
+                if os.fstat(file_obj.fileno()).st_size < offset:
+                    # File was truncated or recreated.
+                    offset, tail = 0, b""
+                file_obj.seek(offset)
+                data = file_obj.read()
+        except FileNotFoundError:
+            return []
+        lines = (tail + data).split(b"\n")
+        self.__positions[file_name] = (offset + len(data), lines.pop())
+        return [line.decode("utf8", errors="ignore") for line in lines]
+
+    def forget(self, file_name: str) -> None:
+        """
+        Stop tracking of the given file.
+        """
+        self.__positions.pop(file_name, None)
@@ -0,0 +1,392 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Auxiliary data structures for scheduling of launches.
+"""
+
+import heapq
+import itertools
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+
+# Resources, for which pressure stall information is provided by the kernel.
+PRESSURE_RESOURCES = ["cpu", "memory", "io"]
+PRESSURE_CGROUP_MEMORY = "cgroup memory"
+DEFAULT_PRESSURE_INTERVAL = 1  # Seconds.
+
+
+def _get_cgroup_dir() -> str:
+    # Directory of cgroup v2 of the current process.
+    if os.path.exists("/proc/self/cgroup"):
+        with open("/proc/self/cgroup", encoding="ascii", errors="ignore") as file_obj:
+            for line in file_obj:
+                # Format: <id>:<controllers>:<path>, cgroup v2 has empty controllers.
+                parts = line.strip().split(":", 2)
+                if len(parts) == 3 and parts[0] == "0" and not parts[1]:
+                    return os.path.join("/sys/fs/cgroup", parts[2].lstrip("/"))
+    return "/sys/fs/cgroup"
+
+
+def _read_number(file_name: str):
+    try:
+        with open(file_name, encoding="ascii", errors="ignore") as file_obj:
+            value = file_obj.read().strip()
+    except OSError:
+        return None
+    return int(value) if value.isdigit() else None
+
+
+class PressureGovernor:
+    """
+    Delays start of new processes while the host is overloaded: share of time, in which some
+    tasks were stalled on CPU, memory or IO for the last 10 seconds (pressure stall information of
+    the control group or of the whole host), or share of used memory of the control group exceed
+    the given limits.
+    """
+
+    def __init__(self, limits: dict, interval: float = DEFAULT_PRESSURE_INTERVAL):
+        """
+        :param limits: map of resources (cpu, memory, io) to maximal pressure (in percent) and
+        'cgroup memory' to maximal share of used memory of the control group.
+        :param interval: pressure is checked not more often than this time (in seconds).
+        """
+        self.limits = limits
+        self.interval = interval
+        self.reason = ""  # Why new processes are delayed now.
+        self.__last_check = None
+        cgroup_dir = _get_cgroup_dir()
+        self.__pressure_files = {}
+        for resource in PRESSURE_RESOURCES:
+            for file in [os.path.join(cgroup_dir, f"{resource}.pressure"),
+                         os.path.join("/proc/pressure", resource)]:
+                if os.path.exists(file):
+                    self.__pressure_files[resource] = file
+                    break
+        self.__memory_files = None
+        for usage_file, limit_file in [
+                (os.path.join(cgroup_dir, "memory.current"),
+                 os.path.join(cgroup_dir, "memory.max")),
+                ("/sys/fs/cgroup/memory/memory.usage_in_bytes",
+                 "/sys/fs/cgroup/memory/memory.limit_in_bytes")]:
+            if os.path.exists(usage_file):
+                self.__memory_files = usage_file, limit_file
+                break
+
+    def __get_pressure(self, resource: str):
+        try:
+            with open(self.__pressure_files[resource], encoding="ascii",
+                      errors="ignore") as file_obj:
+                for line in file_obj:
+                    # Format: some avg10=<percent> avg60=<percent> avg300=<percent> total=<us>
+                    fields = line.split()
+                    if fields and fields[0] == "some":
+                        return float(fields[1].split("=")[1])
+        except (OSError, IndexError, ValueError):
+            pass
+        return None
+
+    def __get_memory_usage(self):
+        if not self.__memory_files:
+            return None
+        usage, limit = (_read_number(file) for file in self.__memory_files)
+        # Control group v1 without limit reports a huge number.
+        if not usage or not limit or limit >= 2 ** 62:
+            return None
+        return usage / limit
+
+    def __get_reason(self) -> str:
+        for resource in PRESSURE_RESOURCES:
+            if resource in self.limits and resource in self.__pressure_files:
+                pressure = self.__get_pressure(resource)
+                if pressure is not None and pressure > self.limits[resource]:
+                    return f"{resource} pressure is {pressure}%"
+        if PRESSURE_CGROUP_MEMORY in self.limits:
+            usage = self.__get_memory_usage()
+            if usage is not None and usage > self.limits[PRESSURE_CGROUP_MEMORY]:
+                return f"control group uses {round(usage * 100, 1)}% of its memory"
+        return ""
+
+    def is_high(self) -> bool:
+        """
+        Check if start of new processes should be delayed.
+        """
+        now = time.monotonic()
+        if self.__last_check is None or now - self.__last_check >= self.interval:
+            self.__last_check = now
+            self.reason = self.__get_reason()
+        return bool(self.reason)
+
+
+class ResourcePool:
+    """
+    Tracks free memory and CPU cores of the host, which can be given to launches.
+    """
+
+    def __init__(self, memory: float, cores: float, max_tasks: int = 0,
+                 governor: PressureGovernor = None):
+        """
+        :param memory: overall memory (in GB) for launches, 0 means unlimited.
+        :param cores: overall number of CPU cores for launches, 0 means unlimited.
+        :param max_tasks: maximum number of parallel launches, 0 means unlimited.
+        :param governor: if specified, new launches are not admitted while the host is overloaded.
+        """
+        self.memory = memory
+        self.cores = cores
+        self.max_tasks = max_tasks
+        self.governor = governor
+        self.used_memory = 0
+        self.used_cores = 0
+        self.tasks = 0
+
+    def fits(self, need: tuple) -> bool:
+        """
+        Check if a launch with the given (memory, cores) requirements can be started now.
+        """
+        memory, cores = need
+        if self.max_tasks and self.tasks >= self.max_tasks:
+            return False
+        if not self.tasks:
+            # Always admit at least one launch, otherwise it will never be started.
+            return True
+        if self.governor and self.governor.is_high():
+            return False
+        if self.memory and self.used_memory + memory > self.memory:
+            return False
+        if self.cores and self.used_cores + cores > self.cores:
+            return False
+        return True
+
+    def acquire(self, need: tuple) -> None:
+        """
+        Take resources for a started launch.
+        """
+        memory, cores = need
+        self.used_memory += memory
+        self.used_cores += cores
+        self.tasks += 1
+
+    def release(self, need: tuple) -> None:
+        """
+        Return resources of a completed launch.
+        """
+        memory, cores = need
+        self.used_memory -= memory
+        self.used_cores -= cores
+        self.tasks -= 1
+
+    def __str__(self):
+        return f"{self.tasks} launches, {round(self.used_memory, 2)}/{self.memory}GB of RAM, " \
+               f"{self.used_cores}/{self.cores} CPU cores"
+
+
+class SharedResourcePool(ResourcePool):
+    """
+    Resources, which are leased from the parent pool, so launches of different kinds share the
+    same CPU cores and memory. Some number of launches is always admitted, even if the parent
+    pool is full, so that they are not starved.
+    """
+
+    def __init__(self, parent: ResourcePool, min_tasks: int = 1, max_tasks: int = 0):
+        super().__init__(0, 0, max_tasks)
+        self.parent = parent
+        self.min_tasks = min_tasks
+
+    def fits(self, need: tuple) -> bool:
+        if self.max_tasks and self.tasks >= self.max_tasks:
+            return False
+        if self.tasks < self.min_tasks:
+            return True
+        return self.parent.fits(need)
+
+    def acquire(self, need: tuple) -> None:
+        super().acquire(need)
+        self.parent.acquire(need)
+
+    def release(self, need: tuple) -> None:
+        super().release(need)
+        self.parent.release(need)
+
+    def __str__(self):
+        return f"{self.tasks} launches"
+
+
+class TaskQueue:
+    """
+    Queue of tasks with resource requirements. A task with the smallest key, which fits into
+    free resources, is taken first (tasks with equal keys are taken in order of addition).
+    """
+
+    def __init__(self):
+        # Resource requirements -> heap of tasks with such requirements.
+        self.__heaps = {}
+        self.__counter = itertools.count()
+        self.__size = 0
+
+    def push(self, task, need: tuple, key=0) -> None:
+        """
+        Add a new task with (memory, cores) requirements.
+        """
+        heapq.heappush(self.__heaps.setdefault(need, []), (key, next(self.__counter), task))
+        self.__size += 1
+
+    def pop(self, resource_pool: ResourcePool):
+        """
+        Take the first task, which fits into free resources.
+        :return: (task, need) or None if there is no such task.
+        """
+        best = None
+        for need, heap in self.__heaps.items():
+            if heap and resource_pool.fits(need):
+                if not best or heap[0][:2] < self.__heaps[best][0][:2]:
+                    best = need
+        if not best:
+            return None
+        _, _, task = heapq.heappop(self.__heaps[best])
+        if not self.__heaps[best]:
+            del self.__heaps[best]
+        self.__size -= 1
+        return task, best
+
+    def __len__(self):
+        return self.__size
+
+
+# Object, which methods are called by worker processes (inherited on fork).
+_WORKER_OBJECT = None
+
+
+def _init_worker(obj):
+    global _WORKER_OBJECT  # pylint: disable=global-statement
+    _WORKER_OBJECT = obj
+
+
+def _get_child_sessions(pid: int) -> list:
+    """
+    Returns sessions, which were started by children of the given process.
+    """
+    sessions = []
+    for child_pid in os.listdir("/proc"):
+        if not child_pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{child_pid}/stat", encoding="ascii", errors="ignore") as file_obj:
+                # Command name may contain spaces, so fields are taken after it.
+                fields = file_obj.read().rsplit(")", 1)[1].split()
+            # Parent process and session.
+            if int(fields[1]) == pid and int(fields[3]) == int(child_pid):
+                sessions.append(int(child_pid))
+        except (OSError, IndexError, ValueError):
+            continue
+    return sessions
+
+
+def _call_worker_method(method_name: str, *args):
+    cur_dir = os.getcwd()
+    try:
+        return getattr(_WORKER_OBJECT, method_name)(*args)
+    finally:
+        # Jobs may change working directory, which should not affect the next jobs.
+        os.chdir(cur_dir)
+
+
+class WorkerPool:
+    """
+    Pool of persistent worker processes, which call public methods of the given object.
+    Workers are forked on the first submission, so the object is inherited as it was at that
+    moment (it is not pickled), while arguments and returned values are pickled.
+    """
+
+    def __init__(self, obj, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self.__obj = obj
+        self.__executor = None
+        self.__completed = []
+        self.__lock = threading.Lock()
+        self.__reader, self.__writer = multiprocessing.Pipe(duplex=False)
+
+    @property
+    def connection(self):
+        """
+        Connection, which becomes ready for reading, when some job is completed.
+        """
+        return self.__reader
+
+    def submit(self, method, *args) -> Future:
+        """
+        Call the given method of the object in a worker process.
+        :param method: public bound method of the object.
+        :return: future with the returned value.
+        """
+        if not self.__executor:
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker, initargs=(self.__obj,))
+        future = self.__executor.submit(_call_worker_method, method.__name__, *args)
+        future.add_done_callback(self.__on_done)
+        return future
+
+    def __on_done(self, future: Future):
+        with self.__lock:
+            self.__completed.append(future)
+            self.__writer.send_bytes(b"")
+
+    def get_completed(self) -> list:
+        """
+        Returns jobs, which were completed since the previous call.
+        """
+        while self.__reader.poll():
+            self.__reader.recv_bytes()
+        with self.__lock:
+            completed, self.__completed = self.__completed, []
+        return completed
+
+    def shutdown(self):
+        """
+        Wait for all submitted jobs and stop worker processes.
+        """
+        if self.__executor:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    def terminate(self):
+        """
+        Kill worker processes without waiting for submitted jobs. Sessions, which were started
+        by workers (e.g., warm verifiers), are killed as well, since they are not in the process
+        group of the worker.
+        """
+        if self.__executor:
+            # pylint: disable=protected-access
+            for process in list((self.__executor._processes or {}).values()):
+                if process.is_alive():
+                    # Children are found by parent, so they are collected before the kill.
+                    sessions = _get_child_sessions(process.pid)
+                    process.kill()
+                    for session_id in sessions:
+                        try:
+                            os.killpg(session_id, signal.SIGKILL)
+                        except OSError:
+                            pass
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
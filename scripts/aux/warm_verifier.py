@@ -0,0 +1,219 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Persistent verifier process, which solves verification tasks one by one.
+
+The process reads a task from its standard input as a single JSON line:
+    {"args": [<verifier options and input file>], "log": "<log file>"}
+writes verifier log into the given file and outputs a single JSON line with the verdict in
+BenchExec format:
+    {"status": "true" | "false(<property>)" | "<termination reason>"}
+The process should exit, when its standard input is closed. Verifier options contain output
+directory, so output files are written into the same place as in case of BenchExec.
+"""
+
+import json
+import os
+import select
+import shlex
+import signal
+import subprocess
+import time
+
+from components import TERMINATION_ERROR, TERMINATION_OUT_OF_MEMORY, TERMINATION_TIMEOUT
+
+# Interval (in seconds) between checks of resources, which are spent on the current task.
+POLL_INTERVAL = 0.2
+# Time (in seconds) to wait for a process, which standard input was closed.
+STOP_TIMEOUT = 5
+READ_BLOCK_SIZE = 2 ** 16
+
+COLUMN_STATUS = "status"
+COLUMN_CPU_TIME = "cputime"
+COLUMN_WALL_TIME = "walltime"
+COLUMN_MEMORY = "memory"
+
+
+def _get_session_stats(session_id: int) -> tuple:
+    """
+    Returns overall CPU time (in seconds) and resident memory (in bytes) of all processes in the
+    given session.
+    """
+    ticks = os.sysconf("SC_CLK_TCK")
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    cpu_time = 0.0
+    memory = 0
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat", encoding="ascii", errors="ignore") as file_obj:
+                # Command name may contain spaces, so fields are taken after it.
+                fields = file_obj.read().rsplit(")", 1)[1].split()
+            if int(fields[3]) != session_id:
+                continue
+            # utime, stime, cutime and cstime (time of completed children is also included).
+            cpu_time += sum(int(value) for value in fields[11:15]) / ticks
+            memory += int(fields[21]) * page_size
+        except (OSError, IndexError, ValueError):
+            # Process has already been terminated.
+            continue
+    return cpu_time, memory
+
+
+class WarmVerifier:
+    """
+    Keeps a verifier process, so its start-up costs (e.g., start of JVM and loading of classes)
+    are paid once for many verification tasks. Resource limits of each task are enforced by
+    measuring all processes of the verifier session: if the limit is exceeded, then the verifier
+    is killed and restarted for the next task. Memory, which the session holds at the start of a
+    task (e.g., heap kept after the previous tasks), is not counted for it.
+    """
+
+    def __init__(self, command: str, max_tasks: int = 0, env=None):
+        """
+        :param command: command, which starts verifier process.
+        :param max_tasks: verifier process is restarted after this number of tasks (0 means
+        never), which limits growth of its memory.
+        :param env: environment of verifier process.
+        """
+        self.command = command
+        self.max_tasks = max_tasks
+        self.env = env
+        self.__process = None
+        self.__tasks = 0
+        self.__output = b""  # Output of the verifier, which does not form a complete line yet.
+
+    def __start(self):
+        # A separate session allows to measure and kill all processes of the verifier.
+        # pylint: disable=consider-using-with
+        self.__process = subprocess.Popen(shlex.split(self.command), stdin=subprocess.PIPE,
+                                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                          env=self.env, start_new_session=True)
+        # Verifier may print a part of a line, so its output is read without blocking.
+        os.set_blocking(self.__process.stdout.fileno(), False)
+        self.__tasks = 0
+        self.__output = b""
+
+    def __read_line(self):
+        """
+        Read available output of the verifier.
+        :return: complete line, empty line if the output was closed, or None.
+        """
+        try:
+            data = os.read(self.__process.stdout.fileno(), READ_BLOCK_SIZE)
+        except BlockingIOError:
+            return None
+        if not data:
+            return b""
+        self.__output += data
+        if b"\n" not in self.__output:
+            return None
+        line, self.__output = self.__output.split(b"\n", 1)
+        return line
+
+    def solve(self, args: list, log_file: str, time_limit: float = 0, memory_limit: int = 0,
+              wall_time_limit: float = 0) -> dict:
+        """
+        Solve a single verification task.
+        :param args: verifier options and input file.
+        :param log_file: file for verifier log.
+        :param time_limit: CPU time limit in seconds (0 means unlimited).
+        :param memory_limit: memory limit in bytes (0 means unlimited).
+        :param wall_time_limit: wall time limit in seconds (0 means unlimited).
+        :return: BenchExec columns (status, CPU time, wall time and memory).
+        """
+        if not self.__process:
+            self.__start()
+        session_id = self.__process.pid
+        start_wall_time = time.time()
+        start_cpu_time, start_memory = _get_session_stats(session_id)
+        cpu_time = 0.0
+        memory = 0
+        status = None
+        try:
+            self.__process.stdin.write(
+                (json.dumps({"args": args, "log": log_file}) + "\n").encode("utf8"))
+            self.__process.stdin.flush()
+        except OSError:
+            status = TERMINATION_ERROR
+        while status is None:
+            ready, _, _ = select.select([self.__process.stdout], [], [], POLL_INTERVAL)
+            session_cpu_time, session_memory = _get_session_stats(session_id)
+            cpu_time = max(cpu_time, session_cpu_time - start_cpu_time)
+            memory = max(memory, session_memory - start_memory)
+            line = self.__read_line() if ready else None
+            if line is not None:
+                try:
+                    status = json.loads(line).get(COLUMN_STATUS) or TERMINATION_ERROR
+                except (ValueError, AttributeError):
+                    # Verifier process has been terminated or its output is incorrect.
+                    status = TERMINATION_ERROR
+            elif time_limit and cpu_time > time_limit:
+                status = TERMINATION_TIMEOUT
+            elif wall_time_limit and time.time() - start_wall_time > wall_time_limit:
+                status = TERMINATION_TIMEOUT
+            elif memory_limit and memory > memory_limit:
+                status = TERMINATION_OUT_OF_MEMORY
+        wall_time = time.time() - start_wall_time
+        if status not in (TERMINATION_TIMEOUT, TERMINATION_OUT_OF_MEMORY):
+            # Reply may come before the kernel accounts the last CPU time, while the verifier is
+            # busy with the task until the reply, so its CPU time is at least the wall time.
+            session_cpu_time, session_memory = _get_session_stats(session_id)
+            cpu_time = max(cpu_time, session_cpu_time - start_cpu_time, wall_time)
+            memory = max(memory, session_memory - start_memory)
+
+        self.__tasks += 1
+        if status in (TERMINATION_ERROR, TERMINATION_TIMEOUT, TERMINATION_OUT_OF_MEMORY):
+            # State of the verifier is unknown after failure.
+            self.stop(force=True)
+        elif self.max_tasks and self.__tasks >= self.max_tasks:
+            self.stop()
+        return {
+            COLUMN_STATUS: status,
+            COLUMN_CPU_TIME: round(cpu_time, 3),
+            COLUMN_WALL_TIME: round(wall_time, 3),
+            COLUMN_MEMORY: memory
+        }
+
+    def stop(self, force=False):
+        """
+        Stop verifier process (it is started again for the next task).
+        """
+        if not self.__process:
+            return
+        process, self.__process = self.__process, None
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        if not force:
+            try:
+                process.wait(timeout=STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                force = True
+        if force:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            process.wait()
+        process.stdout.close()
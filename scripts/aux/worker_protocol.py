@@ -0,0 +1,187 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Protocol for solving verification tasks on worker hosts. Each message consists of a header (JSON)
+and a binary payload (tar archive with files), the size of both is sent before them.
+"""
+
+import io
+import json
+import os
+import socket
+import struct
+import tarfile
+
+# Address of a worker for Unix sockets is given as "unix:<socket file>", otherwise "<host>:<port>".
+UNIX_SOCKET_PREFIX = "unix:"
+
+MESSAGE_TYPE = "type"
+MESSAGE_TASK = "task"
+MESSAGE_RESULT = "result"
+MESSAGE_ERROR = "error"
+
+HEADER_BENCHMARK = "benchmark"
+HEADER_MODE = "mode"
+HEADER_MOVE_OUTPUT = "move output"
+HEADER_TOKEN = "token"
+HEADER_TASK_DIR = "task dir"
+HEADER_ERROR = "error"
+
+# Placeholders in benchmark, which are replaced by directories of the worker host.
+INSTALL_DIR_PATTERN = "<install dir>"
+TASK_DIR_PATTERN = "<task dir>"
+
+# Subdirectories of the task directory on the worker host.
+WORKER_CIL_DIR = "cil"
+WORKER_OUTPUT_DIR = "launch"
+
+# Maximum sizes of received messages (in bytes).
+MAX_HEADER_SIZE = 2 ** 24
+MAX_PAYLOAD_SIZE = 2 ** 34
+
+_SIZES = struct.Struct("!IQ")
+_BLOCK_SIZE = 2 ** 20
+
+
+def parse_address(address: str) -> tuple:
+    """
+    Returns socket family and address for the given worker address.
+    """
+    if address.startswith(UNIX_SOCKET_PREFIX):
+        return socket.AF_UNIX, address[len(UNIX_SOCKET_PREFIX):]
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Incorrect worker address '{address}', expected '<host>:<port>' or "
+                         f"'{UNIX_SOCKET_PREFIX}<socket file>'")
+    return socket.AF_INET, (host, int(port))
+
+
+def connect(address: str, timeout=None) -> socket.socket:
+    """
+    Connect to the worker with the given address.
+    :param timeout: timeout (in seconds) of the connection, None means no timeout.
+    """
+    family, sock_address = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(sock_address)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def send_message(sock: socket.socket, header: dict, payload: bytes = b"") -> None:
+    """
+    Send a message with the given header and payload.
+    """
+    header_data = json.dumps(header).encode("utf8")
+    sock.sendall(_SIZES.pack(len(header_data), len(payload)))
+    sock.sendall(header_data)
+    sock.sendall(payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        data = sock.recv(min(size - len(buffer), _BLOCK_SIZE))
+        if not data:
+            raise ConnectionError("Connection was closed before the whole message was received")
+        buffer.extend(data)
+    return bytes(buffer)
+
+
+def recv_header(sock: socket.socket, max_header_size: int = MAX_HEADER_SIZE) -> tuple:
+    """
+    Receive a header of a message, its payload should be received by recv_payload.
+    :return: header and size of payload.
+    """
+    header_size, payload_size = _SIZES.unpack(_recv_exactly(sock, _SIZES.size))
+    if header_size > max_header_size:
+        raise ValueError(f"Header of message is too large ({header_size} bytes)")
+    header = json.loads(_recv_exactly(sock, header_size).decode("utf8"))
+    if not isinstance(header, dict):
+        raise ValueError("Header of message is not a dictionary")
+    return header, payload_size
+
+
+def recv_payload(sock: socket.socket, payload_size: int,
+                 max_payload_size: int = MAX_PAYLOAD_SIZE) -> bytes:
+    """
+    Receive a payload of a message with the given size.
+    """
+    if payload_size > max_payload_size:
+        raise ValueError(f"Payload of message is too large ({payload_size} bytes)")
+    return _recv_exactly(sock, payload_size)
+
+
+def recv_message(sock: socket.socket) -> tuple:
+    """
+    Receive a message.
+    :return: header and payload.
+    """
+    header, payload_size = recv_header(sock)
+    return header, recv_payload(sock, payload_size)
+
+
+def pack_files(files: dict) -> bytes:
+    """
+    Create an archive with the given files or directories.
+    :param files: map of names in the archive to paths of files.
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, path in files.items():
+            archive.add(path, arcname=name)
+    return buffer.getvalue()
+
+
+def unpack_files(payload: bytes, directory: str) -> None:
+    """
+    Extract files from the given archive into the directory.
+    """
+    with tarfile.open(fileobj=io.BytesIO(payload), mode="r:gz") as archive:
+        for member in archive.getmembers():
+            path = os.path.normpath(member.name)
+            if os.path.isabs(path) or path.split(os.sep)[0] == os.pardir or \
+                    not (member.isfile() or member.isdir()):
+                raise ValueError(f"Unexpected file '{member.name}' in the received archive")
+        archive.extractall(directory)
+
+
+def replace_paths(directory: str, replacements: dict) -> None:
+    """
+    Replace paths, which were used on the worker host, in all files of the given directory.
+    :param replacements: map of the old paths to the new ones (in order of replacement).
+    """
+    replacements = {old.encode("utf8"): new.encode("utf8") for old, new in replacements.items()}
+    for root, _, files in os.walk(directory):
+        for name in files:
+            file = os.path.join(root, name)
+            with open(file, "rb") as file_obj:
+                content = file_obj.read()
+            new_content = content
+            for old, new in replacements.items():
+                new_content = new_content.replace(old, new)
+            if new_content != content:
+                with open(file, "wb") as file_obj:
+                    file_obj.write(new_content)
@@ -40,6 +40,7 @@ COMPONENT_MEA = "MEA"
 COMPONENT_QUALIFIER = "Qualifier"
 COMPONENT_BUILDER = "Builder"
 COMPONENT_COVERAGE = "Coverage"
+COMPONENT_WORKER = "Worker"
 
 # Properties description
 DEFAULT_PROPERTIES_DIR = "properties"
@@ -60,6 +61,7 @@ PROPERTY_IS_ALL_TRACES_FOUND = "is all traces found"
 
 # Main generator.
 DEFAULT_MAIN = "ldv_main_generated"
+DEFAULT_BATCH_MAIN = "ldv_batch_generated"
 
 TAG_DIRS = "dirs"
 TAG_DIRS_WORK = "work"
@@ -119,6 +121,9 @@ DEFAULT_CIL_FILE = "cil.i"
 DEFAULT_CIF_FILE = "empty.aspect"
 
 TERMINATION_SUCCESS = "SUCCESS"
+TERMINATION_TIMEOUT = "TIMEOUT"
+TERMINATION_OUT_OF_MEMORY = "OUT OF MEMORY"
+TERMINATION_ERROR = "ERROR"
 VERDICT_SAFE = "TRUE"
 VERDICT_UNSAFE = "FALSE"
 VERDICT_UNKNOWN = "UNKNOWN"
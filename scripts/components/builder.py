@@ -261,6 +261,8 @@ class Builder(Component):
                 identifier = cmd['id']
                 cmd['command'] = clade.get_cmd_raw(identifier)[0]
                 cmd['opts'] = clade.get_cmd_opts(identifier)
+                # Included files, which allow to track changes of headers in prepared CIL files.
+                cmd['deps'] = clade.get_cmd_deps(identifier)
             if self.make_target_dir:
                 os.chdir(self.source_dir)
             with open(build_commands_file, "w", encoding="utf8") as file_obj:
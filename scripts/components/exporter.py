@@ -21,6 +21,7 @@
 Component for extracting results into archive to be uploaded in the web-interface.
 """
 
+import io
 import multiprocessing
 import resource
 import subprocess
@@ -46,6 +47,17 @@ GLOBAL_COVERAGE_MAX = "max"
 GLOBAL_COVERAGE_REAL = "real"
 
 
+def _shift_number(value: str, offset: int) -> str:
+    # Shift the last number in identifier or file name (e.g., "/CPAchecker_3" or "unsafe_3.zip").
+    return re.sub(r'(\d+)(\.zip)?$', lambda res: f"{int(res.group(1)) + offset}{res.group(2) or ''}",
+                  value)
+
+
+def _get_number(value: str) -> int:
+    res = re.search(r'(\d+)(\.zip)?$', value)
+    return int(res.group(1)) if res else 0
+
+
 class Exporter(Component):
     """
     Component for extracting results into archive to be uploaded in the web-interface.
@@ -608,3 +620,204 @@ class Exporter(Component):
         if not self.debug:
             shutil.rmtree(export_dir, ignore_errors=True)
         self.logger.info("Exporting results has been completed")
+
+    @staticmethod
+    def __sum_resources(report: dict, other: dict):
+        # Shards are solved in parallel, so the maximal wall time is taken.
+        resources = report.setdefault('resources', {})
+        for name, value in other.get('resources', {}).items():
+            if name == "CPU time":
+                resources[name] = resources.get(name, 0) + value
+            else:
+                resources[name] = max(resources.get(name, 0), value)
+
+    @staticmethod
+    def __copy_archive(arch: zipfile.ZipFile, name: str, target: zipfile.ZipFile,
+                       written: set):
+        # Copy files from the nested archive, which were not written before.
+        if name not in arch.namelist():
+            return
+        with zipfile.ZipFile(io.BytesIO(arch.read(name))) as nested_arch:
+            for file in nested_arch.namelist():
+                if file not in written:
+                    target.writestr(file, nested_arch.read(file))
+                    written.add(file)
+
+    def merge(self, archives: list, archive_name: str):
+        """
+        Merge archives with results of several shards of the same configuration into a single
+        archive, which is equivalent to the archive of unsharded run.
+        """
+        if not os.path.exists(self.work_dir):
+            os.makedirs(self.work_dir, exist_ok=True)
+        export_dir = os.path.abspath(tempfile.mkdtemp(dir=self.work_dir))
+        archive_name = os.path.abspath(archive_name)
+        cur_dir = os.getcwd()
+        os.chdir(export_dir)
+
+        reports = []
+        root_element = None
+        components = {}
+        # Number of unsafes, unsafe-incomplete, initial and filtered traces for MEA component.
+        mea_stats = [0, 0, 0, 0]
+        # Coverage type -> (function coverage, line coverage, statistics).
+        global_coverage = {}
+        is_coverage_sources_written = False
+        # Kind of numbered reports (verifier launches, error traces or unknowns of a component)
+        # -> offset of their numbers in the current archive.
+        offsets = {}
+        next_offsets = {}
+
+        def shift(value: str, kind: str) -> str:
+            new_value = _shift_number(value, offsets.get(kind, 0))
+            next_offsets[kind] = max(next_offsets.get(kind, 0), _get_number(new_value) + 1)
+            return new_value
+
+        with zipfile.ZipFile(archive_name, mode='w', compression=zipfile.ZIP_DEFLATED) \
+                as final_zip:
+            with zipfile.ZipFile(DEFAULT_SOURCES_ARCH, mode='w',
+                                 compression=zipfile.ZIP_DEFLATED) as sources_zip, \
+                    zipfile.ZipFile(DEFAULT_COVERAGE_SOURCES_ARCH, mode='w',
+                                    compression=zipfile.ZIP_DEFLATED) as cov_sources_zip:
+                written_sources = set()
+                written_cov_sources = set()
+                for archive in archives:
+                    self.logger.info(f"Merging results from archive '{archive}'")
+                    # Old file name -> new file name in the merged archive.
+                    files = {}
+                    with zipfile.ZipFile(archive) as arch:
+                        for report in json.loads(arch.read("reports.json").
+                                                 decode('utf8', errors='ignore')):
+                            report_type = report.get('type')
+                            if report_type == "job coverage":
+                                for cov_type, cov_name in report.get("coverage", {}).items():
+                                    if cov_type in (COVERAGE_MERGE_TYPE_UNION,
+                                                    COVERAGE_MERGE_TYPE_INTERSECTION):
+                                        # Those are recalculated based on coverage of rules.
+                                        continue
+                                    with zipfile.ZipFile(io.BytesIO(arch.read(cov_name))) \
+                                            as cov_arch:
+                                        data = json.loads(cov_arch.read(DEFAULT_COVERAGE_FILE).
+                                                          decode('utf8', errors='ignore'))
+                                    extract_internal_coverage(data, *global_coverage.setdefault(
+                                        cov_type, ({}, {}, {})))
+                            elif report_type == "component" and report['id'] == "/":
+                                if root_element:
+                                    self.__sum_resources(root_element, report)
+                                else:
+                                    root_element = report
+                            elif report_type == "component":
+                                if report['name'] == COMPONENT_MEA:
+                                    attrs = {attr['name']: attr['value']
+                                             for attr in report.get('attrs', [])}
+                                    unsafes = int(attrs.get("Unsafes", 0))
+                                    mea_stats[0] += unsafes
+                                    mea_stats[1] += round(float(attrs.get(
+                                        "Unsafe-incomplete", "0%").rstrip("%")) * unsafes / 100)
+                                    mea_stats[2] += int(attrs.get("Initial traces", 0))
+                                    mea_stats[3] += int(attrs.get("Filtered traces", 0))
+                                if report['id'] in components:
+                                    self.__sum_resources(components[report['id']], report)
+                                    continue
+                                components[report['id']] = report
+                                reports.append(report)
+                            elif report_type == "verification":
+                                report['id'] = shift(report['id'], "verifier")
+                                if 'coverage' in report:
+                                    files[report['coverage']] = \
+                                        shift(report['coverage'], "verifier")
+                                    report['coverage'] = files[report['coverage']]
+                                if 'coverage sources' in report:
+                                    if is_coverage_sources_written:
+                                        del report['coverage sources']
+                                    is_coverage_sources_written = True
+                                reports.append(report)
+                            elif report_type == "unsafe":
+                                report['id'] = shift(report['id'], "trace")
+                                report['parent id'] = shift(report['parent id'], "verifier")
+                                traces = []
+                                for trace in report.get('error traces', []):
+                                    files[trace] = shift(trace, "trace")
+                                    traces.append(files[trace])
+                                report['error traces'] = traces
+                                reports.append(report)
+                            else:
+                                res = re.search(r'^(.+)/unknown/\d+$', report['id'])
+                                if res:
+                                    # Unknown of some component.
+                                    kind = res.group(1)
+                                    report['id'] = shift(report['id'], kind)
+                                else:
+                                    kind = "verifier"
+                                    report['id'] = shift(report['id'], kind)
+                                    report['parent id'] = shift(report['parent id'], kind)
+                                if 'problem desc' in report:
+                                    old_name = report['problem desc']
+                                    files[old_name] = report['problem desc'] = \
+                                        shift(old_name, kind)
+                                if 'proof' in report:
+                                    old_name = report['proof']
+                                    files[old_name] = report['proof'] = shift(old_name, "trace")
+                                reports.append(report)
+                        names = set(arch.namelist())
+                        for old_name, new_name in files.items():
+                            if old_name in names:
+                                final_zip.writestr(new_name, arch.read(old_name))
+                        self.__copy_archive(arch, DEFAULT_SOURCES_ARCH, sources_zip,
+                                            written_sources)
+                        self.__copy_archive(arch, DEFAULT_COVERAGE_SOURCES_ARCH,
+                                            cov_sources_zip, written_cov_sources)
+                    offsets = dict(next_offsets)
+            final_zip.write(DEFAULT_SOURCES_ARCH)
+            os.remove(DEFAULT_SOURCES_ARCH)
+            final_zip.write(DEFAULT_COVERAGE_SOURCES_ARCH)
+            os.remove(DEFAULT_COVERAGE_SOURCES_ARCH)
+
+            for report in reports:
+                if report.get("type") == "component" and report.get("name") == COMPONENT_MEA:
+                    percent_of_unsafe_incomplete = 0
+                    if mea_stats[0]:
+                        percent_of_unsafe_incomplete = round(100 * mea_stats[1] / mea_stats[0], 2)
+                    merged_attrs = [
+                        self.__format_attr("Unsafes", str(mea_stats[0])),
+                        self.__format_attr("Unsafe-incomplete", f"{percent_of_unsafe_incomplete}%"),
+                        self.__format_attr("Initial traces", str(mea_stats[2])),
+                        self.__format_attr("Filtered traces", str(mea_stats[3]))
+                    ]
+                    names = {attr['name'] for attr in merged_attrs}
+                    report['attrs'] = [attr for attr in report.get('attrs', [])
+                                       if attr['name'] not in names] + merged_attrs
+
+            counter = 0
+            coverage_by_rule = {
+                COVERAGE_MERGE_TYPE_UNION: ({}, {}, {}),
+                COVERAGE_MERGE_TYPE_INTERSECTION: ({}, {}, {})
+            }
+            for cov_type, (function_coverage, line_coverage, stats) in global_coverage.items():
+                if cov_type != GLOBAL_COVERAGE_MAX:
+                    for merge_type, results in coverage_by_rule.items():
+                        if not results[2]:
+                            results[2].update(stats)
+                        merge_coverages(function_coverage, results[0], line_coverage, results[1],
+                                        merge_type)
+                self.__print_coverage(final_zip, counter, function_coverage, line_coverage, stats,
+                                      cov_type)
+                counter += 1
+            for merge_type, results in coverage_by_rule.items():
+                self.__print_coverage(final_zip, counter, results[0], results[1], results[2],
+                                      merge_type)
+                counter += 1
+
+            if root_element:
+                reports.append(root_element)
+            if self.global_coverage_element:
+                reports.append(self.global_coverage_element)
+            with open(FINAL_REPORT, 'w', encoding='utf8') as f_results:
+                json.dump(reports, f_results, ensure_ascii=False, sort_keys=True, indent="\t")
+            final_zip.write(FINAL_REPORT, arcname="reports.json")
+            os.remove(FINAL_REPORT)
+
+        os.chdir(cur_dir)
+        if not self.debug:
+            shutil.rmtree(export_dir, ignore_errors=True)
+        self.logger.info(f"Merged results of {len(archives)} archives into '{archive_name}'")
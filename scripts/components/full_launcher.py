@@ -22,20 +22,47 @@
 Main component for CV benchmark launches.
 """
 
+import collections
+import copy
+import itertools
 import resource
-from collections import deque
-from time import sleep
+import shlex
+import zlib
 from xml.dom import minidom
 
 from aux.common import *
+from aux.log_tailer import LogTailer
+from aux.scheduling import PressureGovernor, ResourcePool, SharedResourcePool, TaskQueue, \
+    WorkerPool
+from aux.warm_verifier import WarmVerifier
+from aux.worker_protocol import HEADER_BENCHMARK, HEADER_ERROR, HEADER_MODE, \
+    HEADER_MOVE_OUTPUT, HEADER_TASK_DIR, HEADER_TOKEN, INSTALL_DIR_PATTERN, MESSAGE_RESULT, \
+    MESSAGE_TASK, MESSAGE_TYPE, TASK_DIR_PATTERN, WORKER_CIL_DIR, WORKER_OUTPUT_DIR, connect, \
+    pack_files, parse_address, recv_message, replace_paths, send_message, unpack_files
 from components.builder import Builder
 from components.exporter import Exporter
 from components.launcher import *
-from components.main_generator import MainGenerator
+from components.main_generator import MainGenerator, PARTIAL_EXT_ALLOCATION_STRATEGY, \
+    PARTIAL_STRATEGY
+from components.mea import TAG_PARALLEL_PROCESSES
 from components.preparator import Preparator
 from components.qualifier import Qualifier
+from models.cil_manifest import CilManifest
+from models.cost_history import CostHistory
+from models.progress import COUNTER_FAILED, COUNTER_FINISHED, COUNTER_QUEUED, COUNTER_RUNNING, \
+    COUNTER_TOTAL, STAGE_COVERAGE, STAGE_FILTERING, STAGE_PREPARATION, STAGE_VERIFICATION, \
+    Progress
+from models.result_journal import ResultJournal
+from models.verdict_cache import VerdictCache
 from models.verification_result import *
 
+# Resource requirements (memory, cores) of a single preparation, processing or filtering job.
+SINGLE_CORE_NEED = (0, 1)
+
+# Priority classes of launches: entry points, which are affected by the checked changes, go first.
+PRIORITY_AFFECTED = 0
+PRIORITY_OTHER = 1
+
 
 class FullLauncher(Launcher):
     """
@@ -43,11 +70,24 @@ class FullLauncher(Launcher):
     launches them and processes results.
     """
 
-    def __init__(self, config_file):
+    def __init__(self, config_file, shard: tuple = None):
+        # (index, number of shards), if only a part of verification tasks should be solved.
+        self.shard = shard
         super().__init__(COMPONENT_LAUNCHER, config_file)
 
         if not self.scheduler or self.scheduler not in SCHEDULERS:
             sys.exit(f"Scheduler '{self.scheduler}' is not known. Choose from {SCHEDULERS}")
+        # Worker address -> maximum number of its parallel launches.
+        self.worker_hosts = {}
+        if self.scheduler == SCHEDULER_WORKERS:
+            self.worker_hosts = self.config.get(TAG_WORKERS, {}).get(TAG_WORKERS_HOSTS, {})
+            if not self.worker_hosts:
+                sys.exit("No worker hosts were specified for workers scheduler")
+            for address in self.worker_hosts:
+                try:
+                    parse_address(address)
+                except ValueError as exception:
+                    sys.exit(str(exception))
 
         self.entrypoints_dir = os.path.join(self.root_dir, DEFAULT_ENTRYPOINTS_DIR)
         self.models_dir = os.path.join(self.root_dir, DEFAULT_PROPERTIES_DIR, DEFAULT_MODELS_DIR)
@@ -66,88 +106,234 @@ class FullLauncher(Launcher):
         self.properties_desc = PropertiesDescription(plugin_properties_desc_file)
         self.is_cgroup_v2 = "cgroup2" in self.command_caller_with_output(
             "mount | grep '^cgroup' | awk '{print $1}' | uniq")
-        self.mea_input_queue = multiprocessing.Queue()
+        # Launcher changes working directory, so the same file should be loaded and saved.
+        self.cost_history = CostHistory(os.path.abspath(self.component_config.get(
+            TAG_COST_HISTORY, os.path.join(self.results_dir, DEFAULT_COST_HISTORY_FILE))))
+        verdict_cache_dir = self.component_config.get(TAG_VERDICT_CACHE)
+        if verdict_cache_dir:
+            self.verdict_cache = VerdictCache(os.path.join(self.root_dir, verdict_cache_dir))
+        else:
+            self.verdict_cache = None
         self.build_results = None
+        self.worker_pool = None
+        self.mea_memory_usage = 0
+        self.mea_wall_time = 0.0
+        self.progress = Progress(
+            os.path.abspath(self.component_config.get(
+                TAG_PROGRESS_FILE, os.path.join(self.work_dir, DEFAULT_PROGRESS_FILE))),
+            self.component_config.get(TAG_PROGRESS_INTERVAL, DEFAULT_PROGRESS_INTERVAL))
+        # Warm verifier processes are used for short local launches.
+        self.warm_config = self.component_config.get(TAG_WARM_VERIFIER, {})
+        if self.warm_config:
+            if not self.warm_config.get(TAG_WARM_COMMAND):
+                sys.exit("Command for warm verifier was not specified")
+            command = shlex.split(self.warm_config[TAG_WARM_COMMAND])
+            if os.path.exists(os.path.join(self.root_dir, command[0])):
+                command[0] = os.path.join(self.root_dir, command[0])
+            self.warm_config[TAG_WARM_COMMAND] = shlex.join(command)
+        # Maximum number of launches, which are submitted to cloud by a single benchmark.
+        self.cloud_group_size = self.config.get(TAG_CLOUD, {}).get(TAG_CLOUD_GROUP_SIZE, 0)
+        # Cheap entry points of the same CIL file can be checked by a single launch.
+        self.batching_config = self.component_config.get(TAG_ENTRYPOINT_BATCHING, {})
+        # (subsystem, rule) -> batch entry point -> its entry points.
+        self.__batch_entrypoints = {}
+        # Key of a batch launch -> launches of its entry points.
+        self.__batch_launches = {}
+        self.cil_manifest = None
+        # Verifier mode -> warm verifier process of the current worker process.
+        self.__warm_verifiers = {}
+        # Entry points, which are affected by the checked commits or specified as callers.
+        self.affected_functions = set()
+        # Property -> increasing CPU time limits, with which its launches are solved.
+        self.__time_limits = {}
+        # Launch key -> (launch, level of its current CPU time limit).
+        self.__escalation = {}
+        # Future of a remote launch -> (launch, resource requirements, worker address).
+        self.__remote_launches = {}
+        # Worker address -> launches, which have failed on other workers.
+        self.__retry_queues = {}
+        # Launch key -> addresses of workers, which have failed to solve it.
+        self.__failed_hosts = {}
+        # Backup copy of a previous version -> keys of its results, which were not restored yet.
+        self.__legacy_backups = {}
+
+    def perform_filtering(self, result: VerificationResults) -> VerificationResults:
+        """
+        Filter error traces of the verification result (in a worker process).
+        """
+        # Filtering job leases a single core, so MEA must not start its own processes in it.
+        mea_config = self.config.setdefault(COMPONENT_MEA, {})
+        mea_config[TAG_PARALLEL_PROCESSES] = 1
+        mea_config.get(result.rule, {}).pop(TAG_PARALLEL_PROCESSES, None)
+        result.filter_traces(result.work_dir, self.install_dir, self.result_dir_et)
+        return result
 
-    def __perform_filtering(self, result: VerificationResults, queue: multiprocessing.Queue,
-                            resource_queue_filter: multiprocessing.Queue):
-        wall_time_start = time.time()
-        launch_directory = result.work_dir
-        result.filter_traces(launch_directory, self.install_dir, self.result_dir_et)
-        queue.put(result)
-        resource_queue_filter.put({TAG_MEMORY_USAGE: result.mea_resources.get(TAG_MEMORY_USAGE, 0),
-                                   TAG_WALL_TIME: time.time() - wall_time_start})
-        sys.exit(0)
-
-    def __count_filter_resources(self, resource_queue_filter):
-        if not resource_queue_filter.empty():
+    def __count_filter_resources(self, filtered: list):
+        if filtered:
             iteration_max_memory = 0
             iteration_wall_time = 0.0
-            while not resource_queue_filter.empty():
-                resources = resource_queue_filter.get()
-                # Those processes were running in parallel.
-                iteration_max_memory += resources.get(TAG_MEMORY_USAGE, 0)
-                iteration_wall_time = max(iteration_wall_time, resources.get(TAG_WALL_TIME, 0.0))
+            for result in filtered:
+                # Those jobs were running in parallel.
+                iteration_max_memory += result.mea_resources.get(TAG_MEMORY_USAGE, 0)
+                iteration_wall_time = max(iteration_wall_time,
+                                          result.mea_resources.get(TAG_WALL_TIME, 0.0))
             self.mea_memory_usage = max(self.mea_memory_usage, iteration_max_memory)
             self.mea_wall_time += iteration_wall_time
 
-    def __filter_scheduler(self, number_of_processes, output_queue: multiprocessing.Queue):
-        process_pool = []
-        cpu_start = time.process_time()
-        for i in range(number_of_processes):
-            process_pool.append(None)
-        self.logger.debug(f"Starting scheduler for filtering with {number_of_processes} processes")
-        resource_queue_filter = multiprocessing.Queue()
-        self.mea_memory_usage = 0
-        self.mea_wall_time = 0.0
-        try:
-            while True:
-                for i in range(number_of_processes):
-                    if process_pool[i] and not process_pool[i].is_alive():
-                        process_pool[i].join()
-                        process_pool[i] = None
-                    if not process_pool[i]:
-                        if not self.mea_input_queue.empty():
-                            result = self.mea_input_queue.get()
-                        else:
-                            continue
-                        if not result:
-                            raise NestedLoop
-                        self.logger.info(
-                            f"Scheduling new filtering process: subsystem '{result.id}', "
-                            f"rule '{result.rule}', entrypoint '{result.entrypoint}'")
-                        process_pool[i] = multiprocessing.Process(
-                            target=self.__perform_filtering, name=f"MEA_{i}",
-                            args=(result, output_queue, resource_queue_filter))
-                        if self.debug:
-                            load = 0
-                            for process in process_pool:
-                                if process:
-                                    load += 1
-                            self.logger.debug(f"Scheduler for filtering load is "
-                                              f"{round(100 * load / number_of_processes, 2)}%")
-
-                        process_pool[i].start()
-                sleep(BUSY_WAITING_INTERVAL * 10)
-                self.__count_filter_resources(resource_queue_filter)
-        except NestedLoop:
-            wait_for_launches(process_pool)
-            self.__count_filter_resources(resource_queue_filter)
-        except Exception as exception:
-            self.logger.error(f"Process for filtering results was terminated: {exception}",
-                              exc_info=True)
-            kill_launches(process_pool)
-        self.logger.info("Stopping filtering scheduler")
-        cpu_time = time.process_time() - cpu_start
-        self.logger.debug(f"Filtering took {cpu_time} seconds of overheads")
-        scheduler_memory_usage = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
-        # There is main thread and children processes.
-        self.mea_memory_usage += scheduler_memory_usage
-        self.logger.debug(f"Filtering maximum memory usage: {self.mea_memory_usage}B")
-        self.mea_input_queue.put({TAG_MEMORY_USAGE: self.mea_memory_usage,
-                                  TAG_CPU_TIME: cpu_time,
-                                  TAG_WALL_TIME: self.mea_wall_time})
-        sys.exit(0)
+    def __submit_jobs(self, task_queue: TaskQueue, resource_pool: ResourcePool, method,
+                      stage: str, running: dict):
+        task = task_queue.pop(resource_pool)
+        while task:
+            result, need = task
+            resource_pool.acquire(need)
+            self.logger.info(f"Scheduling new job '{method.__name__}': subsystem '{result.id}', "
+                             f"rule '{result.rule}', entrypoint '{result.entrypoint}'")
+            running[self.worker_pool.submit(method, result)] = \
+                (resource_pool, need, method, stage, 1)
+            self.progress.add(stage, COUNTER_RUNNING)
+            task = task_queue.pop(resource_pool)
+
+    def __requeue_remote_launch(self, launch: VerificationTask, need: tuple, address: str,
+                                exception: Exception) -> bool:
+        """
+        Put the launch, which has failed because of connection to the worker, into the queue of
+        another worker.
+        :return: False if all workers have already failed to solve this launch.
+        """
+        failed_hosts = self.__failed_hosts.setdefault(ResultJournal.get_key(launch), set())
+        failed_hosts.add(address)
+        hosts = [host for host in self.__retry_queues if host not in failed_hosts]
+        if not hosts:
+            return False
+        host = min(hosts, key=lambda host: len(self.__retry_queues[host]))
+        self.logger.warning(f"{exception}, launch for subsystem '{launch.entry_desc.id}', rule "
+                            f"'{launch.rule}', entrypoint '{launch.entrypoint}' will be solved "
+                            f"on worker {host}")
+        self.__retry_queues[host].push([launch], need)
+        return True
+
+    def __pop_launches(self, task_queue: TaskQueue, host_pool: ResourcePool, address: str):
+        # Launches, which have failed on other workers, are solved first.
+        retry_queue = self.__retry_queues.get(address)
+        if retry_queue:
+            task = retry_queue.pop(host_pool)
+            if task:
+                return task
+        return task_queue.pop(host_pool)
+
+    def __process_completed_jobs(self, running: dict, results: list,
+                                 filter_queue: TaskQueue) -> list:
+        """
+        Process results of completed jobs.
+        :return: launches, which reached intermediate CPU time limit and should be solved again.
+        """
+        # Verification results with several error traces are filtered by MEA in another job.
+        filtered = []
+        relaunches = []
+        for future in self.worker_pool.get_completed():
+            if future not in running:
+                continue
+            resource_pool, need, method, stage, tasks_number = running.pop(future)
+            resource_pool.release(need)
+            remote_launch = self.__remote_launches.pop(future, None)
+            self.progress.add(stage, COUNTER_RUNNING, -tasks_number)
+            try:
+                job_results = future.result()
+            except ConnectionError as exception:
+                if remote_launch and self.__requeue_remote_launch(*remote_launch, exception):
+                    continue
+                self.logger.error(f"Job '{method.__name__}' has failed: {exception}")
+                self.progress.add(stage, COUNTER_FAILED, tasks_number)
+                continue
+            except (Exception, SystemExit) as exception:
+                self.logger.error(f"Job '{method.__name__}' has failed: {exception}",
+                                  exc_info=True)
+                self.progress.add(stage, COUNTER_FAILED, tasks_number)
+                continue
+            self.progress.add(stage, COUNTER_FINISHED, tasks_number)
+            if not isinstance(job_results, list):
+                job_results = [job_results]
+            if stage != STAGE_FILTERING:
+                job_results = self.__split_batch_results(job_results, relaunches)
+            for result in job_results:
+                if stage == STAGE_FILTERING:
+                    filtered.append(result)
+                elif self.__is_escalated(result, relaunches):
+                    continue
+                elif result.initial_traces > 1:
+                    filter_queue.push(result, SINGLE_CORE_NEED)
+                    continue
+                if self.verdict_cache:
+                    self.verdict_cache.store(result)
+                self._add_result(result, results)
+        self.__count_filter_resources(filtered)
+        return relaunches
+
+    def __split_batch_results(self, job_results: list, relaunches: list) -> list:
+        """
+        Replace results of batch launches with results of their entry points. If a batch was not
+        proved safe, its entry points are added to the given list to be solved separately.
+        """
+        split_results = []
+        for result in job_results:
+            key = ResultJournal.get_key(result)
+            if key not in self.__batch_launches:
+                split_results.append(result)
+                continue
+            launches = self.__batch_launches.pop(key)
+            self.__escalation.pop(key, None)
+            if result.verdict == VERDICT_SAFE:
+                # Each entry point is safe, since the batch calls any of them.
+                for launch in launches:
+                    launch_result = copy.copy(result)
+                    launch_result.entrypoint = launch.entrypoint
+                    launch_result.cpu = result.cpu / len(launches)
+                    launch_result.wall = result.wall / len(launches)
+                    split_results.append(launch_result)
+                continue
+            self.logger.info(f"Batch of {len(launches)} entry points for subsystem '{result.id}', "
+                             f"rule '{result.rule}' was not proved safe ({result.verdict}), they "
+                             f"will be solved separately")
+            for launch in launches:
+                if len(self.__time_limits[launch.rule]) > 1:
+                    self.__escalation[ResultJournal.get_key(launch)] = (launch, 0)
+                relaunches.append(launch)
+        return split_results
+
+    @staticmethod
+    def __get_time_limits(time_limit, time_limit_steps: list) -> list:
+        """
+        Get increasing CPU time limits, the last of them is the given time limit.
+        """
+        return sorted(step for step in set(time_limit_steps)
+                      if step > 0 and (step < time_limit or time_limit <= 0)) + [time_limit]
+
+    def __get_level(self, launch: VerificationTask) -> int:
+        # Launches, which are not escalated, are solved with the last time limit.
+        return self.__escalation.get(ResultJournal.get_key(launch), (None, -1))[1]
+
+    def __is_escalated(self, result: VerificationResults, relaunches: list) -> bool:
+        """
+        Check if the launch has reached intermediate CPU time limit. In this case it is added to
+        the given list to be solved again with the next time limit.
+        """
+        key = ResultJournal.get_key(result)
+        if key not in self.__escalation:
+            return False
+        launch, level = self.__escalation.pop(key)
+        if result.verdict != VERDICT_UNKNOWN or \
+                not result.termination_reason.startswith(TERMINATION_TIMEOUT):
+            return False
+        time_limits = self.__time_limits[launch.rule]
+        level += 1
+        if level < len(time_limits) - 1:
+            self.__escalation[key] = (launch, level)
+        self.logger.info(f"Launch for subsystem '{result.id}', rule '{result.rule}', entrypoint "
+                         f"'{result.entrypoint}' has reached CPU time limit "
+                         f"{time_limits[level - 1]}s, it will be solved again with "
+                         f"{time_limits[level]}s")
+        relaunches.append(launch)
+        return True
 
     def __create_benchmark(self, launch: VerificationTask, benchmark):
         # Create temp launch directory.
@@ -175,23 +361,28 @@ class FullLauncher(Launcher):
 
         return launch_directory, benchmark_name
 
-    def __process_single_launch_results(self, result, launch_directory, queue):
-        result.parse_output_dir(launch_directory, self.install_dir, self.result_dir_et)
-        self._process_coverage(result, launch_directory, self.build_results.keys())
-        if result.initial_traces > 1:
-            self.mea_input_queue.put(result)
-        else:
-            queue.put(result)
-        sys.exit(0)
+    def process_launch_results(self, result: VerificationResults,
+                               columns=None) -> VerificationResults:
+        """
+        Parse verifier output and compute coverage for the given result (in a worker process).
+        """
+        launch_directory = result.work_dir
+        result.parse_output_dir(launch_directory, self.install_dir, self.result_dir_et, columns)
+        self._process_coverage(result, launch_directory, self.build_results.keys(),
+                               separate_process=False)
+        return result
 
-    def local_launch(self, launch: VerificationTask, benchmark, queue):
+    def local_launch(self, launch: VerificationTask, benchmark) -> VerificationResults:
         """
-        Solve verification task locally in a separated process.
+        Solve verification task locally (in a worker process).
         """
+        if self.__is_warm_launch(launch):
+            return self.__warm_launch(launch, benchmark)
         (launch_directory, benchmark_name) = self.__create_benchmark(launch, benchmark)
 
-        # Add verifier location to PATH.
-        os.environ["PATH"] += os.pathsep + launch.path_to_verifier
+        # Add verifier location to PATH (worker processes are reused for many launches).
+        if launch.path_to_verifier not in os.environ["PATH"].split(os.pathsep):
+            os.environ["PATH"] += os.pathsep + launch.path_to_verifier
 
         # Create empty result.
         result = VerificationResults(launch, self.config)
@@ -224,9 +415,213 @@ class FullLauncher(Launcher):
             if not self.debug:
                 os.remove(benchmark_name)
 
-        self.__process_single_launch_results(result, launch_directory, queue)
+        return self.process_launch_results(result)
+
+    def __is_warm_launch(self, launch: VerificationTask) -> bool:
+        if not self.warm_config or self.scheduler != SCHEDULER_LOCAL:
+            return False
+        # Verifiers with hardcoded output directory and properties, which require isolation,
+        # are always solved by BenchExec.
+        if self.properties_desc.get_property_arg(launch.rule, PROPERTY_IS_MOVE_OUTPUT) or \
+                launch.rule in self.warm_config.get(TAG_WARM_ISOLATED, []):
+            return False
+        max_time = self.warm_config.get(TAG_WARM_MAX_TIME, 0)
+        return not max_time or self.__get_expected_cpu_time(launch) <= max_time
+
+    def __warm_launch(self, launch: VerificationTask, benchmark) -> VerificationResults:
+        """
+        Solve verification task by a warm verifier process of the current worker process.
+        Resource limits are taken from the benchmark, and results are processed in the same way
+        as BenchExec results.
+        """
+        launch_directory = os.path.abspath(tempfile.mkdtemp(dir=DEFAULT_LAUNCHES_DIR))
+        self.__resolve_property_file(benchmark, launch)
+        args = []
+        for option in benchmark.findall("./option") + benchmark.findall("./rundefinition/option"):
+            args.append(option.attrib["name"])
+            if option.text:
+                args.append(option.text)
+        args.extend(["-setprop", f"output.path={launch_directory}",
+                     "-entryfunction", launch.entrypoint])
+        if not launch.entry_desc.optimize:
+            for option in VERIFIER_OPTIONS_NOT_OPTIMIZED:
+                args.extend(["-setprop", option])
+        args.append(launch.cil_file)
+
+        time_limit = float(benchmark.attrib.get("timelimit", 0))
+        # Verifier may hang without spending CPU time.
+        wall_time_limit = float(benchmark.attrib.get("walltimelimit", 0)) or \
+            time_limit * self.warm_config.get(TAG_WARM_WALL_TIME_FACTOR,
+                                              DEFAULT_WARM_WALL_TIME_FACTOR)
+        resource_limits = self.component_config.get(TAG_RESOURCE_LIMITATIONS, {})
+        _, memory_limit, _ = self.__get_property_limits(
+            launch.rule, 0, resource_limits.get(TAG_LIMIT_MEMORY, 0), 0)
+
+        warm_verifier = self.__warm_verifiers.get(launch.mode)
+        if not warm_verifier:
+            env = dict(os.environ)
+            env["PATH"] = os.pathsep.join([env.get("PATH", ""), launch.path_to_verifier])
+            warm_verifier = WarmVerifier(self.warm_config[TAG_WARM_COMMAND],
+                                         self.warm_config.get(TAG_WARM_MAX_TASKS,
+                                                              DEFAULT_WARM_MAX_TASKS), env)
+            self.__warm_verifiers[launch.mode] = warm_verifier
+        columns = warm_verifier.solve(args, os.path.join(launch_directory, LOG_FILE), time_limit,
+                                      int(memory_limit * 1000 ** 3), wall_time_limit)
+
+        result = VerificationResults(launch, self.config)
+        result.work_dir = launch_directory
+        return self.process_launch_results(result, [
+            ElementTree.Element("column", {"title": title, "value": str(value)})
+            for title, value in columns.items()])
+
+    def remote_launch(self, launch: VerificationTask, benchmark,
+                      address: str) -> VerificationResults:
+        """
+        Solve verification task on the worker host with the given address (in a worker process).
+        CIL file and automata are sent to the worker, while paths in the received output are
+        replaced back to the local ones.
+        """
+        launch_directory = os.path.abspath(tempfile.mkdtemp(dir=DEFAULT_LAUNCHES_DIR))
+        cil_file = os.path.join(WORKER_CIL_DIR, os.path.basename(launch.cil_file))
+
+        # Add specific options, paths are resolved on the worker host.
+        self.__resolve_property_file(benchmark, launch)
+        ElementTree.SubElement(benchmark.find("rundefinition"), "option", {"name": "-setprop"}). \
+            text = f"output.path={TASK_DIR_PATTERN}/{WORKER_OUTPUT_DIR}"
+        ElementTree.SubElement(benchmark.find("rundefinition"), "option",
+                               {"name": "-entryfunction"}).text = launch.entrypoint
+        ElementTree.SubElement(ElementTree.SubElement(benchmark, "tasks"), "include").text = \
+            f"{TASK_DIR_PATTERN}/{cil_file}"
+        if not launch.entry_desc.optimize:
+            for option in VERIFIER_OPTIONS_NOT_OPTIMIZED:
+                ElementTree.SubElement(benchmark.find("rundefinition"), "option",
+                                       {"name": "-setprop"}).text = option
+        benchmark_text = minidom.parseString(ElementTree.tostring(benchmark)).\
+            toprettyxml(indent="\t").replace(self.install_dir, INSTALL_DIR_PATTERN)
+
+        files = {cil_file: launch.cil_file, DEFAULT_AUTOMATA_DIR: DEFAULT_AUTOMATA_DIR}
+        header = {
+            MESSAGE_TYPE: MESSAGE_TASK,
+            HEADER_BENCHMARK: benchmark_text,
+            HEADER_MODE: launch.mode,
+            HEADER_MOVE_OUTPUT: bool(self.properties_desc.get_property_arg(
+                launch.rule, PROPERTY_IS_MOVE_OUTPUT)),
+            HEADER_TOKEN: self.config.get(TAG_WORKERS, {}).get(TAG_WORKERS_TOKEN, "")
+        }
+        # Worker replies only after the launch, which is limited by CPU time limit.
+        timeout = self.config.get(TAG_WORKERS, {}).get(TAG_WORKERS_TIMEOUT, DEFAULT_WORKERS_TIMEOUT)
+        time_limit = float(benchmark.attrib.get("timelimit", 0))
+        try:
+            with connect(address, timeout) as sock:
+                send_message(sock, header, pack_files(files))
+                sock.settimeout(time_limit + timeout if time_limit > 0 else None)
+                header, payload = recv_message(sock)
+        except (OSError, ValueError) as exception:
+            raise ConnectionError(f"Connection to worker {address} has failed: "
+                                  f"{exception}") from exception
+        if header.get(MESSAGE_TYPE) != MESSAGE_RESULT:
+            raise RuntimeError(f"Worker {address} has failed to solve verification task: "
+                               f"{header.get(HEADER_ERROR)}")
+        unpack_files(payload, launch_directory)
+        task_dir = header[HEADER_TASK_DIR]
+        replace_paths(launch_directory, {
+            os.path.join(task_dir, cil_file): launch.cil_file,
+            os.path.join(task_dir, WORKER_OUTPUT_DIR): launch_directory,
+            task_dir: launch_directory
+        })
+
+        result = VerificationResults(launch, self.config)
+        result.work_dir = launch_directory
+        return self.process_launch_results(result)
 
-    def __prepare_sources(self, sources_queue: multiprocessing.Queue):
+    def local_batch_launch(self, launches: list, benchmark, threads: int) -> list:
+        """
+        Solve several verification tasks with the same property by a single BenchExec invocation
+        (in a worker process). Results of each run are processed as soon as it is completed.
+        """
+        batch_directory = os.path.abspath(tempfile.mkdtemp(dir=DEFAULT_LAUNCHES_DIR))
+        tasks_directory = os.path.join(batch_directory, "tasks")
+        os.makedirs(tasks_directory)
+
+        # Each run requires its own task file, otherwise BenchExec mixes up their outputs.
+        self.__resolve_property_file(benchmark, launches[0])
+        results = {}
+        for launch in launches:
+            task_name = f"{launch.entrypoint}_{os.path.basename(launch.cil_file)}"
+            task_file = os.path.join(tasks_directory, task_name)
+            os.symlink(launch.cil_file, task_file)
+            launch_directory = os.path.join(batch_directory, task_name + ".output")
+            os.makedirs(launch_directory)
+            tasks = ElementTree.SubElement(benchmark, "tasks", {"name": task_name})
+            ElementTree.SubElement(tasks, "include").text = task_file
+            ElementTree.SubElement(tasks, "option", {"name": "-setprop"}).text = \
+                f"output.path={launch_directory}"
+            ElementTree.SubElement(tasks, "option", {"name": "-entryfunction"}).text = \
+                launch.entrypoint
+            if not launch.entry_desc.optimize:
+                for option in VERIFIER_OPTIONS_NOT_OPTIMIZED:
+                    ElementTree.SubElement(tasks, "option", {"name": "-setprop"}).text = option
+            result = VerificationResults(launch, self.config)
+            result.work_dir = launch_directory
+            results[task_name] = result
+
+        benchmark_name = os.path.join(batch_directory, "benchmark_batch.xml")
+        with open(benchmark_name, "w", encoding="ascii") as file_obj:
+            file_obj.write(minidom.parseString(ElementTree.tostring(benchmark)).
+                           toprettyxml(indent="\t"))
+
+        # Add verifier location to PATH (worker processes are reused for many launches).
+        if launches[0].path_to_verifier not in os.environ["PATH"].split(os.pathsep):
+            os.environ["PATH"] += os.pathsep + launches[0].path_to_verifier
+
+        # Verifier launch, BenchExec prints a line for each completed run.
+        processed = []
+        with subprocess.Popen(f"benchexec --no-compress-results {self.benchexec_options} "
+                              f"--numOfThreads {threads} -o {batch_directory} {benchmark_name} "
+                              f"{self.benchmark_args}", shell=True, stdout=subprocess.PIPE,
+                              stderr=self.output_desc, universal_newlines=True) as process:
+            for line in process.stdout:
+                if any(task_name in line for task_name in results):
+                    processed.extend(self.__process_batch_results(batch_directory, results))
+        if process.returncode:
+            # Already completed runs are still valid.
+            self.logger.error(f"BenchExec has failed with exit code {process.returncode} for "
+                              f"batch {batch_directory}")
+        processed.extend(self.__process_batch_results(batch_directory, results,
+                                                      is_final=not process.returncode))
+        for task_name, result in results.items():
+            self.logger.error(f"There is no result for run {task_name} in {batch_directory}")
+            result.verdict = VERDICT_UNKNOWN
+            result.termination_reason = TERMINATION_ERROR
+            processed.append(result)
+        if not self.debug:
+            os.remove(benchmark_name)
+        return processed
+
+    def __process_batch_results(self, batch_directory: str, results: dict,
+                                is_final=False) -> list:
+        # BenchExec rewrites results file after runs, so it may be incomplete, until it is final.
+        processed = []
+        for file in glob.glob(os.path.join(batch_directory, "benchmark*results*.xml")):
+            try:
+                root = ElementTree.parse(file).getroot()
+            except ElementTree.ParseError:
+                if is_final:
+                    raise
+                continue
+            for run in root.findall("./run"):
+                task_name = os.path.basename(run.attrib.get("name", ""))
+                columns = run.findall("./column")
+                if task_name not in results or not columns:
+                    continue
+                result = results.pop(task_name)
+                for log_file in glob.glob(os.path.join(batch_directory, "*.logfiles",
+                                                       f"*.{task_name}.log")):
+                    shutil.move(log_file, os.path.join(result.work_dir, LOG_FILE))
+                processed.append(self.process_launch_results(result, columns))
+        return processed
+
+    def __prepare_sources(self, sources_queue: multiprocessing.Queue, is_build: bool = True):
         """
         For each specified source directory the following actions can be performed:
         1. Clean.
@@ -234,6 +629,7 @@ class FullLauncher(Launcher):
         3. Build (with build commands as a result).
         4. Apply specified patches.
         5. Find changes of specified commits (with changed functions as a result).
+        If is_build is not set, then only changes of specified commits are found.
         This should be performed in a separated process.
         """
 
@@ -280,9 +676,11 @@ class FullLauncher(Launcher):
                                  f"'{identifier}', preparation of which was skipped")
                     shutil.copy(cached_commands, build_commands)
                 continue
-            self.logger.debug(f"Building of sources '{identifier}' (directory {source_dir})")
-
             builder = Builder(self.install_dir, self.config, source_dir, build_config, repository)
+            builders[builder] = None
+            if not is_build:
+                continue
+            self.logger.debug(f"Building of sources '{identifier}' (directory {source_dir})")
             builder.clean()
 
             if branch:
@@ -292,7 +690,6 @@ class FullLauncher(Launcher):
                 build_patch = self.__get_file_for_system(self.patches_dir, build_patch)
                 builder.patch(build_patch)
 
-            builders[builder] = None
             if build_config:
                 if cached_commands and os.path.exists(cached_commands):
                     self.logger.debug(f"Taking build commands from cached file {cached_commands}")
@@ -331,7 +728,7 @@ class FullLauncher(Launcher):
                     specific_functions = specific_functions.union(specific_functions_new)
                     qualifier_resources = self.add_resources(qualifier.stop(), qualifier_resources)
 
-                if patches:
+                if patches and is_build:
                     for patch in patches:
                         self.logger.debug(f"Apply patch {patch}")
                         patch = self.__get_file_for_system(self.patches_dir, patch)
@@ -346,6 +743,45 @@ class FullLauncher(Launcher):
         })
         sys.exit(0)
 
+    def __get_sources_data(self, is_build: bool = True) -> dict:
+        """
+        Prepare source directories in separate process.
+        :return: data, which was put into sources queue.
+        """
+        sources_queue = multiprocessing.Queue()
+        sources_process = multiprocessing.Process(target=self.__prepare_sources, name="sources",
+                                                  args=(sources_queue, is_build))
+        sources_process.start()
+        sources_process.join()
+
+        data = {}
+        if not sources_queue.empty():
+            data = sources_queue.get()
+        else:
+            if not sources_process.exitcode:
+                self.logger.error(
+                    "Sanity check failed: builder data is missed with none-error exit code")
+                sys.exit(sources_process.exitcode)
+
+        if sources_process.exitcode:
+            self.logger.error("Source directories were not prepared")
+            sys.exit(sources_process.exitcode)
+        return data
+
+    def __get_specific_functions(self, sources_data: dict) -> set:
+        """
+        Returns functions, which were specified as callers or changed by the checked commits
+        (including their static variants).
+        """
+        specific_functions = set(self.config.get(TAG_CALLERS, set()))
+        if not specific_functions:
+            specific_functions = set(sources_data.get(SOURCE_QUEUE_FUNCTIONS) or set())
+        static_callers = set()
+        for func in specific_functions:
+            static_callers.add(func + STATIC_SUFFIX)
+        specific_functions.update(static_callers)
+        return specific_functions
+
     def __resolve_property_file(self, rundefinition: ElementTree.Element,
                                 launch: VerificationTask) -> None:
         """
@@ -402,16 +838,16 @@ class FullLauncher(Launcher):
             ElementTree.SubElement(rundefinition, "option", {"name": "-setprop"}).text \
                 = f"{key}={val}"
 
-    def __process_single_group(self, mode, launches, time_limit, memory_limit, core_limit,
-                               heap_limit, internal_time_limit, queue):
+    def __process_single_group(self, mode, group_name, launches, time_limit, memory_limit,
+                               core_limit, heap_limit, internal_time_limit, queue):
         # TODO: This is for vcloud only - not supported!
         # Prepare benchmark file for the whole group.
         benchmark_cur = self.__create_benchmark_config(time_limit, core_limit, memory_limit)
         ElementTree.SubElement(benchmark_cur, "resultfiles").text = "**/*"
         ElementTree.SubElement(benchmark_cur, "requiredfiles").text = "properties/*"
         for launch in launches:
-            name = f"{launch.entrypoint}_{launch.rule}_{os.path.basename(launch.cil_file)}"
-            rundefinition = ElementTree.SubElement(benchmark_cur, "rundefinition", {"name": name})
+            rundefinition = ElementTree.SubElement(benchmark_cur, "rundefinition",
+                                                   {"name": self.__get_run_name(launch)})
             ElementTree.SubElement(rundefinition, "option", {"name": "-heap"}).text = \
                 f"{heap_limit}m"
             ElementTree.SubElement(rundefinition, "option", {"name": "-timelimit"}).text = str(
@@ -426,7 +862,7 @@ class FullLauncher(Launcher):
                         option
             ElementTree.SubElement(ElementTree.SubElement(rundefinition, "tasks"),
                                    "include").text = os.path.relpath(launch.cil_file)
-        benchmark_name = f"{DEFAULT_LAUNCHES_DIR}/benchmark_{mode}.xml"
+        benchmark_name = f"{DEFAULT_LAUNCHES_DIR}/benchmark_{group_name}.xml"
         with open(benchmark_name, "w", encoding="ascii") as file_obj:
             file_obj.write(minidom.parseString(ElementTree.tostring(benchmark_cur)).toprettyxml(
                 indent="\t"))
@@ -449,84 +885,196 @@ class FullLauncher(Launcher):
 
         os.makedirs(cil_rel_dir, exist_ok=True)
         os.makedirs(properties_rel_dir, exist_ok=True)
-        for file in glob.glob(os.path.join(cil_abs_dir, "*")):
-            if os.path.isfile(file):
-                shutil.copy(file, cil_rel_dir)
-        for file in glob.glob(os.path.join(properties_abs_dir, "*")):
-            if os.path.isfile(file):
-                shutil.copy(file, properties_rel_dir)
+        self.__stage_files(cil_abs_dir, cil_rel_dir)
+        self.__stage_files(properties_abs_dir, properties_rel_dir)
 
         if os.path.islink(benchmark_rel_dir):
             os.unlink(benchmark_rel_dir)
         os.symlink(benchmark_abs_dir, benchmark_rel_dir)
 
         log_file_name = os.path.join(group_directory, CLOUD_BENCHMARK_LOG)
+        # Run name -> launch, which result has not been received yet.
+        pending = {self.__get_run_name(launch): launch for launch in launches}
         with open(log_file_name, 'w', encoding="utf8") as f_log:
             # Launch group.
             command = f"python3 scripts/benchmark.py --no-compress-results -o " \
                       f"{group_directory} --container {os.path.basename(benchmark_name)} " \
                       f"{self.benchmark_args}"
             self.logger.debug(f"Launching benchmark: {command}")
-            subprocess.check_call(command, shell=True, stderr=f_log, stdout=f_log)
+            with subprocess.Popen(command, shell=True, stderr=f_log, stdout=f_log) as process:
+                # Results are processed by the worker pool of the main process as soon as each
+                # run is completed, while the other runs are still being solved.
+                while process.poll() is None:
+                    self.__collect_group_results(group_directory, pending, queue)
+                    time.sleep(BUSY_WAITING_INTERVAL)
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command)
+        self.__collect_group_results(group_directory, pending, queue, is_final=True)
+        os.chdir(cur_dir)
 
-        # Process results (in parallel -- we assume, that the master host is free).
-        process_pool = []
-        for i in range(self.cpu_cores):
-            process_pool.append(None)
-        for launch in launches:
-            benchexec_id_regexp = f"{launch.entrypoint}_{launch.rule}_" \
-                                  f"{os.path.basename(launch.cil_file)}." \
-                                  f"{os.path.basename(launch.cil_file)}*"
-            files = glob.glob(os.path.join(group_directory, "*.logfiles", benchexec_id_regexp)) + \
-                glob.glob(os.path.join(group_directory, "*.files", benchexec_id_regexp, 'output'))
-
-            launch_dir = self._copy_result_files(files, group_directory)
-            xml_file_regexp = f'benchmark*results.{launch.entrypoint}_{launch.rule}_' \
-                              f'{os.path.basename(launch.cil_file)}.xml'
-            xml_files = glob.glob(os.path.join(group_directory, xml_file_regexp))
-            if not xml_files:
+    @staticmethod
+    def __stage_files(src_dir: str, dst_dir: str) -> None:
+        """
+        Make files of the source directory available in the verifier directory. Files are
+        hardlinked (or copied, if it is not possible), whereas unchanged files, which were staged
+        by the previous groups or runs, are kept as is.
+        """
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                dst_file = os.path.join(dst_dir, entry.name)
+                src_stat = entry.stat()
+                try:
+                    dst_stat = os.stat(dst_file)
+                    if os.path.samestat(src_stat, dst_stat) or (
+                            src_stat.st_size == dst_stat.st_size and
+                            src_stat.st_mtime_ns == dst_stat.st_mtime_ns):
+                        continue
+                except FileNotFoundError:
+                    pass
+                tmp_file = f"{dst_file}.{os.getpid()}.tmp"
+                try:
+                    os.link(entry.path, tmp_file)
+                except OSError:
+                    # Different file systems.
+                    shutil.copy2(entry.path, tmp_file)
+                os.replace(tmp_file, dst_file)
+
+    @staticmethod
+    def __get_run_name(launch: VerificationTask) -> str:
+        return f"{launch.entrypoint}_{launch.rule}_{os.path.basename(launch.cil_file)}"
+
+    def __collect_group_results(self, group_directory: str, pending: dict,
+                                queue: multiprocessing.Queue, is_final=False) -> None:
+        """
+        Put results of completed runs of the cloud group into the queue. Each run has its own
+        results file, in which BenchExec writes resources of the run, when it is completed.
+        """
+        completed = []
+        with os.scandir(group_directory) as entries:
+            for entry in entries:
+                res = re.fullmatch(r'benchmark.*\.results\.(.+)\.xml', entry.name)
+                if not res or res.group(1) not in pending:
+                    continue
+                if not is_final:
+                    try:
+                        columns = ElementTree.parse(entry.path).getroot().findall("./run/column")
+                    except ElementTree.ParseError:
+                        # Results file is being written.
+                        continue
+                    if not any(column.attrib.get("title") == "status" for column in columns):
+                        continue
+                completed.append((pending.pop(res.group(1)), entry.path))
+        if is_final:
+            for launch in pending.values():
                 self.logger.warning(f"There is no xml file for launch {launch}")
-            else:
-                shutil.move(xml_files[0], launch_dir)
+                completed.append((launch, None))
+            pending.clear()
+        if not completed:
+            return
+
+        files_index = self.__index_group_files(
+            group_directory, {self.__get_benchexec_id(launch) for launch, _ in completed})
+        for launch, xml_file in completed:
+            launch_dir = self._copy_result_files(
+                files_index.get(self.__get_benchexec_id(launch), []), group_directory)
+            if xml_file:
+                shutil.move(xml_file, launch_dir)
 
             result = VerificationResults(launch, self.config)
             result.work_dir = launch_dir
+            queue.put(result)
 
-            try:
-                while True:
-                    for i in range(self.cpu_cores):
-                        if process_pool[i] and not process_pool[i].is_alive():
-                            process_pool[i].join()
-                            process_pool[i] = None
-                        if not process_pool[i]:
-                            process_pool[i] = multiprocessing.Process(
-                                target=self.__process_single_launch_results, name=result.entrypoint,
-                                args=(result, launch_dir, queue))
-                            process_pool[i].start()
-                            raise NestedLoop
-                    sleep(BUSY_WAITING_INTERVAL)
-            except NestedLoop:
-                pass
-            except Exception as exception:
-                self.logger.error(f"Error during processing results: {exception}", exc_info=True)
-                kill_launches(process_pool)
-        wait_for_launches(process_pool)
-        os.chdir(cur_dir)
+    def __get_benchexec_id(self, launch: VerificationTask) -> str:
+        return f"{self.__get_run_name(launch)}.{os.path.basename(launch.cil_file)}"
+
+    @staticmethod
+    def __index_group_files(group_directory: str, benchexec_ids: set) -> dict:
+        """
+        Find log and output files of the given runs by a single pass over the group directory.
+        :return: map of BenchExec run identifiers to their files.
+        """
+        sub_dirs = []
+        with os.scandir(group_directory) as entries:
+            for entry in entries:
+                if entry.name.endswith((".logfiles", ".files")) and entry.is_dir():
+                    sub_dirs.append(entry.path)
+        index = {}
+        for sub_dir in sub_dirs:
+            is_output = sub_dir.endswith(".files")
+            with os.scandir(sub_dir) as entries:
+                for entry in entries:
+                    # File names start with run identifier, which may contain dots itself.
+                    name = entry.name
+                    pos = len(name)
+                    while pos > 0 and name[:pos] not in benchexec_ids:
+                        pos = name.rfind('.', 0, pos)
+                    if pos <= 0:
+                        continue
+                    path = entry.path
+                    if is_output:
+                        path = os.path.join(path, 'output')
+                        if not os.path.exists(path):
+                            continue
+                    index.setdefault(name[:pos], []).append(path)
+        return index
+
+    def __start_cloud_groups(self, launches: list, time_limit, memory_limit, core_limit,
+                             heap_limit, statistics_time, queue: multiprocessing.Queue) -> list:
+        """
+        Divide launches into groups by verifier mode and start solving each group on cloud.
+        Groups, which are larger than the specified size, are divided into several groups,
+        which are submitted concurrently.
+        :return: list of processes, which solve the groups.
+        """
+        launch_groups = {}
+        for launch in launches:
+            mode = self.__get_mode(launch.rule)
+            if mode in launch_groups:
+                launch_groups[mode].append(launch)
+            else:
+                launch_groups[mode] = [launch]
+        for group in launch_groups.values():
+            group.sort(key=self.__get_launch_order)
+        if statistics_time < time_limit:
+            internal_time_limit = time_limit - statistics_time
+        else:
+            internal_time_limit = time_limit
+        process_pool = []
+        for mode, group in launch_groups.items():
+            group_size = self.cloud_group_size or len(group)
+            for i, start in enumerate(range(0, len(group), group_size)):
+                group_name = mode if group_size >= len(group) else f"{mode}_{i + 1}"
+                process_single_group = multiprocessing.Process(
+                    target=self.__process_single_group, name=group_name,
+                    args=(mode, group_name, group[start:start + group_size], time_limit,
+                          memory_limit, core_limit, heap_limit, internal_time_limit, queue))
+                process_single_group.start()
+                process_pool.append(process_single_group)
+        self.logger.info(f"Divided all tasks into {len(process_pool)} group(s) for solving on "
+                         f"cloud")
+        return process_pool
 
-    def __get_groups_with_established_connections(self):
+    def __get_groups_with_established_connections(self, log_tailer: LogTailer,
+                                                  solving_groups: set) -> set:
+        """
+        Find new groups, which received results of their first runs. Only lines, which were
+        appended to benchmark logs since the previous call, are checked.
+        """
         result = set()
-        log_files = glob.glob(os.path.join(self.work_dir, DEFAULT_LAUNCHES_DIR, "*",
-                                           CLOUD_BENCHMARK_LOG))
-        for log_file in log_files:
-            if os.path.exists(log_file):
-                with open(log_file, errors='ignore', encoding="utf8") as f_log:
-                    for line in f_log.readlines():
-                        res = re.search(r'INFO	BenchmarkClient:OutputHandler\$1\.onSuccess	'
-                                        r'Received run result for run 1 of', line)
-                        if res:
-                            group_id = os.path.basename(os.path.dirname(log_file))
-                            result.add(group_id)
-                            break
+        with os.scandir(os.path.join(self.work_dir, DEFAULT_LAUNCHES_DIR)) as entries:
+            group_dirs = [entry for entry in entries
+                          if entry.name not in solving_groups and entry.is_dir()]
+        for group_dir in group_dirs:
+            log_file = os.path.join(group_dir.path, CLOUD_BENCHMARK_LOG)
+            for line in log_tailer.read_lines(log_file):
+                res = re.search(r'INFO	BenchmarkClient:OutputHandler\$1\.onSuccess	'
+                                r'Received run result for run 1 of', line)
+                if res:
+                    result.add(group_dir.name)
+                    log_tailer.forget(log_file)
+                    break
         return result
 
     def __get_file_for_system(self, prefix: str, file: str) -> str:
@@ -560,6 +1108,470 @@ class FullLauncher(Launcher):
     def __get_mode(self, prop: str) -> str:
         return self.properties_desc.get_property_arg(prop, PROPERTY_MODE)
 
+    @staticmethod
+    def __check_cgroups() -> tuple:
+        """
+        Get limitations of the control group, in which the launcher is running.
+        :return: memory limit (in bytes) and number of CPU cores (0 means no limit).
+        """
+        memory_limit = 0
+        cores_limit = 0
+        cgroup_path = ""
+        if os.path.exists("/proc/self/cgroup"):
+            with open("/proc/self/cgroup", encoding="ascii", errors="ignore") as file_obj:
+                for line in file_obj.readlines():
+                    # Format: <id>:<controllers>:<path>, cgroup v2 has empty controllers.
+                    parts = line.strip().split(":", 2)
+                    if len(parts) == 3 and parts[0] == "0" and not parts[1]:
+                        cgroup_path = parts[2].lstrip("/")
+        for file in [os.path.join("/sys/fs/cgroup", cgroup_path, "memory.max"),
+                     "/sys/fs/cgroup/memory/memory.limit_in_bytes"]:
+            if os.path.exists(file):
+                with open(file, encoding="ascii", errors="ignore") as file_obj:
+                    value = file_obj.read().strip()
+                if value.isdigit():
+                    memory_limit = int(value)
+                break
+        cpu_max = os.path.join("/sys/fs/cgroup", cgroup_path, "cpu.max")
+        if os.path.exists(cpu_max):
+            with open(cpu_max, encoding="ascii", errors="ignore") as file_obj:
+                values = file_obj.read().split()
+            if len(values) == 2 and values[0].isdigit() and values[1].isdigit():
+                cores_limit = max(1, int(int(values[0]) / int(values[1])))
+        elif os.path.exists("/sys/fs/cgroup/cpu/cpu.cfs_quota_us"):
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", encoding="ascii") as file_obj:
+                quota = int(file_obj.read().strip())
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us", encoding="ascii") as file_obj:
+                period = int(file_obj.read().strip())
+            if quota > 0 and period > 0:
+                cores_limit = max(1, int(quota / period))
+        return memory_limit, cores_limit
+
+    def __get_free_memory(self) -> int:
+        """
+        Get memory (in GB), which can be used for launches on this host: RAM size, which is
+        restricted by the control group of the launcher.
+        """
+        max_memory = int(int(subprocess.check_output("free -m", shell=True).
+                             splitlines()[1].split()[1]) / 1000)
+        cgroup_memory, _ = self.__check_cgroups()
+        if cgroup_memory:
+            max_memory = min(max_memory, int(cgroup_memory / 10 ** 9))
+        return max_memory
+
+    def __get_free_cores(self) -> int:
+        """
+        Get number of CPU cores, which can be used for launches on this host.
+        """
+        if hasattr(os, "sched_getaffinity"):
+            max_cores = len(os.sched_getaffinity(0))
+        else:
+            max_cores = multiprocessing.cpu_count()
+        _, cgroup_cores = self.__check_cgroups()
+        if cgroup_cores:
+            max_cores = min(max_cores, cgroup_cores)
+        return max_cores
+
+    def __get_number_of_processes(self, max_memory, max_cores, memory_limit,
+                                  core_limit) -> int:
+        """
+        Returns maximal number of parallel verifier launches on the current host.
+        """
+        if memory_limit > 0:
+            proc_by_memory = int(max_memory / memory_limit)
+        else:
+            proc_by_memory = max_memory
+        if core_limit > 0:
+            proc_by_cores = int(max_cores / core_limit)
+        else:
+            proc_by_cores = max_cores
+        parallel_launches = int(self.component_config.get(TAG_PARALLEL_LAUNCHES, 0))
+        if parallel_launches < 0:
+            sys.exit(f"Incorrect value for number of parallel launches: {parallel_launches}")
+        if not parallel_launches:
+            return min(proc_by_memory, proc_by_cores)
+        # Careful with this number: if it is too big, memory may be exhausted.
+        return parallel_launches
+
+    def __get_mea_processes(self, max_cores: int, number_of_processes: int) -> int:
+        """
+        Returns number of parallel filtering jobs. If verifier launches on the current host are
+        not limited, then filtering shares CPU cores with them, so only a single filtering job is
+        guaranteed.
+        """
+        if self.scheduler in (SCHEDULER_CLOUD, SCHEDULER_WORKERS):
+            return self.config.get(COMPONENT_MEA, {}).get(TAG_PARALLEL_LAUNCHES, self.cpu_cores)
+        if not int(self.component_config.get(TAG_PARALLEL_LAUNCHES, 0)):
+            return 1
+        return max(1, max_cores - number_of_processes)
+
+    def __get_property_limits(self, prop: str, time_limit, memory_limit, core_limit) -> tuple:
+        """
+        Get resource limitations for a given property (they can be redefined for each property).
+        :return: CPU time limit, memory limit and number of cores.
+        """
+        specific_limits = self.component_config.get(TAG_RESOURCE_LIMITATIONS, {}).\
+            get(TAG_LIMIT_PROPERTIES, {}).get(prop, {})
+        return specific_limits.get(TAG_LIMIT_CPU_TIME, time_limit), \
+            specific_limits.get(TAG_LIMIT_MEMORY, memory_limit), \
+            specific_limits.get(TAG_LIMIT_CPU_CORES, core_limit)
+
+    def __get_expected_cpu_time(self, launch: VerificationTask) -> float:
+        return self.cost_history.get_expected_cpu(launch.entry_desc.id, launch.entrypoint,
+                                                  launch.rule, launch.mode)
+
+    def __get_priority(self, launch: VerificationTask) -> int:
+        if launch.entrypoint.replace(ENTRY_POINT_SUFFIX, "") in self.affected_functions:
+            return PRIORITY_AFFECTED
+        # Generated main calls all entry points of the subsystem.
+        if launch.entrypoint == DEFAULT_MAIN and \
+                self.affected_functions.intersection(launch.entry_desc.data):
+            return PRIORITY_AFFECTED
+        return PRIORITY_OTHER
+
+    def __get_launch_order(self, launch: VerificationTask) -> tuple:
+        # Affected entry points go first, then the longest expected tasks to shorten the tail of
+        # the run.
+        return self.__get_priority(launch), -self.__get_expected_cpu_time(launch)
+
+    def __update_cost_history(self, results: list) -> None:
+        for result in results:
+            self.cost_history.add(result.id, result.entrypoint, result.rule,
+                                  self.__get_mode(result.rule), result.cpu, result.wall,
+                                  result.mem)
+        self.cost_history.save()
+
+    @staticmethod
+    def __is_related(entry_desc: EntryPointDesc, specific_sources: set) -> bool:
+        """
+        Check if subsystem relates with the changed sources (if they were specified).
+        """
+        if not specific_sources:
+            return True
+        for file in specific_sources:
+            for subsystem in entry_desc.subsystems:
+                if subsystem in file:
+                    return True
+        return False
+
+    def __get_shard_entrypoints(self, entry_desc: EntryPointDesc, rule: str,
+                                entrypoints) -> list:
+        """
+        Returns entry points, which belong to the current shard. Verification tasks are
+        distributed between shards by hash of subsystem, rule and entry point, so each shard
+        selects the same tasks on any host.
+        """
+        if not self.shard:
+            return list(entrypoints)
+        index, number = self.shard
+        return [entrypoint for entrypoint in entrypoints
+                if zlib.crc32(f"{entry_desc.id};{rule};{entrypoint}".encode()) % number ==
+                index - 1]
+
+    def _get_result_file_prefix(self):
+        prefix = super()._get_result_file_prefix()
+        if self.shard:
+            index, number = self.shard
+            prefix += f"_shard_{index}_of_{number}"
+        return prefix
+
+    @staticmethod
+    def __is_checked(entrypoint: str, specific_functions: set) -> bool:
+        return not specific_functions or \
+            entrypoint.replace(ENTRY_POINT_SUFFIX, "") in specific_functions or \
+            entrypoint == DEFAULT_MAIN
+
+    def __get_main_generation_jobs(self, entrypoints_desc: list, rules: list,
+                                   specific_sources: set):
+        """
+        Apply changes to source files for each entry points description. Jobs are generated
+        lazily, so the first of them can be prepared before sources for the others are changed.
+        :return: generator of (entry points description, rule, hash of sources), for which main
+        files should be generated.
+        """
+        # Subsystems with affected entry points are prepared first.
+        entrypoints_desc = sorted(entrypoints_desc, key=lambda desc: (
+            not self.affected_functions.intersection(desc.data), desc.id))
+        for entry_desc in entrypoints_desc:
+            if not self.__is_related(entry_desc, specific_sources):
+                self.logger.debug(f"Skipping subsystem '{entry_desc.id}' "
+                                  f"because it does not relate with the checking commits")
+                continue
+            # Source files are changed only by the scheduler, since different subsystems may
+            # change the same files. Main generator changes the given entry points, whereas
+            # they are passed to worker processes as they are.
+            MainGenerator(self.config, copy.deepcopy(entry_desc.data),
+                          self.properties_desc).process_sources()
+            # Sources are hashed once for all rules, rather than by each worker process.
+            sources_hash = self.cil_manifest.get_sources_hash(self.build_results,
+                                                              entry_desc.subsystems)
+            for rule in rules:
+                yield entry_desc, rule, sources_hash
+
+    def generate_main_file(self, entry_desc: EntryPointDesc, rule: str, sources_hash,
+                           preparation_config: dict, main_dir: str = DEFAULT_MAIN_DIR) -> tuple:
+        """
+        Generate main file for the pair of entry points description and rule (in a worker
+        process).
+        :return: (name of verification task, entry points, batches of entry points, hash of
+        inputs of CIL file).
+        """
+        main_generator = MainGenerator(self.config, entry_desc.data, self.properties_desc)
+        strategy = main_generator.get_strategy(rule)
+        prop_plain_name = re.sub('\\W+', '_', rule)
+        object_name = f"{entry_desc.short_name}_{prop_plain_name}_{strategy}"
+        main_file_name = os.path.join(main_dir, f"{object_name}.c")
+        entrypoints = main_generator.generate_main(strategy, main_file_name, rule)
+        if self.shard:
+            entrypoints = self.__get_shard_entrypoints(entry_desc, rule, entrypoints)
+        batches = {}
+        # Failed batches are solved again in the next rounds, which are not supported by cloud
+        # scheduler without CPU time escalation.
+        if entrypoints and self.batching_config and self.scheduler != SCHEDULER_CLOUD and \
+                strategy in [PARTIAL_STRATEGY, PARTIAL_EXT_ALLOCATION_STRATEGY]:
+            batches = self.__get_entrypoint_batches(entry_desc, rule, entrypoints)
+            if batches:
+                main_generator.generate_batches(main_file_name, batches)
+        cil_key = self.cil_manifest.get_key(
+            [main_file_name, self.__get_file_for_system(self.models_dir, f"{rule}.c"),
+             self.__get_file_for_system(self.models_dir, COMMON_HEADER_FOR_RULES)],
+            sources_hash, [self.config.get(COMPONENT_PREPARATOR, {}), preparation_config])
+        return object_name, entrypoints, batches, cil_key
+
+    def __get_preparation_config(self) -> dict:
+        preparation_config_file = self.__get_file_for_system(
+            os.path.join(self.root_dir, DEFAULT_PREPARATION_PATCHES_DIR),
+            self.config.get(TAG_PREPARATION_CONFIG, DEFAULT_PREPARATION_CONFIG))
+        if not preparation_config_file:
+            return {}
+        with open(preparation_config_file, encoding="ascii") as file_obj:
+            return json.load(file_obj)
+
+    def __get_preparation_job(self, entry_desc: EntryPointDesc, rule: str, main_generation,
+                              is_cached: bool, preparation_config: dict):
+        """
+        Create preparator for the pair of entry points description and rule, which main file has
+        been generated.
+        :return: (entry points description, rule, entry points, CIL file, preparator), where
+        preparator is None, if cached CIL file is used, or None, if there are no entry points.
+        """
+        object_name, entrypoints, batches, cil_key = main_generation
+        if not entrypoints:
+            # All launches for this CIL file belong to other shards.
+            return None
+        if batches:
+            self.__batch_entrypoints[(entry_desc.id, rule)] = batches
+        main_file_name = os.path.join(DEFAULT_MAIN_DIR, f"{object_name}.c")
+        model = self.__get_file_for_system(self.models_dir, f"{rule}.c")
+        common_file = self.__get_file_for_system(self.models_dir, COMMON_HEADER_FOR_RULES)
+        cil_file = os.path.abspath(os.path.join(DEFAULT_CIL_DIR, f"{object_name}.i"))
+        # Inputs are recorded even without cache to reuse the CIL file in the next runs.
+        is_unchanged = self.cil_manifest.check(cil_file, cil_key)
+        if is_cached and is_unchanged:
+            self.logger.debug(f"Using cached CIL-file {cil_file}")
+            preparator = None
+        else:
+            self.logger.debug(f"Generating verification task {cil_file} for entrypoints "
+                              f"{entry_desc.id}, rule {rule}")
+            preparator = Preparator(
+                self.install_dir, self.config,
+                subdirectory_patterns=entry_desc.subsystems, model=model,
+                main_file=main_file_name, output_file=cil_file,
+                preparation_config=preparation_config,
+                common_file=common_file, build_results=self.build_results)
+        return entry_desc, rule, entrypoints, cil_file, preparator
+
+    def __get_entrypoint_batches(self, entry_desc: EntryPointDesc, rule: str,
+                                 entrypoints: list) -> dict:
+        """
+        Divide entry points, which were solved quickly in the previous runs, into batches.
+        :return: map of batch entry points to lists of their entry points.
+        """
+        max_time = self.batching_config.get(TAG_BATCHING_MAX_TIME, DEFAULT_BATCHING_MAX_TIME)
+        size = self.batching_config.get(TAG_BATCHING_SIZE, DEFAULT_BATCHING_SIZE)
+        mode = self.__get_mode(rule)
+        cheap_entrypoints = []
+        for entrypoint in sorted(entrypoints):
+            if entrypoint.replace(ENTRY_POINT_SUFFIX, "") in self.affected_functions:
+                # Affected entry points are solved first.
+                continue
+            cost = self.cost_history.get_cost(entry_desc.id, entrypoint, rule, mode)
+            if cost and cost.get(TAG_CPU_TIME, max_time) < max_time:
+                cheap_entrypoints.append(entrypoint)
+        batches = {}
+        for start in range(0, len(cheap_entrypoints), size):
+            batch = cheap_entrypoints[start:start + size]
+            if len(batch) > 1:
+                batches[f"{DEFAULT_BATCH_MAIN}_{len(batches) + 1}"] = batch
+        return batches
+
+    def __pack_batches(self, entry_desc: EntryPointDesc, rule: str, launches: list) -> list:
+        """
+        Replace launches of batched entry points with launches of their batches. A batch is
+        launched only if all its entry points should be solved.
+        """
+        batches = self.__batch_entrypoints.get((entry_desc.id, rule))
+        if not batches:
+            return launches
+        # Several CIL files may be prepared, each of them is packed separately.
+        cil_launches = {}
+        for launch in launches:
+            cil_launches.setdefault(launch.cil_file, {})[launch.entrypoint] = launch
+        packed_launches = []
+        for entrypoint_launches in cil_launches.values():
+            for batch, entrypoints in batches.items():
+                if all(entrypoint in entrypoint_launches for entrypoint in entrypoints):
+                    batch_launches = [entrypoint_launches.pop(entrypoint)
+                                      for entrypoint in entrypoints]
+                    launch = batch_launches[0]
+                    packed_launch = VerificationTask(entry_desc, rule, launch.mode, batch,
+                                                     launch.path_to_verifier, launch.cil_file)
+                    self.__batch_launches[ResultJournal.get_key(packed_launch)] = batch_launches
+                    packed_launches.append(packed_launch)
+            packed_launches.extend(entrypoint_launches.values())
+        return packed_launches
+
+    def __create_launches(self, entry_desc: EntryPointDesc, rule: str, entrypoints: set,
+                          cil_file: str, specific_functions: set) -> list:
+        """
+        Create launches for the prepared CIL file.
+        """
+        if not os.path.exists(cil_file) or os.path.getsize(cil_file) == 0:
+            # Check for several CIL files.
+            cil_files = sorted(glob.glob(cil_file + "*"))
+            if not cil_files:
+                # Nothing was prepared -- error during preparation.
+                self.logger.warning(f"The file {cil_file} was not found, "
+                                    f"skip the corresponding launches")
+                return []
+            # Several CIL files were found - need to multiply launches for each CIL file.
+            # TODO: add this file id (cil_file[len(new_launch.cil_file):]) as a launch parameter
+        else:
+            cil_files = [cil_file]
+        mode = self.__get_mode(rule)
+        path_to_verifier = self.get_tool_path(os.path.join(mode, DEFAULT_CPACHECKER_SCRIPTS_PATH))
+        launches = []
+        for entrypoint in entrypoints:
+            if self.__is_checked(entrypoint, specific_functions):
+                for file in cil_files:
+                    launches.append(VerificationTask(entry_desc, rule, mode, entrypoint,
+                                                     path_to_verifier, file))
+        return launches
+
+    def __get_entrypoints_desc(self) -> set:
+        """
+        Read descriptions of entry points, which are specified in the config.
+        """
+        ep_desc_files = self.config.get(TAG_ENTRYPOINTS_DESC)
+        entrypoints_desc = set()
+        if not ep_desc_files:
+            sys.exit("No file with description of entry points to be checked were specified")
+        for group in ep_desc_files:
+            self.logger.debug(f"Processing given group of files: {group}")
+            files = []
+            if isinstance(group, list):
+                for elem in group:
+                    files.extend(self.__get_files_for_system(self.entrypoints_dir,
+                                                             elem + JSON_EXTENSION))
+                identifier = "_".join(group)
+                self.logger.debug(f"Processing joint files with entry point description "
+                                  f"'{identifier}'")
+                entrypoints_desc.add(EntryPointDesc(files, identifier))
+            else:
+                # Wildcards are supported here.
+                files = self.__get_files_for_system(self.entrypoints_dir,
+                                                    group + JSON_EXTENSION)
+                for file in files:
+                    self.logger.debug(f"Processing file with entry point description '{file}'")
+                    identifier = os.path.basename(file)[:-len(JSON_EXTENSION)]
+                    entrypoints_desc.add(EntryPointDesc([file], identifier))
+            if not files:
+                sys.exit(f"No file with description of entry points for '{group}' were found")
+        return entrypoints_desc
+
+    def __read_backup(self) -> dict:
+        """
+        Read results of the previous run from the journal.
+        :return: map of (subsystem, rule, entry point, CIL file) to its restored result.
+        """
+        self.logger.info("Restoring from backup copy")
+        journal = self.backup or ResultJournal(DEFAULT_RESULT_JOURNAL)
+        restored_results = journal.read(self.config)
+        # Backup copies, which were created by previous versions, do not contain CIL files, so
+        # their records are identified by (subsystem, rule, entry point).
+        for file in glob.glob(os.path.join(self.work_dir, f"{DEFAULT_BACKUP_PREFIX}*")):
+            legacy_keys = set()
+            for key, result in journal.read(self.config, file).items():
+                restored_results[key[:3]] = result
+                legacy_keys.add(key[:3])
+            self.__legacy_backups[file] = legacy_keys
+        return restored_results
+
+    def __restore_result(self, restored_results: dict, launch: VerificationTask):
+        """
+        Take the restored result for the launch.
+        :return: result or None, if the launch was not solved in the previous run.
+        """
+        key = ResultJournal.get_key(launch)
+        if key in restored_results:
+            # This result is already in the journal.
+            return restored_results.pop(key)
+        result = restored_results.pop(key[:3], None)
+        if not result or not self.backup:
+            return result
+        # Result from backup copy of a previous version is moved into the journal, and the copy
+        # is removed only after all its results have been moved.
+        result.cil_file = launch.cil_file
+        self.backup.add(result)
+        for file, legacy_keys in list(self.__legacy_backups.items()):
+            legacy_keys.discard(key[:3])
+            if not legacy_keys:
+                os.remove(file)
+                del self.__legacy_backups[file]
+        return result
+
+    @staticmethod
+    def __get_verifier_configs(benchmark: dict) -> dict:
+        """
+        Returns verifier configuration (options, resource limits and automata) for each property,
+        which identifies its launches in verdict cache.
+        """
+        automata = ""
+        for file in sorted(glob.glob(os.path.join(DEFAULT_AUTOMATA_DIR, "*"))):
+            with open(file, errors='ignore', encoding="utf8") as file_obj:
+                automata += file_obj.read()
+        return {prop: ElementTree.tostring(prop_benchmark, encoding="unicode") + automata
+                for prop, prop_benchmark in benchmark.items()}
+
+    def __push_launches(self, task_queue: TaskQueue, launches: list, need: tuple,
+                        batch_size: int, batch_threads: int, time_limit) -> None:
+        """
+        Add launches for a single CIL file into the local scheduler queue. If batch size is
+        specified, then several launches are solved by a single BenchExec invocation, which takes
+        resources for the given number of its threads (launches for warm verifier are never
+        batched). Launches are ordered by their priority class, then by CPU time limit (escalated
+        launches go after the others) and then by expected CPU time.
+        """
+        launches = sorted(launches, key=self.__get_launch_order)
+        if batch_size <= 1 or not launches or \
+                self.properties_desc.get_property_arg(launches[0].rule, PROPERTY_IS_MOVE_OUTPUT):
+            batch_size = 1
+        for priority, class_launches in itertools.groupby(launches, key=self.__get_priority):
+            batches = []
+            cold_launches = []
+            for launch in class_launches:
+                if self.__is_warm_launch(launch):
+                    batches.append([launch])
+                else:
+                    cold_launches.append(launch)
+            batches.extend(cold_launches[i:i + batch_size]
+                           for i in range(0, len(cold_launches), batch_size))
+            for batch in batches:
+                threads = min(batch_threads, len(batch))
+                task_queue.push(batch, (need[0] * threads, need[1] * threads),
+                                (priority, time_limit,
+                                 -sum(self.__get_expected_cpu_time(launch) for launch in batch)))
+
     def __create_benchmark_config(self, time_limit, core_limit, memory_limit):
         base_config = {
             "tool": CPACHECKER,
@@ -572,6 +1584,156 @@ class FullLauncher(Launcher):
             base_config["memlimit"] = str(memory_limit) + "GB"
         return ElementTree.Element("benchmark", base_config)
 
+    def __read_launches_reports(self) -> dict:
+        """
+        Read results of previous runs from their reports on launches.
+        :return: map of (subsystem, rule, entry point) to its latest result.
+        """
+        results = {}
+        reader = ResultJournal(None)
+        reports = glob.glob(os.path.join(self.results_dir,
+                                          f"{DEFAULT_LAUNCHES_REPORT_PREFIX}*.csv"))
+        for file in sorted(reports, key=os.path.getmtime):
+            # Header of the report is skipped as an incorrect line. Reports do not contain CIL
+            # files, so launches are identified without them.
+            for key, result in reader.read(self.config, file).items():
+                results[key[:3]] = result
+        return results
+
+    def __estimate_launch(self, launch: VerificationTask, previous_results: dict,
+                          time_limit) -> tuple:
+        """
+        Estimate costs of a verifier launch based on results of previous runs.
+        :return: (CPU time, wall time, number of filtering jobs, CPU time of filtering, flag if
+        costs of this launch are known).
+        """
+        result = previous_results.get(ResultJournal.get_key(launch)[:3])
+        if result:
+            mea_jobs = 1 if result.initial_traces > 1 else 0
+            return result.cpu, result.wall, mea_jobs, \
+                result.mea_resources.get(TAG_CPU_TIME, 0.0), True
+        cost = self.cost_history.get_cost(launch.entry_desc.id, launch.entrypoint, launch.rule,
+                                          launch.mode)
+        if cost:
+            return cost.get(TAG_CPU_TIME, 0.0), cost.get(TAG_WALL_TIME, 0.0), 0, 0.0, True
+        # Average CPU time for the property or CPU time limit for unknown properties.
+        cpu = self.__get_expected_cpu_time(launch) or time_limit
+        return cpu, cpu, 0, 0.0, False
+
+    def plan(self):
+        """
+        Estimate number of jobs and resources, which are required to verify the given
+        configuration, without building sources, preparing verification tasks and launching
+        verifier.
+        """
+        self.logger.info(f"Planning verification of '{self.config_file}' configuration")
+        os.makedirs(self.work_dir, exist_ok=True)
+        os.chdir(self.work_dir)
+
+        max_cores = self.__get_free_cores()
+        max_memory = self.__get_free_memory()
+        resource_limits = self.component_config.get(TAG_RESOURCE_LIMITATIONS)
+        memory_limit = resource_limits.get(TAG_LIMIT_MEMORY, max_memory)
+        time_limit = resource_limits[TAG_LIMIT_CPU_TIME]
+        core_limit = resource_limits.get(TAG_LIMIT_CPU_CORES, max_cores)
+        number_of_processes = self.__get_number_of_processes(max_memory, max_cores, memory_limit,
+                                                             core_limit)
+        if self.scheduler == SCHEDULER_LOCAL:
+            parallel_launches = number_of_processes
+        elif self.scheduler == SCHEDULER_WORKERS:
+            parallel_launches = sum(self.worker_hosts.values())
+        else:
+            # Depends on the number of cloud workers.
+            parallel_launches = 0
+        # The same number of filtering jobs as in launch.
+        mea_processes = self.__get_mea_processes(max_cores, number_of_processes)
+
+        rules = self.config.get("properties")
+        if not rules:
+            sys.exit("No properties to be checked were specified")
+        rules = sorted(set(rules))
+        entrypoints_desc = self.__get_entrypoints_desc()
+
+        # Changed functions are found without building of sources.
+        sources_data = self.__get_sources_data(is_build=False)
+        specific_functions = self.__get_specific_functions(sources_data)
+        specific_sources = sources_data.get(SOURCE_QUEUE_FILES)
+        is_cached = self.config.get(TAG_CACHED, False)
+        # Source files are not changed, so inputs of CIL files are computed for the current ones.
+        self.build_results = sources_data.get(SOURCE_QUEUE_RESULTS)
+        self.affected_functions = specific_functions
+        self.cil_manifest = CilManifest(DEFAULT_CIL_MANIFEST)
+        preparation_config = self.__get_preparation_config()
+
+        preparations = 0
+        cached_preparations = 0
+        launches = []
+        with tempfile.TemporaryDirectory() as main_dir:
+            for entry_desc in sorted(entrypoints_desc, key=lambda desc: desc.id):
+                if not self.__is_related(entry_desc, specific_sources):
+                    continue
+                sources_hash = self.cil_manifest.get_sources_hash(self.build_results,
+                                                                  entry_desc.subsystems)
+                for rule in rules:
+                    object_name, entrypoints, _, cil_key = self.generate_main_file(
+                        entry_desc, rule, sources_hash, preparation_config, main_dir)
+                    if not entrypoints:
+                        continue
+                    cil_file = os.path.abspath(os.path.join(DEFAULT_CIL_DIR, f"{object_name}.i"))
+                    if is_cached and self.cil_manifest.check(cil_file, cil_key):
+                        cached_preparations += 1
+                    else:
+                        preparations += 1
+                    mode = self.__get_mode(rule)
+                    for entrypoint in entrypoints:
+                        if self.__is_checked(entrypoint, specific_functions):
+                            launches.append(VerificationTask(entry_desc, rule, mode, entrypoint,
+                                                             None, None))
+
+        previous_results = self.__read_launches_reports()
+        # Rule -> [launches, launches with unknown costs, CPU time, wall time, filtering jobs,
+        # CPU time of filtering].
+        estimations = {}
+        for launch in launches:
+            prop_time_limit, _, _ = self.__get_property_limits(launch.rule, time_limit,
+                                                               memory_limit, core_limit)
+            cpu, wall, mea_jobs, mea_cpu, is_known = self.__estimate_launch(
+                launch, previous_results, prop_time_limit)
+            if prop_time_limit > 0:
+                cpu = min(cpu, prop_time_limit)
+            estimation = estimations.setdefault(launch.rule, [0, 0, 0.0, 0.0, 0, 0.0])
+            estimation[0] += 1
+            if not is_known:
+                estimation[1] += 1
+            estimation[2] += cpu
+            estimation[3] += wall
+            estimation[4] += mea_jobs
+            estimation[5] += mea_cpu
+        overall = [0, 0, 0.0, 0.0, 0, 0.0]
+        for rule, estimation in sorted(estimations.items()):
+            self.logger.info(f"Property {rule}: {estimation[0]} verifier launches "
+                             f"({estimation[1]} without previous results), "
+                             f"{round(estimation[2] / 3600, 2)} CPU hours, "
+                             f"{estimation[4]} filtering jobs")
+            overall = [total + value for total, value in zip(overall, estimation)]
+
+        self.logger.info(f"Preparations of verification tasks: {preparations} "
+                         f"({cached_preparations} cached CIL files are reused)")
+        self.logger.info(f"Verifier launches: {overall[0]} ({overall[1]} of them have no "
+                         f"previous results, so expected CPU time for their property or CPU "
+                         f"time limit is used)")
+        self.logger.info(f"Filtering jobs: {overall[4]} (based on previous results)")
+        self.logger.info(f"Estimated CPU time: {round(overall[2] / 3600, 2)} CPU hours for "
+                         f"verifier launches and {round(overall[5] / 3600, 2)} CPU hours for "
+                         f"filtering")
+        if parallel_launches:
+            wall_time = overall[3] / parallel_launches + overall[5] / max(1, mea_processes)
+            self.logger.info(f"Estimated wall time: {round(wall_time / 3600, 2)} hours with "
+                             f"{parallel_launches} parallel verifier launches")
+        else:
+            self.logger.info("Estimated wall time depends on the number of cloud workers")
+        os.chdir(self.root_dir)
+
     def launch(self):
         """
         Main method
@@ -603,19 +1765,20 @@ class FullLauncher(Launcher):
         os.makedirs(DEFAULT_EXPORT_DIR, exist_ok=True)
 
         self.logger.debug("Check resource limitations")
-        max_cores = multiprocessing.cpu_count()
+        max_cores = self.__get_free_cores()
         self.cpu_cores = max_cores
         self.logger.debug(f"Machine has {max_cores} CPU cores")
-        max_memory = int(int(subprocess.check_output("free -m", shell=True).
-                             splitlines()[1].split()[1]) / 1000)
+        max_memory = self.__get_free_memory()
         self.logger.debug(f"Machine has {max_memory}GB of RAM")
 
         if self.component_config.get(TAG_BACKUP_WRITE, False):
-            self.backup = f"{DEFAULT_BACKUP_PREFIX}{self._get_result_file_prefix()}.csv"
+            self.backup = ResultJournal(DEFAULT_RESULT_JOURNAL)
+            if not backup_read:
+                self.backup.clear()
 
         resource_limits = self.component_config.get(TAG_RESOURCE_LIMITATIONS)
         memory_limit = resource_limits.get(TAG_LIMIT_MEMORY, max_memory)
-        if not self.scheduler == SCHEDULER_CLOUD and max_memory < memory_limit:
+        if self.scheduler == SCHEDULER_LOCAL and max_memory < memory_limit:
             sys.exit(f"There is not enough memory to start scheduler: {memory_limit}GB are "
                      f"required, whereas only {max_memory}GB are available.")
         # Basic conversion to get Java heap size (in MB)
@@ -629,38 +1792,41 @@ class FullLauncher(Launcher):
             self.logger.warning(f"Specified time for printing statistics {statistics_time}s is "
                                 f"bigger than overall time limit. Ignoring statistics time")
             statistics_time = 0
-        internal_time_limit = time_limit - statistics_time
+        time_limit_steps = resource_limits.get(TAG_LIMIT_ESCALATION, [])
+        if not isinstance(time_limit_steps, list):
+            sys.exit(f"Incorrect value for CPU time escalation: {time_limit_steps}")
 
         core_limit = resource_limits.get(TAG_LIMIT_CPU_CORES, max_cores)
-        if not self.scheduler == SCHEDULER_CLOUD and max_cores < core_limit:
+        if self.scheduler == SCHEDULER_LOCAL and max_cores < core_limit:
             sys.exit(f"There is not enough CPU cores to start scheduler: {core_limit} "
                      f"are required, whereas only {max_cores} are available.")
-
-        specific_functions = set(self.config.get(TAG_CALLERS, set()))
-        specific_sources = set()
-        qualifier_resources = {}
-        builder_resources = {}
-        if self.config.get(TAG_COMMITS) and specific_functions:
+        for prop in resource_limits.get(TAG_LIMIT_PROPERTIES, {}):
+            _, prop_memory_limit, prop_core_limit = self.__get_property_limits(
+                prop, time_limit, memory_limit, core_limit)
+            if self.scheduler == SCHEDULER_LOCAL and (max_memory < prop_memory_limit or
+                                                      max_cores < prop_core_limit):
+                sys.exit(f"There is not enough resources to check property {prop}: "
+                         f"{prop_memory_limit}GB of RAM and {prop_core_limit} CPU cores are "
+                         f"required, whereas only {max_memory}GB and {max_cores} are available.")
+
+        if self.config.get(TAG_COMMITS) and self.config.get(TAG_CALLERS):
             sys.exit(
                 "Sanity check failed: it is forbidden to specify both callers and commits tags")
 
-        if memory_limit > 0:
-            proc_by_memory = int(max_memory / memory_limit)
-        else:
-            proc_by_memory = max_memory
-        if core_limit > 0:
-            proc_by_cores = int(max_cores / core_limit)
-        else:
-            proc_by_cores = max_cores
         parallel_launches = int(self.component_config.get(TAG_PARALLEL_LAUNCHES, 0))
-        if parallel_launches < 0:
-            sys.exit(f"Incorrect value for number of parallel launches: {parallel_launches}")
-        if not parallel_launches:
-            number_of_processes = min(proc_by_memory, proc_by_cores)
-        else:
-            # Careful with this number: if it is too big, memory may be exhausted.
-            number_of_processes = parallel_launches
+        batch_size = int(self.component_config.get(TAG_BATCH_SIZE, 1))
+        batch_threads = max(1, int(self.component_config.get(TAG_BATCH_THREADS, 1)))
+        number_of_processes = self.__get_number_of_processes(max_memory, max_cores, memory_limit,
+                                                             core_limit)
         self.logger.debug(f"Max parallel verifier launches on current host: {number_of_processes}")
+        if self.scheduler == SCHEDULER_WORKERS:
+            # Each launch is sent to a worker host separately.
+            batch_size = 1
+        if batch_size > 1:
+            # Threads of a single BenchExec invocation should fit into the host.
+            batch_threads = max(1, min(batch_threads, number_of_processes))
+            self.logger.debug(f"Up to {batch_size} verifier launches are solved by a single "
+                              f"BenchExec invocation with {batch_threads} threads")
         self.logger.debug(f"Each verifier launch will be limited to {memory_limit}GB of RAM, "
                           f"{time_limit} seconds of CPU time and {core_limit} CPU cores")
 
@@ -669,68 +1835,20 @@ class FullLauncher(Launcher):
         if not rules:
             sys.exit("No properties to be checked were specified")
 
-        ep_desc_files = self.config.get(TAG_ENTRYPOINTS_DESC)
-        entrypoints_desc = set()
-        if not ep_desc_files:
-            sys.exit("No file with description of entry points to be checked were specified")
-        else:
-            for group in ep_desc_files:
-                self.logger.debug(f"Processing given group of files: {group}")
-                files = []
-                if isinstance(group, list):
-                    for elem in group:
-                        files.extend(self.__get_files_for_system(self.entrypoints_dir,
-                                                                 elem + JSON_EXTENSION))
-                    identifier = "_".join(group)
-                    self.logger.debug(f"Processing joint files with entry point description "
-                                      f"'{identifier}'")
-                    entrypoints_desc.add(EntryPointDesc(files, identifier))
-                else:
-                    # Wildcards are supported here.
-                    files = self.__get_files_for_system(self.entrypoints_dir,
-                                                        group + JSON_EXTENSION)
-                    for file in files:
-                        self.logger.debug(f"Processing file with entry point description '{file}'")
-                        identifier = os.path.basename(file)[:-len(JSON_EXTENSION)]
-                        entrypoints_desc.add(EntryPointDesc([file], identifier))
-                if not files:
-                    sys.exit(f"No file with description of entry points for '{group}' were found")
-
-        # Process sources in separate process.
-        sources_queue = multiprocessing.Queue()
-        sources_process = multiprocessing.Process(target=self.__prepare_sources, name="sources",
-                                                  args=(sources_queue,))
-        sources_process.start()
-        sources_process.join()
-        # Wait here since this information may reduce future preparation work.
-
-        if not sources_queue.empty():
-            data = sources_queue.get()
-            if not specific_functions:
-                specific_functions = data.get(SOURCE_QUEUE_FUNCTIONS)
-            specific_sources = data.get(SOURCE_QUEUE_FILES)
-            qualifier_resources = data.get(SOURCE_QUEUE_QUALIFIER_RESOURCES)
-            builder_resources = data.get(SOURCE_QUEUE_BUILDER_RESOURCES)
-            self.build_results = data.get(SOURCE_QUEUE_RESULTS)
-        else:
-            if not sources_process.exitcode:
-                self.logger.error(
-                    "Sanity check failed: builder data is missed with none-error exit code")
-                sys.exit(sources_process.exitcode)
+        entrypoints_desc = self.__get_entrypoints_desc()
 
-        if sources_process.exitcode:
-            self.logger.error("Source directories were not prepared")
-            sys.exit(sources_process.exitcode)
-
-        if specific_functions:
-            static_callers = set()
-            for func in specific_functions:
-                static_callers.add(func + STATIC_SUFFIX)
-            specific_functions.update(static_callers)
+        # Wait here since this information may reduce future preparation work.
+        sources_data = self.__get_sources_data()
+        specific_functions = self.__get_specific_functions(sources_data)
+        specific_sources = sources_data.get(SOURCE_QUEUE_FILES)
+        qualifier_resources = sources_data.get(SOURCE_QUEUE_QUALIFIER_RESOURCES)
+        builder_resources = sources_data.get(SOURCE_QUEUE_BUILDER_RESOURCES)
+        self.build_results = sources_data.get(SOURCE_QUEUE_RESULTS)
+        self.affected_functions = specific_functions
 
         self.logger.info("Preparing verification tasks based on the given configuration")
-        preparator_processes = self.config.get(COMPONENT_PREPARATOR, {}).get(TAG_PROCESSES,
-                                                                             max_cores)
+        preparator_processes = max(1, self.config.get(COMPONENT_PREPARATOR, {}).get(
+            TAG_PROCESSES, max_cores))
         self.logger.debug(f"Starting scheduler for verification tasks preparation with "
                           f"{preparator_processes} processes")
 
@@ -743,126 +1861,340 @@ class FullLauncher(Launcher):
         rules = sorted(set(rules))
         preparator_start_wall = time.time()
         resource_queue = multiprocessing.Queue()
-        launches = deque()
-        process_pool = []
-        for i in range(preparator_processes):
-            process_pool.append(None)
 
-        preparation_config_file = self.__get_file_for_system(
-            os.path.join(self.root_dir, DEFAULT_PREPARATION_PATCHES_DIR),
-            self.config.get(TAG_PREPARATION_CONFIG, DEFAULT_PREPARATION_CONFIG))
-        if preparation_config_file:
-            with open(preparation_config_file, encoding="ascii") as file_obj:
-                preparation_config = json.load(file_obj)
-        else:
-            preparation_config = {}
+        preparation_config = self.__get_preparation_config()
 
-        for entry_desc in entrypoints_desc:
-            if specific_sources:
-                is_skip = True
-                for file in specific_sources:
-                    for subsystem in entry_desc.subsystems:
-                        if subsystem in file:
-                            is_skip = False
-                            break
-                if is_skip:
-                    self.logger.debug(f"Skipping subsystem '{entry_desc.id}' "
-                                      f"because it does not relate with the checking commits")
-                    continue
-            main_generator = MainGenerator(self.config, entry_desc.data, self.properties_desc)
-            main_generator.process_sources()
-            for rule in rules:
-                strategy = main_generator.get_strategy(rule)
-                mode = self.__get_mode(rule)
-                prop_plain_name = re.sub('\\W+', '_', rule)
-                object_name = f"{entry_desc.short_name}_{prop_plain_name}_{strategy}"
-                main_file_name = os.path.join(DEFAULT_MAIN_DIR, f"{object_name}.c")
-                entrypoints = main_generator.generate_main(strategy, main_file_name, rule)
-                model = self.__get_file_for_system(self.models_dir, f"{rule}.c")
-                common_file = self.__get_file_for_system(self.models_dir, COMMON_HEADER_FOR_RULES)
-                cil_file = os.path.abspath(os.path.join(DEFAULT_CIL_DIR, f"{object_name}.i"))
-                try:
-                    while True:
-                        for i in range(preparator_processes):
-                            if process_pool[i] and not process_pool[i].is_alive():
-                                process_pool[i].join()
-                                process_pool[i] = None
-                            if not process_pool[i]:
-                                if is_cached and os.path.exists(cil_file):
-                                    self.logger.debug(f"Using cached CIL-file {cil_file}")
-                                else:
-                                    self.logger.debug(
-                                        f"Generating verification task {cil_file} for entrypoints "
-                                        f"{entry_desc.id}, rule {rule}")
-                                    preparator = Preparator(
-                                        self.install_dir, self.config,
-                                        subdirectory_patterns=entry_desc.subsystems, model=model,
-                                        main_file=main_file_name, output_file=cil_file,
-                                        preparation_config=preparation_config,
-                                        common_file=common_file, build_results=self.build_results)
-                                    process_pool[i] = multiprocessing.Process(
-                                        target=preparator.prepare_task, name=cil_file,
-                                        args=(resource_queue,))
-                                    process_pool[i].start()
-                                raise NestedLoop
-                        sleep(BUSY_WAITING_INTERVAL)
-                except NestedLoop:
-                    pass
-                except Exception as exception:
-                    self.logger.error(f"Could not prepare verification task: {exception}",
-                                      exc_info=True)
-                    kill_launches(process_pool)
-                for entrypoint in entrypoints:
-                    path_to_verifier = self.get_tool_path(
-                        os.path.join(mode, DEFAULT_CPACHECKER_SCRIPTS_PATH))
-
-                    if not specific_functions or \
-                            entrypoint.replace(ENTRY_POINT_SUFFIX, "") in specific_functions or \
-                            entrypoint == DEFAULT_MAIN:
-                        launches.append(VerificationTask(entry_desc, rule, self.__get_mode(rule),
-                                                         entrypoint, path_to_verifier, cil_file))
-        wait_for_launches(process_pool)
-
-        # Filter problem launches
-        removed_launches = []
-        added_launches = {}
-        for launch in launches:
-            if not os.path.exists(launch.cil_file) or os.path.getsize(launch.cil_file) == 0:
-                removed_launches.append(launch)
-                # Check for several CIL files.
-                cil_files = glob.glob(launch.cil_file + "*")
-                if not cil_files:
-                    # Nothing was prepared -- error during preparation.
-                    self.logger.warning(f"The file {launch.cil_file} was not found, "
-                                        f"skip the corresponding launch")
+        # Prepare BenchExec commands.
+        path_to_benchexec = self.get_tool_path(self._get_tool_default_path(BENCHEXEC),
+                                               self.config.get(TAG_TOOLS, {}).get(BENCHEXEC))
+        self.logger.debug(f"Using BenchExec, found in: '{path_to_benchexec}'")
+        os.environ["PATH"] += os.pathsep + path_to_benchexec
+        benchmark = {}
+        # Benchmarks for each CPU time limit of the property (the last one is the main benchmark).
+        benchmarks = {}
+        # Resource requirements (memory, cores) of each launch for the given property.
+        launch_needs = {}
+        for prop in self.properties_desc.get_properties():
+            # Specify resource limitations.
+            prop_time_limit, prop_memory_limit, prop_core_limit = self.__get_property_limits(
+                prop, time_limit, memory_limit, core_limit)
+            launch_needs[prop] = (prop_memory_limit or 1, prop_core_limit or 1)
+            if self.scheduler == SCHEDULER_CLOUD:
+                # Cloud groups are solved with common resource limits.
+                self.__time_limits[prop] = self.__get_time_limits(time_limit, time_limit_steps)
+            else:
+                self.__time_limits[prop] = self.__get_time_limits(prop_time_limit,
+                                                                  time_limit_steps)
+            benchmarks[prop] = []
+            for level_time_limit in self.__time_limits[prop][:-1] + [prop_time_limit]:
+                benchmarks[prop].append(self.__create_benchmark_config(
+                    level_time_limit, prop_core_limit, prop_memory_limit))
+                rundefinition = ElementTree.SubElement(benchmarks[prop][-1], "rundefinition")
+                ElementTree.SubElement(rundefinition, "option", {"name": "-heap"}).text = \
+                    f"{int(prop_memory_limit * 1000 * 13 / 15)}m"
+                if statistics_time < level_time_limit:
+                    prop_internal_time_limit = level_time_limit - statistics_time
                 else:
-                    # Several CIL files were found - need to multiply this launch for each CIL file.
-                    cil_files.sort()
-                    added_launches[launch] = cil_files
+                    prop_internal_time_limit = level_time_limit
+                if prop_internal_time_limit > 0:
+                    ElementTree.SubElement(rundefinition, "option",
+                                           {"name": "-timelimit"}).text = \
+                        str(prop_internal_time_limit)
+
+                # Get options from files.
+                self.__parse_verifier_options(prop, rundefinition)
+            benchmark[prop] = benchmarks[prop][-1]
+
+            # Create links to the properties.
+            for file in glob.glob(os.path.join(self.root_dir, DEFAULT_PROPERTIES_DIR,
+                                               DEFAULT_AUTOMATA_DIR, "*")):
+                if os.path.isfile(file):
+                    shutil.copy(file, DEFAULT_AUTOMATA_DIR)
+            if self.system_id:
+                for file in glob.glob(os.path.join(self.plugin_dir, self.system_id,
+                                                   DEFAULT_PROPERTIES_DIR, DEFAULT_AUTOMATA_DIR,
+                                                   "*")):
+                    if os.path.isfile(file):
+                        shutil.copy(file, DEFAULT_AUTOMATA_DIR)
 
-        for launch in removed_launches:
-            launches.remove(launch)
+        verifier_configs = self.__get_verifier_configs(benchmark) if self.verdict_cache else {}
 
-        for launch, cil_files in added_launches.items():
-            for cil_file in cil_files:
-                new_launch = launch.copy()
-                new_launch.cil_file = cil_file
-                # TODO: add this file id (cil_file[len(new_launch.cil_file):]) as a launch parameter
-                launches.append(new_launch)
+        restored_results = {}
+        if backup_read:
+            restored_results = self.__read_backup()
 
-        if not launches:
-            self.logger.info("The given configuration does not require any launches "
-                             "(the changes are irrelevant for checked subsystems)")
+        # Preparation and local verifier launches share the same scheduler: launches for a pair
+        # of entry points description and rule can be started as soon as its CIL file is ready.
+        # Cloud groups are created only after all verification tasks have been prepared.
+        self.logger.debug(f"Starting scheduler for verifier launches with {number_of_processes} "
+                          f"processes")
+        # Cached CIL files are reused only if their inputs were not changed.
+        self.cil_manifest = CilManifest(DEFAULT_CIL_MANIFEST)
+        main_generation_jobs = self.__get_main_generation_jobs(entrypoints_desc, rules,
+                                                               specific_sources)
+        mea_processes = self.__get_mea_processes(max_cores, number_of_processes)
+        if self.scheduler == SCHEDULER_CLOUD:
+            # Results of cloud launches are processed in parallel (we assume, that the master host
+            # is free).
+            launch_workers = self.cpu_cores
+        elif self.scheduler == SCHEDULER_WORKERS:
+            # Each worker process waits for a single launch on a worker host.
+            launch_workers = sum(self.worker_hosts.values())
+        elif not parallel_launches:
+            # Each verifier launch or filtering job takes at least one core, and one filtering
+            # job is always admitted.
+            launch_workers = max_cores
+        else:
+            launch_workers = parallel_launches
+        # Processes on this host are not started while it is overloaded.
+        pressure_limits = self.component_config.get(TAG_PRESSURE_LIMITS, {})
+        governor = PressureGovernor(pressure_limits) if pressure_limits else None
+        pressure_reason = ""
+        if self.scheduler == SCHEDULER_LOCAL and not parallel_launches:
+            # Launches are packed by their memory and CPU cores requirements, so small launches
+            # may fill the gaps next to big ones.
+            resource_pool = ResourcePool(max_memory, max_cores, governor=governor)
+            preparation_pool = resource_pool
+            # Filtering leases cores, which are not used by verifier launches, so it is shrunk
+            # while verifiers are busy and expanded at the tail of the run.
+            filter_pool = SharedResourcePool(resource_pool, mea_processes, max_cores)
+            self.logger.debug("Starting scheduler for filtering, which shares CPU cores with "
+                              "verifier launches")
+        else:
+            resource_pool = ResourcePool(0, 0, parallel_launches, governor)
+            preparation_pool = ResourcePool(0, 0, governor=governor)
+            filter_pool = ResourcePool(0, 0, mea_processes, governor)
+            self.logger.debug(f"Starting scheduler for filtering with {mea_processes} processes")
+        # Worker host (None for the current host) -> its resources for verifier launches.
+        if self.scheduler == SCHEDULER_WORKERS:
+            host_pools = {address: ResourcePool(0, 0, int(launches_number))
+                          for address, launches_number in self.worker_hosts.items()}
+            self.__retry_queues = {address: TaskQueue() for address in self.worker_hosts}
+        else:
+            host_pools = {None: resource_pool}
+        filter_queue = TaskQueue()
+        # Verifier launches (processing of their results for cloud), filtering of error traces
+        # and main generation are executed by the same persistent worker processes.
+        self.worker_pool = WorkerPool(self, launch_workers + mea_processes + preparator_processes)
+        task_queue = TaskQueue()
+        launches = []  # Launches for cloud scheduler.
+        # Future of main generation -> (entry points description, rule).
+        main_generations = {}
+        is_main_generation = True
+        preparation_jobs = collections.deque()
+        prepared_jobs = []
+        preparations = {}  # Preparator process -> its job.
+        # Job future -> (resource pool, resource requirements, method, stage, number of tasks).
+        running = {}
+        prep_data_list = []
+        is_preparation = True
+        preparation_wall_time = None
+        preparation_cpu_time = 0.0
+        number_of_launches = 0
+        cached_number = 0
+        affected_number = 0
+        counter = 1
+        try:
+            while True:
+                # Main files are generated by worker processes in advance, so that preparation
+                # is not delayed by them.
+                while is_main_generation and len(main_generations) < preparator_processes:
+                    main_generation_job = next(main_generation_jobs, None)
+                    if not main_generation_job:
+                        is_main_generation = False
+                        break
+                    main_generations[self.worker_pool.submit(
+                        self.generate_main_file, *main_generation_job, preparation_config)] = \
+                        main_generation_job
+                for future in [future for future in main_generations if future.done()]:
+                    entry_desc, rule, _ = main_generations.pop(future)
+                    try:
+                        main_generation = future.result()
+                    except SystemExit as exception:
+                        raise RuntimeError(f"Main generation for subsystem '{entry_desc.id}', "
+                                           f"rule '{rule}' has failed: {exception}") from exception
+                    job = self.__get_preparation_job(entry_desc, rule, main_generation, is_cached,
+                                                     preparation_config)
+                    if job:
+                        preparation_jobs.append(job)
+
+                # Preparation goes first, since it makes new launches available.
+                while preparation_jobs and len(preparations) < preparator_processes and \
+                        preparation_pool.fits(SINGLE_CORE_NEED):
+                    job = preparation_jobs.popleft()
+                    preparator = job[-1]
+                    if preparator:
+                        process = multiprocessing.Process(target=preparator.prepare_task,
+                                                          name=job[3],
+                                                          args=(resource_queue,))
+                        process.start()
+                        preparation_pool.acquire(SINGLE_CORE_NEED)
+                        preparations[process] = job
+                        self.progress.add(STAGE_PREPARATION, COUNTER_RUNNING)
+                    else:
+                        prepared_jobs.append(job)
+                        self.progress.add(STAGE_PREPARATION, COUNTER_FINISHED)
+                is_preparation = is_main_generation or bool(main_generations) or \
+                    bool(preparation_jobs)
+
+                for entry_desc, rule, entrypoints, cil_file, _ in prepared_jobs:
+                    new_launches = []
+                    for launch in self.__create_launches(entry_desc, rule, entrypoints, cil_file,
+                                                         specific_functions):
+                        restored_result = self.__restore_result(restored_results, launch)
+                        if restored_result:
+                            results.append(restored_result)
+                            continue
+                        if self.verdict_cache:
+                            result = self.verdict_cache.get(launch, verifier_configs[rule],
+                                                            self.config, DEFAULT_LAUNCHES_DIR)
+                            if result:
+                                self._add_result(result, results)
+                                cached_number += 1
+                                continue
+                        new_launches.append(launch)
+                    new_launches = self.__pack_batches(entry_desc, rule, new_launches)
+                    if len(self.__time_limits[rule]) > 1:
+                        for launch in new_launches:
+                            # Launch is solved with the first time limit.
+                            self.__escalation[ResultJournal.get_key(launch)] = (launch, 0)
+                    number_of_launches += len(new_launches)
+                    affected_number += sum(1 for launch in new_launches
+                                           if self.__get_priority(launch) == PRIORITY_AFFECTED)
+                    if self.scheduler != SCHEDULER_CLOUD:
+                        self.__push_launches(task_queue, new_launches, launch_needs[rule],
+                                             batch_size, batch_threads,
+                                             self.__time_limits[rule][0])
+                    else:
+                        launches.extend(new_launches)
+                prepared_jobs.clear()
+
+                if not is_preparation and not preparations and preparation_wall_time is None:
+                    self.logger.info("Preparation of verification tasks has been completed")
+                    self.progress.set(STAGE_PREPARATION, COUNTER_TOTAL,
+                                      self.progress.counters[STAGE_PREPARATION][COUNTER_FINISHED] +
+                                      self.progress.counters[STAGE_PREPARATION][COUNTER_FAILED])
+                    preparation_wall_time = time.time() - preparator_start_wall
+                    self.cil_manifest.save()
+                    preparation_cpu_time = time.process_time() - self.start_cpu_time
+                    if backup_read:
+                        restored_number = len(results)
+                        if restored_number:
+                            self.logger.info(f"Successfully restored {restored_number} results")
+                        else:
+                            self.logger.info("No results were restored")
+                    if self.verdict_cache:
+                        self.logger.info(f"Reused {cached_number} results from verdict cache")
+                    self.logger.info(f"Expected number of verifier launches is "
+                                     f"{number_of_launches}")
+                    if self.affected_functions:
+                        self.logger.info(f"{affected_number} launches for affected entry points "
+                                         f"are solved first")
+
+                for address, host_pool in host_pools.items():
+                    task = self.__pop_launches(task_queue, host_pool, address)
+                    while task:
+                        batch, need = task
+                        host_pool.acquire(need)
+                        launch = batch[0]
+                        level_benchmark = benchmarks[launch.rule][self.__get_level(launch)]
+                        if len(batch) == 1:
+                            self.logger.info(
+                                f"Scheduling new launch: subsystem '{launch.entry_desc.id}'"
+                                f", rule '{launch.rule}', entrypoint '{launch.entrypoint}' "
+                                f"({counter} of {number_of_launches} prepared launches)")
+                            if address:
+                                method, args = self.remote_launch, (launch, level_benchmark,
+                                                                    address)
+                            else:
+                                method, args = self.local_launch, (launch, level_benchmark)
+                        else:
+                            self.logger.info(
+                                f"Scheduling new batch of {len(batch)} launches: subsystem "
+                                f"'{launch.entry_desc.id}', rule '{launch.rule}' ({counter}-"
+                                f"{counter + len(batch) - 1} of {number_of_launches} prepared "
+                                f"launches)")
+                            method, args = self.local_batch_launch, \
+                                (batch, level_benchmark, min(batch_threads, len(batch)))
+                        future = self.worker_pool.submit(method, *args)
+                        running[future] = (host_pool, need, method, STAGE_VERIFICATION,
+                                           len(batch))
+                        if address:
+                            # Each launch is sent to a worker host separately.
+                            self.__remote_launches[future] = (launch, need, address)
+                        self.progress.add(STAGE_VERIFICATION, COUNTER_RUNNING, len(batch))
+                        counter += len(batch)
+                        task = self.__pop_launches(task_queue, host_pool, address)
+                self.__submit_jobs(filter_queue, filter_pool, self.perform_filtering,
+                                   STAGE_FILTERING, running)
+
+                self.progress.set(STAGE_VERIFICATION, COUNTER_TOTAL, number_of_launches)
+                queued_number = len(task_queue) + sum(len(retry_queue) for retry_queue in
+                                                      self.__retry_queues.values())
+                self.progress.set(STAGE_VERIFICATION, COUNTER_QUEUED, queued_number)
+                self.progress.set(STAGE_FILTERING, COUNTER_QUEUED, len(filter_queue))
+                self.progress.write()
+                if not is_preparation and not preparations and not running and \
+                        not queued_number and not filter_queue:
+                    break
+                if self.debug:
+                    self.logger.debug(f"Scheduler load: "
+                                      f"{'; '.join(str(pool) for pool in host_pools.values())} "
+                                      f"(filtering: {filter_pool})")
+
+                timeout = self.progress.interval
+                if governor:
+                    if governor.reason != pressure_reason:
+                        pressure_reason = governor.reason
+                        if pressure_reason:
+                            self.logger.info(f"Start of new processes is delayed, since "
+                                             f"{pressure_reason}")
+                        else:
+                            self.logger.info("Start of new processes is resumed")
+                    if pressure_reason:
+                        # Pressure should be checked again.
+                        timeout = min(timeout, governor.interval)
+
+                # Wake up as soon as a preparation or a job is completed (or progress should be
+                # written).
+                for process in wait_for_any(list(preparations.keys()),
+                                            [resource_queue, self.worker_pool.connection],
+                                            timeout):
+                    job = preparations.pop(process)
+                    if not process.exitcode:
+                        self.cil_manifest.commit(job[3])
+                    prepared_jobs.append(job)
+                    preparation_pool.release(SINGLE_CORE_NEED)
+                    self.progress.add(STAGE_PREPARATION, COUNTER_RUNNING, -1)
+                    self.progress.add(STAGE_PREPARATION,
+                                      COUNTER_FAILED if process.exitcode else COUNTER_FINISHED)
+                for launch in self.__process_completed_jobs(running, results, filter_queue):
+                    self.__push_launches(task_queue, [launch], launch_needs[launch.rule], 1, 1,
+                                         self.__time_limits[launch.rule][self.__get_level(launch)])
+                    number_of_launches += 1
+                while not resource_queue.empty():
+                    prep_data_list.append(resource_queue.get())
+        except Exception as exception:
+            self.logger.error(f"Process scheduler was terminated: {exception}", exc_info=True)
+            self.worker_pool.terminate()
+            kill_launches(list(preparations.keys()))
+            sys.exit(1)
+        while not resource_queue.empty():
+            prep_data_list.append(resource_queue.get())
+
+        if not number_of_launches and not results:
+            self.logger.warning("No launches were set by the given configuration (the changes "
+                                "may be irrelevant for checked subsystems)")
+            self.worker_pool.shutdown()
+            sys.exit(0)
 
         counter = 1
         preparation_memory_usage = 0
-        preparation_cpu_time = time.process_time() - self.start_cpu_time
         preparation_memory_usage_all = []
         preparator_unknowns = []
         component_attrs = {COMPONENT_PREPARATOR: {}}
         build_commands = {}
-        while not resource_queue.empty():
-            prep_data = resource_queue.get()
+        for prep_data in prep_data_list:
             preparator_wall_time = prep_data.get(TAG_WALL_TIME, 0.0)
             preparator_cpu_time = prep_data.get(TAG_CPU_TIME, 0.0)
             preparator_memory = prep_data.get(TAG_MEMORY_USAGE, 0)
@@ -937,184 +2269,104 @@ class FullLauncher(Launcher):
             if counter > preparator_processes:
                 break
 
-        if backup_read:
-            self.logger.info("Restoring from backup copy")
-            backup_files = glob.glob(os.path.join(self.work_dir, f"{DEFAULT_BACKUP_PREFIX}*"))
-            for file in backup_files:
-                with open(file, "r", errors='ignore', encoding="ascii") as f_res:
-                    for line in f_res.readlines():
-                        result = VerificationResults(None, self.config)
-                        result.parse_line(line)
-                        for launch in launches:
-                            if result.is_equal(launch):
-                                results.append(result)
-                                launches.remove(launch)
-                                break
-                os.remove(file)
-            if self.backup:
-                with open(self.backup, "a", encoding="ascii") as f_report:
-                    for result in results:
-                        f_report.write(str(result) + "\n")
-            if results:
-                self.logger.info(f"Successfully restored {len(results)} results")
-            else:
-                self.logger.info("No results were restored")
-
-        self.logger.info("Preparation of verification tasks has been completed")
-        preparation_wall_time = time.time() - preparator_start_wall
         self.logger.debug(f"Preparation wall time: "
                           f"{round(preparation_wall_time, 2)} seconds")
         self.logger.debug(f"Preparation CPU time: "
                           f"{round(preparation_cpu_time, 2)} seconds")
         self.logger.debug(f"Preparation memory usage: "
                           f"{round(preparation_memory_usage / 2 ** 20, 2)} Mb")
-        self.logger.info("Starting to solve verification tasks")
-        self.logger.info(f"Expected number of verifier launches is {len(launches)}")
-
-        # Prepare BenchExec commands.
-        path_to_benchexec = self.get_tool_path(self._get_tool_default_path(BENCHEXEC),
-                                               self.config.get(TAG_TOOLS, {}).get(BENCHEXEC))
-        self.logger.debug(f"Using BenchExec, found in: '{path_to_benchexec}'")
-        os.environ["PATH"] += os.pathsep + path_to_benchexec
-        benchmark = {}
-        for prop in self.properties_desc.get_properties():
-            # Specify resource limitations.
-            benchmark[prop] = self.__create_benchmark_config(time_limit, core_limit, memory_limit)
-            rundefinition = ElementTree.SubElement(benchmark[prop], "rundefinition")
-            ElementTree.SubElement(rundefinition, "option", {"name": "-heap"}).text = \
-                f"{heap_limit}m"
-            if internal_time_limit > 0:
-                ElementTree.SubElement(rundefinition, "option", {"name": "-timelimit"}).text = \
-                    str(internal_time_limit)
-
-            # Create links to the properties.
-            for file in glob.glob(os.path.join(self.root_dir, DEFAULT_PROPERTIES_DIR,
-                                               DEFAULT_AUTOMATA_DIR, "*")):
-                if os.path.isfile(file):
-                    shutil.copy(file, DEFAULT_AUTOMATA_DIR)
-            if self.system_id:
-                for file in glob.glob(os.path.join(self.plugin_dir, self.system_id,
-                                                   DEFAULT_PROPERTIES_DIR, DEFAULT_AUTOMATA_DIR,
-                                                   "*")):
-                    if os.path.isfile(file):
-                        shutil.copy(file, DEFAULT_AUTOMATA_DIR)
-
-            # Get options from files.
-            self.__parse_verifier_options(prop, rundefinition)
-
-        self.logger.debug(f"Starting scheduler for verifier launches with {number_of_processes} "
-                          f"processes")
-        counter = 1
-        number_of_launches = len(launches)
-        if number_of_launches == 0:
-            self.logger.warning("No launches were set by the given configuration")
-            sys.exit(0)
-        queue = multiprocessing.Queue()
-        if self.scheduler == SCHEDULER_CLOUD:
-            mea_processes = self.config.get(COMPONENT_MEA, {}).get(TAG_PARALLEL_LAUNCHES,
-                                                                   self.cpu_cores)
-        else:
-            mea_processes = max(1, max_cores - number_of_processes)
-        filtering_process = multiprocessing.Process(target=self.__filter_scheduler, name="MEA",
-                                                    args=(mea_processes, queue))
-        filtering_process.start()
 
         if self.scheduler == SCHEDULER_CLOUD:
-            launch_groups = {}
-            for launch in launches:
-                mode = self.__get_mode(launch.rule)
-                if mode in launch_groups:
-                    launch_groups[mode].append(launch)
-                else:
-                    launch_groups[mode] = [launch]
+            self.logger.info("Starting to solve verification tasks")
+            queue = multiprocessing.Queue()
+            # Launches, which reach intermediate time limit, are solved in the next round.
+            cloud_time_limits = self.__get_time_limits(time_limit, time_limit_steps)
+            level = 0
+            relaunches = []
+            process_pool = self.__start_cloud_groups(launches, cloud_time_limits[level],
+                                                     memory_limit, core_limit, heap_limit,
+                                                     statistics_time, queue)
+            self.progress.add(STAGE_VERIFICATION, COUNTER_RUNNING, len(launches))
             del launches
-            self.logger.info(f"Divided all tasks into {len(launch_groups)} group(s) for solving on "
-                             f"cloud")
-            process_pool = []
-            for mode, launches in launch_groups.items():
-                process_single_group = multiprocessing.Process(
-                    target=self.__process_single_group, name=mode,
-                    args=(mode, launches, time_limit, memory_limit, core_limit, heap_limit,
-                          internal_time_limit, queue))
-                process_single_group.start()
-                process_pool.append(process_single_group)
+            processing_pool = ResourcePool(0, 0, launch_workers)
+            processing_queue = TaskQueue()
             connection_established = False
             solving_groups = set()
-            while True:
-                self._get_from_queue_into_list(queue, results)
-                if not connection_established:
-                    new_groups = self.__get_groups_with_established_connections()
-                    if not new_groups <= solving_groups:
-                        for group in new_groups:
-                            if group not in solving_groups:
+            log_tailer = LogTailer()
+            try:
+                while True:
+                    while not queue.empty():
+                        processing_queue.push(queue.get(), SINGLE_CORE_NEED)
+                        self.progress.add(STAGE_VERIFICATION, COUNTER_RUNNING, -1)
+                        self.progress.add(STAGE_VERIFICATION, COUNTER_FINISHED)
+                    self.__submit_jobs(processing_queue, processing_pool,
+                                       self.process_launch_results, STAGE_COVERAGE, running)
+                    self.__submit_jobs(filter_queue, filter_pool, self.perform_filtering,
+                                       STAGE_FILTERING, running)
+                    self.progress.set(STAGE_COVERAGE, COUNTER_QUEUED, len(processing_queue))
+                    self.progress.set(STAGE_FILTERING, COUNTER_QUEUED, len(filter_queue))
+                    self.progress.write()
+                    if not connection_established:
+                        new_groups = self.__get_groups_with_established_connections(
+                            log_tailer, solving_groups)
+                        if new_groups:
+                            for group in new_groups:
                                 solving_groups.add(group)
                                 self.logger.info(f"Established connection to group "
                                                  f"{len(solving_groups)}")
-                        if len(solving_groups) == len(launch_groups):
-                            self.logger.info("Connection to all group(s) has been established")
-                            connection_established = True
-                if not any(p.is_alive() for p in process_pool):
-                    break
-                sleep(BUSY_WAITING_INTERVAL)
-        elif self.scheduler == SCHEDULER_LOCAL:
-            process_pool = []
-            for i in range(number_of_processes):
-                process_pool.append(None)
-            try:
-                while True:
-                    for i in range(number_of_processes):
-                        if process_pool[i] and not process_pool[i].is_alive():
-                            process_pool[i].join()
-                            process_pool[i] = None
-                            self._get_from_queue_into_list(queue, results)
-                        if not process_pool[i]:
-                            launch = launches.popleft()
-                            percent = 100 - 100 * counter / number_of_launches
-                            self.logger.info(
-                                f"Scheduling new launch: subsystem '{launch.entry_desc.id}'"
-                                f", rule '{launch.rule}', entrypoint '{launch.entrypoint}' "
-                                f"({round(percent, 2)}% remains)")
-                            counter += 1
-                            process_pool[i] = multiprocessing.Process(
-                                target=self.local_launch, name=launch.name,
-                                args=(launch, benchmark[launch.rule], queue))
-                            process_pool[i].start()
-                            if len(launches) == 0:
-                                raise NestedLoop
-                    sleep(BUSY_WAITING_INTERVAL)
-            except NestedLoop:
-                # All entry points has been checked.
-                wait_for_launches(process_pool)
-                self._get_from_queue_into_list(queue, results)
+                            if len(solving_groups) == len(process_pool):
+                                self.logger.info("Connection to all group(s) has been established")
+                                connection_established = True
+                    if not any(p.is_alive() for p in process_pool) and queue.empty() and \
+                            not running and not processing_queue and not filter_queue:
+                        for process in process_pool:
+                            if process.exitcode:
+                                # Results of other groups are not affected.
+                                self.logger.error(f"Solving of group {process.name} on cloud has "
+                                                  f"failed, see its benchmark log")
+                        if not relaunches:
+                            break
+                        level += 1
+                        self.logger.info(f"Solving {len(relaunches)} launches again with CPU time "
+                                         f"limit {cloud_time_limits[level]}s")
+                        process_pool = self.__start_cloud_groups(
+                            relaunches, cloud_time_limits[level], memory_limit, core_limit,
+                            heap_limit, statistics_time, queue)
+                        self.progress.add(STAGE_VERIFICATION, COUNTER_TOTAL, len(relaunches))
+                        self.progress.add(STAGE_VERIFICATION, COUNTER_RUNNING, len(relaunches))
+                        relaunches = []
+                        # Connections were checked in the first round.
+                        connection_established = True
+                        continue
+                    # Logs are checked periodically until connections are established,
+                    # then wait only for new results, finished groups or jobs (or until progress
+                    # should be written).
+                    wait_for_any(process_pool, [queue, self.worker_pool.connection],
+                                 self.progress.interval if connection_established else
+                                 BUSY_WAITING_INTERVAL)
+                    relaunches.extend(self.__process_completed_jobs(running, results,
+                                                                    filter_queue))
             except Exception as exception:
                 self.logger.error(f"Process scheduler was terminated: {exception}", exc_info=True)
-                filtering_process.terminate()
+                self.worker_pool.terminate()
                 kill_launches(process_pool)
                 sys.exit(1)
-        else:
-            raise NotImplementedError
 
         self.logger.info("All launches have been completed")
-        self.logger.debug("Waiting for completion of filtering processes")
-        self.mea_input_queue.put(None)
-        filtering_process.join()
-        self._get_from_queue_into_list(queue, results)
-        if not self.mea_input_queue.empty():
-            resources = self.mea_input_queue.get()
-            mea_cpu = resources.get(TAG_CPU_TIME, 0.0)
-            mea_memory = resources.get(TAG_MEMORY_USAGE, 0)
-            mea_wall = resources.get(TAG_WALL_TIME, 0.0)
-        else:
-            mea_memory = 0
-            mea_cpu = 0.0
-            mea_wall = 0.0
-            self.logger.warning("MEA resources were not obtained")
+        self.progress.write(force=True)
+        self.worker_pool.shutdown()
+        if self.backup:
+            self.backup.close()
+        mea_cpu = 0.0
+        mea_memory = self.mea_memory_usage
+        mea_wall = self.mea_wall_time
 
         overall_cpu_time = time.process_time() - self.start_cpu_time
         overall_wall_time = time.time() - self.start_time
         self.logger.debug(f"Overall wall time of script: {overall_wall_time}")
         self.logger.debug(f"Overall CPU time of script: {overall_cpu_time}")
         self.logger.info("Solving of verification tasks has been completed")
+        self.__update_cost_history(results)
 
         report_launches, result_archive, report_components, short_report, report_resources = \
             self._get_results_names()
@@ -1147,7 +2399,7 @@ class FullLauncher(Launcher):
             cov_mem = 0
 
         # Yes, this is a rough approximation, but nothing better is available.
-        if self.scheduler == SCHEDULER_CLOUD:
+        if self.scheduler != SCHEDULER_LOCAL:
             wall_cov /= self.cpu_cores
         else:
             wall_cov /= min(number_of_processes, self.cpu_cores)
@@ -1213,8 +2465,8 @@ class FullLauncher(Launcher):
             self.logger.info("Cleaning working directories")
             shutil.rmtree(DEFAULT_MAIN_DIR, ignore_errors=True)
             shutil.rmtree(DEFAULT_EXPORT_DIR, ignore_errors=True)
-            if self.backup and os.path.exists(self.backup):
-                os.remove(self.backup)
+            if self.backup:
+                self.backup.clear()
             shutil.rmtree(DEFAULT_LAUNCHES_DIR, ignore_errors=True)
             shutil.rmtree(DEFAULT_PREPROCESS_DIR, ignore_errors=True)
         self.logger.info(f"Finishing verification of '{self.config_file}' configuration")
@@ -25,6 +25,7 @@ import datetime
 import multiprocessing
 import subprocess
 import tempfile
+from queue import SimpleQueue
 
 from components.component import Component
 from components.coverage_processor import Coverage
@@ -39,10 +40,22 @@ DEFAULT_ENTRYPOINTS_DIR = "entrypoints"
 DEFAULT_WORK_DIR = "work_dir"
 DEFAULT_RESULTS_DIR = "results"
 DEFAULT_BACKUP_PREFIX = "backup_"
+DEFAULT_RESULT_JOURNAL = "results_journal.csv"
+DEFAULT_CIL_MANIFEST = "cil_manifest.json"
+DEFAULT_COST_HISTORY_FILE = "cost_history.json"
+DEFAULT_LAUNCHES_REPORT_PREFIX = "report_launches_"
+DEFAULT_PROGRESS_FILE = "progress.json"
+DEFAULT_PROGRESS_INTERVAL = 10  # Seconds.
+DEFAULT_WARM_MAX_TASKS = 100
+DEFAULT_WARM_WALL_TIME_FACTOR = 2
+DEFAULT_BATCHING_MAX_TIME = 10  # Seconds.
+DEFAULT_BATCHING_SIZE = 10
 
 TAG_LIMIT_MEMORY = "memory size"
 TAG_LIMIT_CPU_TIME = "CPU time"
 TAG_LIMIT_CPU_CORES = "number of cores"
+TAG_LIMIT_PROPERTIES = "properties"
+TAG_LIMIT_ESCALATION = "CPU time escalation"
 TAG_CACHED = "cached"
 TAG_BRANCH = "branch"
 TAG_PATCH = "patches"
@@ -55,12 +68,19 @@ TAG_BACKUP_READ = "backup read"
 TAG_BENCHMARK_ARGS = "benchmark args"
 TAG_BENCHEXEC_OPTIONS = "benchexec options"
 TAG_PARALLEL_LAUNCHES = "parallel launches"
+TAG_BATCH_SIZE = "batch size"
+TAG_BATCH_THREADS = "batch threads"
 TAG_RESOURCE_LIMITATIONS = "resource limits"
 TAG_PROCESSES = "processes"
 TAG_SCHEDULER = "scheduler"
 TAG_CLOUD = "cloud"
 TAG_CLOUD_MASTER = "master"
 TAG_CLOUD_PRIORITY = "priority"
+TAG_CLOUD_GROUP_SIZE = "group size"
+TAG_WORKERS = "workers"
+TAG_WORKERS_HOSTS = "hosts"
+TAG_WORKERS_TOKEN = "token"
+TAG_WORKERS_TIMEOUT = "timeout"
 TAG_UPLOADER_UPLOAD_RESULTS = "upload results"
 TAG_UPLOADER_IDENTIFIER = "identifier"
 TAG_UPLOADER_SERVER = "server"
@@ -76,6 +96,20 @@ TAG_REPOSITORY = "repository"
 TAG_NAME = "name"
 TAG_VERIFIER_OPTIONS = "verifier options"
 TAG_EXPORT_HTML_ERROR_TRACES = "standalone error traces"
+TAG_COST_HISTORY = "cost history"
+TAG_VERDICT_CACHE = "verdict cache"
+TAG_PROGRESS_FILE = "progress file"
+TAG_PROGRESS_INTERVAL = "progress interval"
+TAG_WARM_VERIFIER = "warm verifier"
+TAG_WARM_COMMAND = "command"
+TAG_WARM_MAX_TIME = "max expected time"
+TAG_WARM_MAX_TASKS = "max tasks"
+TAG_WARM_ISOLATED = "isolated properties"
+TAG_WARM_WALL_TIME_FACTOR = "wall time factor"
+TAG_ENTRYPOINT_BATCHING = "entrypoint batching"
+TAG_BATCHING_MAX_TIME = "max expected time"
+TAG_BATCHING_SIZE = "size"
+TAG_PRESSURE_LIMITS = "pressure limits"
 
 TIMESTAMP_PATTERN = "<timestamp>"
 RUNDEFINITION_PATTERN = "<rundefinition>"
@@ -83,10 +117,12 @@ COMMIT_PATTERN = "<commit>"
 
 SCHEDULER_CLOUD = "cloud"
 SCHEDULER_LOCAL = "local"
-SCHEDULERS = [SCHEDULER_CLOUD, SCHEDULER_LOCAL]
+SCHEDULER_WORKERS = "workers"
+SCHEDULERS = [SCHEDULER_CLOUD, SCHEDULER_LOCAL, SCHEDULER_WORKERS]
 
 CLOUD_PRIORITIES = ["IDLE", "LOW", "HIGH", "URGENT"]
 DEFAULT_CLOUD_PRIORITY = "LOW"
+DEFAULT_WORKERS_TIMEOUT = 60
 CLOUD_BENCHMARK_LOG = "benchmark_log.txt"
 
 DEFAULT_BENCHEXEC_CONTAINER = "--container --full-access-dir /"
@@ -167,7 +203,7 @@ class Launcher(Component):
 
         self.cpu_cores = multiprocessing.cpu_count()
 
-        self.backup = None  # File, in which backup copy will be placed during verification.
+        self.backup = None  # Journal, in which results are stored during verification.
 
         # Defines type of scheduler.
         self.scheduler = self.component_config.get(TAG_SCHEDULER)
@@ -204,15 +240,28 @@ class Launcher(Component):
         return launch_dir
 
     def _process_coverage(self, result, launch_directory, source_dirs: list,
-                          default_source_file=None, work_dir=None):
+                          default_source_file=None, work_dir=None, separate_process=True):
         cov = Coverage(self, default_source_file=default_source_file)
-        cov_queue = multiprocessing.Queue()
-        cov_process = multiprocessing.Process(target=cov.compute_coverage,
-                                              name=f"coverage_{result.get_name()}",
-                                              args=(source_dirs, launch_directory, cov_queue, work_dir))
-        cov_process.start()
-        cov_process.join()  # Wait since we are already in parallel threads for each launch.
-        if not cov_process.exitcode:
+        if separate_process:
+            cov_queue = multiprocessing.Queue()
+            cov_process = multiprocessing.Process(target=cov.compute_coverage,
+                                                  name=f"coverage_{result.get_name()}",
+                                                  args=(source_dirs, launch_directory, cov_queue,
+                                                        work_dir))
+            cov_process.start()
+            cov_process.join()  # Wait since we are already in parallel threads for each launch.
+            is_computed = not cov_process.exitcode
+        else:
+            # Already in a worker process, which is not used by anything else.
+            cov_queue = SimpleQueue()
+            try:
+                cov.compute_coverage(source_dirs, launch_directory, cov_queue, work_dir)
+                is_computed = True
+            except Exception as exception:
+                self.logger.debug(f"Exception during coverage processing: {exception}",
+                                  exc_info=True)
+                is_computed = False
+        if is_computed:
             if cov_queue.qsize():
                 data = cov_queue.get()
                 result.cov_funcs = data.get(TAG_COVERAGE_FUNCS, 0.0)
@@ -225,13 +274,14 @@ class Launcher(Component):
                           f"{result.entrypoint}"
             self.logger.warning(warning_msg)
 
+    def _add_result(self, result, result_list):
+        result_list.append(result)
+        if self.backup:
+            self.backup.add(result)
+
     def _get_from_queue_into_list(self, queue, result_list):
         while not queue.empty():
-            launch = queue.get()
-            result_list.append(launch)
-            if self.backup:
-                with open(self.backup, "a", encoding='ascii') as f_report:
-                    f_report.write(str(launch) + "\n")
+            self._add_result(queue.get(), result_list)
         return result_list
 
     def _get_result_file_prefix(self):
@@ -321,7 +371,8 @@ class Launcher(Component):
 
     def _get_results_names(self) -> tuple:
         reports_prefix = self._get_result_file_prefix()
-        report_launches = os.path.join(self.results_dir, f"report_launches_{reports_prefix}.csv")
+        report_launches = os.path.join(self.results_dir,
+                                       f"{DEFAULT_LAUNCHES_REPORT_PREFIX}{reports_prefix}.csv")
         result_archive = os.path.join(self.results_dir, f"results_{reports_prefix}.zip")
         report_components = os.path.join(self.results_dir,
                                          f"report_components_{reports_prefix}.csv")
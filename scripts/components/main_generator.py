@@ -375,3 +375,24 @@ class MainGenerator(Component):
                 callers = [DEFAULT_MAIN]
 
         return callers
+
+    @staticmethod
+    def generate_batches(output_file: str, batches: dict) -> None:
+        """
+        Append functions, each of which calls one of the given generated entry points, so that
+        several entry points are checked by a single verifier launch.
+        :param output_file: previously generated main file.
+        :param batches: map of names of new functions to lists of their entry points.
+        """
+        with open(output_file, 'a', encoding='utf8') as file:
+            for batch, callers in batches.items():
+                file.write(f"/* ENVIRONMENT_MODEL {batch} generated main function */\n"
+                           f"void {batch}(void) {{\n"
+                           f"  int nondet = __VERIFIER_nondet_int();\n")
+                for i, caller in enumerate(callers[:-1]):
+                    file.write(f"  if (nondet == {i}) {{\n"
+                               f"    {caller}();\n"
+                               f"    return;\n"
+                               f"  }}\n")
+                file.write(f"  {callers[-1]}();\n"
+                           f"}}\n\n")
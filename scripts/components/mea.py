@@ -134,7 +134,7 @@ class MEA(Component):
                                                                             queue))
                             process_pool[i].start()
                             raise NestedLoop
-                    time.sleep(BUSY_WAITING_INTERVAL)
+                    wait_for_any(process_pool)
             except NestedLoop:
                 pass
             except Exception as exception:
@@ -189,7 +189,7 @@ class MEA(Component):
                                     args=(error_trace_file, ))
                                 process_pool[i].start()
                                 raise NestedLoop
-                        time.sleep(0.1)
+                        wait_for_any(process_pool)
                 except NestedLoop:
                     pass
                 except Exception as exception:
@@ -0,0 +1,213 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# pylint: disable=no-name-in-module
+
+"""
+Component, which solves verification tasks for the launcher on a worker host.
+"""
+
+import glob
+import hmac
+import ipaddress
+import json
+import os
+import shlex
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+
+from aux.worker_protocol import HEADER_BENCHMARK, HEADER_ERROR, HEADER_MODE, \
+    HEADER_MOVE_OUTPUT, HEADER_TASK_DIR, HEADER_TOKEN, INSTALL_DIR_PATTERN, MESSAGE_ERROR, \
+    MESSAGE_RESULT, MESSAGE_TASK, MESSAGE_TYPE, TASK_DIR_PATTERN, WORKER_OUTPUT_DIR, \
+    pack_files, parse_address, recv_header, recv_payload, send_message, unpack_files
+from components import *
+from components.component import Component
+from components.launcher import DEFAULT_BENCHEXEC_CONTAINER, DEFAULT_WORKERS_TIMEOUT, \
+    HARDCODED_RACES_OUTPUT_DIR, TAG_BENCHEXEC_OPTIONS, TAG_BENCHMARK_ARGS, TAG_WORKERS_TIMEOUT, \
+    TAG_WORKERS_TOKEN
+from models.verification_result import PropertiesDescription
+
+DEFAULT_WORKER_DIR = "worker_dir"
+DEFAULT_WORKER_ADDRESS = "localhost:8990"
+WORKER_BENCHMARK_FILE = "benchmark.xml"
+
+
+class _TaskHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.server.worker.process_connection(self.request)
+
+
+class _WorkerServerMixIn:
+    def __init__(self, address, worker, processes: int):
+        self.worker = worker
+        self.max_children = max(1, processes)
+        super().__init__(address, _TaskHandler)
+
+
+class _ForkingTCPServer(_WorkerServerMixIn, socketserver.ForkingMixIn, socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class _ForkingUnixServer(_WorkerServerMixIn, socketserver.ForkingMixIn,
+                         socketserver.UnixStreamServer):
+    pass
+
+
+class Worker(Component):
+    """
+    Component, which receives prepared verification tasks from the launcher, solves them by
+    BenchExec and sends results back. Each task is solved in a separate process.
+    """
+
+    def __init__(self, config_file: str = None):
+        config = {}
+        if config_file:
+            with open(config_file, errors='ignore', encoding='ascii') as data_file:
+                config = json.load(data_file)
+        super().__init__(COMPONENT_WORKER, config)
+        self.root_dir = os.getcwd()  # Worker is run from the root directory of the tool-set.
+        self.install_dir = os.path.join(self.root_dir, DEFAULT_INSTALL_DIR)
+        self.work_dir = os.path.abspath(self.component_config.get(TAG_DIRS, {}).get(
+            TAG_DIRS_WORK, DEFAULT_WORKER_DIR))
+        os.makedirs(self.work_dir, exist_ok=True)
+        self.output_desc = None if self.debug else subprocess.DEVNULL
+        path_to_benchexec = self.get_tool_path(self._get_tool_default_path(BENCHEXEC),
+                                               self.component_config.get(TAG_TOOLS, {}).
+                                               get(BENCHEXEC))
+        os.environ["PATH"] += os.pathsep + path_to_benchexec
+        # BenchExec is configured only by the worker host, tasks can not change its options.
+        self.benchexec_options = shlex.split(self.component_config.get(
+            TAG_BENCHEXEC_OPTIONS, DEFAULT_BENCHEXEC_CONTAINER))
+        self.benchmark_args = shlex.split(self.component_config.get(TAG_BENCHMARK_ARGS, ""))
+        self.token = self.component_config.get(TAG_WORKERS_TOKEN, "")
+        self.timeout = self.component_config.get(TAG_WORKERS_TIMEOUT, DEFAULT_WORKERS_TIMEOUT)
+        self.modes = self.__get_modes()
+
+    def __get_modes(self) -> set:
+        """
+        Returns verifier modes of all known properties, tasks can be solved only in them.
+        """
+        plugin_properties_desc_file = os.path.join(self.root_dir, DEFAULT_PLUGIN_DIR,
+                                                   self.config.get(TAG_SYSTEM_ID, ""),
+                                                   DEFAULT_PROPERTIES_DIR,
+                                                   DEFAULT_PROPERTIES_DESC_FILE)
+        properties_desc = PropertiesDescription(plugin_properties_desc_file)
+        return set(properties_desc.get_property_arg_for_all(PROPERTY_MODE).values())
+
+    def solve(self, header: dict, payload: bytes, task_dir: str) -> bytes:
+        """
+        Solve the received verification task in the given directory.
+        :return: archive with the output directory of BenchExec.
+        """
+        mode = header.get(HEADER_MODE)
+        if mode not in self.modes:
+            raise ValueError(f"Verifier mode '{mode}' is not known")
+        unpack_files(payload, task_dir)
+        benchmark_name = os.path.join(task_dir, WORKER_BENCHMARK_FILE)
+        with open(benchmark_name, "w", encoding="utf8") as file_obj:
+            file_obj.write(header[HEADER_BENCHMARK].replace(INSTALL_DIR_PATTERN, self.install_dir).
+                           replace(TASK_DIR_PATTERN, task_dir))
+        output_dir = os.path.join(task_dir, WORKER_OUTPUT_DIR)
+        os.makedirs(output_dir, exist_ok=True)
+
+        env = os.environ.copy()
+        env["PATH"] += os.pathsep + os.path.join(self.install_dir, mode,
+                                                 DEFAULT_CPACHECKER_SCRIPTS_PATH)
+        subprocess.check_call(["benchexec", "--no-compress-results"] + self.benchexec_options +
+                              ["-o", output_dir, benchmark_name] + self.benchmark_args,
+                              cwd=task_dir, env=env, stderr=self.output_desc,
+                              stdout=self.output_desc)
+
+        # Make output directory similar to the other properties.
+        if header.get(HEADER_MOVE_OUTPUT):
+            for file in glob.glob(os.path.join(task_dir, HARDCODED_RACES_OUTPUT_DIR, "witness*")):
+                shutil.move(file, output_dir)
+        return pack_files({name: os.path.join(output_dir, name) for name in os.listdir(output_dir)})
+
+    def process_connection(self, sock: socket.socket):
+        """
+        Receive a verification task from the launcher and send its results back.
+        """
+        sock.settimeout(self.timeout)
+        # Payload is received only from the launchers, which know the token.
+        try:
+            header, payload_size = recv_header(sock)
+        except (OSError, ValueError) as exception:
+            self.logger.warning(f"Incorrect message was rejected: {exception}")
+            return
+        if not hmac.compare_digest(str(header.get(HEADER_TOKEN, "")).encode("utf8"),
+                                   self.token.encode("utf8")):
+            self.logger.warning("Verification task with incorrect token was rejected")
+            send_message(sock, {MESSAGE_TYPE: MESSAGE_ERROR, HEADER_ERROR: "Incorrect token"})
+            return
+        if header.get(MESSAGE_TYPE) != MESSAGE_TASK:
+            self.logger.warning(f"Unexpected message '{header.get(MESSAGE_TYPE)}'")
+            return
+        try:
+            payload = recv_payload(sock, payload_size)
+        except (OSError, ValueError) as exception:
+            self.logger.warning(f"Verification task was not received: {exception}")
+            return
+        task_dir = tempfile.mkdtemp(dir=self.work_dir)
+        self.logger.debug(f"Solving new verification task in {task_dir}")
+        try:
+            result = self.solve(header, payload, task_dir)
+            send_message(sock, {MESSAGE_TYPE: MESSAGE_RESULT, HEADER_TASK_DIR: task_dir}, result)
+        except Exception as exception:
+            self.logger.error(f"Verification task was not solved: {exception}", exc_info=True)
+            send_message(sock, {MESSAGE_TYPE: MESSAGE_ERROR, HEADER_ERROR: str(exception)})
+        finally:
+            if not self.debug:
+                shutil.rmtree(task_dir, ignore_errors=True)
+
+    @staticmethod
+    def __is_local(host: str) -> bool:
+        try:
+            return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+        except (OSError, ValueError):
+            return False
+
+    def serve(self, address: str = DEFAULT_WORKER_ADDRESS, processes: int = 1):
+        """
+        Wait for verification tasks on the given address.
+        :param address: "<host>:<port>" or "unix:<socket file>".
+        :param processes: maximum number of tasks, which are solved in parallel.
+        """
+        family, sock_address = parse_address(address)
+        if family != socket.AF_UNIX and not self.token and not self.__is_local(sock_address[0]):
+            sys.exit(f"Worker can listen {address} only with a shared token ('{TAG_WORKERS_TOKEN}' "
+                     f"option), since tasks are executed on behalf of its user")
+        if family == socket.AF_UNIX:
+            server_class = _ForkingUnixServer
+            if os.path.exists(sock_address):
+                os.remove(sock_address)
+        else:
+            server_class = _ForkingTCPServer
+        with server_class(sock_address, self, processes) as server:
+            self.logger.info(f"Waiting for verification tasks on {address} with {processes} "
+                             f"processes")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                self.logger.info("Worker was stopped")
+        if family == socket.AF_UNIX and os.path.exists(sock_address):
+            os.remove(sock_address)
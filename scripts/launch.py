@@ -23,14 +23,35 @@ Main launch script.
 """
 
 import argparse
+import re
 
 from components.full_launcher import FullLauncher as Launcher
 
+
+def parse_shard(value: str) -> tuple:
+    """
+    Parse shard in format i/N, where 1 <= i <= N.
+    """
+    res = re.fullmatch(r'(\d+)/(\d+)', value)
+    if not res or not 1 <= int(res.group(1)) <= int(res.group(2)):
+        raise argparse.ArgumentTypeError(f"incorrect shard '{value}', it should be specified "
+                                         f"as i/N, where 1 <= i <= N")
+    return int(res.group(1)), int(res.group(2))
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", "-c", help="list of config files", nargs="+", required=True)
+    parser.add_argument("--plan", help="estimate number of verification tasks and required "
+                                       "resources without launching verifier",
+                        action='store_true')
+    parser.add_argument("--shard", help="solve only i-th of N parts of verification tasks (i/N)",
+                        type=parse_shard)
     options = parser.parse_args()
     for config in options.config:
-        launcher = Launcher(config)
-        launcher.launch()
+        launcher = Launcher(config, options.shard)
+        if options.plan:
+            launcher.plan()
+        else:
+            launcher.launch()
         del launcher
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+This script merges archives with results of several shards of the same configuration.
+"""
+
+import argparse
+
+from components.exporter import *
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-a", "--archives", help="archives with results of shards", nargs="+",
+                        required=True)
+    parser.add_argument("-o", "--output", help="merged archive", required=True)
+    parser.add_argument('--debug', action='store_true')
+    options = parser.parse_args()
+
+    for archive in options.archives:
+        if not os.path.exists(archive):
+            sys.exit(f"Archive '{archive}' does not exist")
+    config = {
+        COMPONENT_EXPORTER: {
+            TAG_DEBUG: options.debug
+        }
+    }
+    exporter = Exporter(config, tempfile.gettempdir(), os.path.abspath(DEFAULT_INSTALL_DIR))
+    exporter.merge(options.archives, options.output)
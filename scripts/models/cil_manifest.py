@@ -0,0 +1,175 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Manifest of prepared CIL files, which allows to reuse them while their inputs are not changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+HASH_BLOCK_SIZE = 2 ** 20
+
+
+class CilManifest:
+    """
+    Stores hash of inputs for each prepared CIL file: content of main, model and common files,
+    Preparator configuration, build commands, source files of the subsystem and files included
+    by them. CIL file is reused only if hash of its current inputs is the same. If build commands
+    do not contain included files (e.g., they were created by previous versions of Builder), then
+    CIL files are never reused, since changes of headers can not be tracked.
+    """
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.__file_hashes = {}
+        # Build commands file -> compiled source files and files included by them, or None.
+        self.__source_files = {}
+        self.__sources_hashes = {}  # (build commands file, subsystems) -> hash of their sources.
+        self.__inputs = {}  # CIL file -> hash of its inputs.
+        self.__pending = {}  # CIL file -> hash of inputs, with which it is being prepared.
+        if os.path.exists(file_name):
+            with open(file_name, encoding="utf8") as file_obj:
+                try:
+                    self.__inputs = json.load(file_obj)
+                except ValueError:
+                    pass
+
+    def __get_file_hash(self, file_name: str) -> str:
+        if file_name not in self.__file_hashes:
+            sha = hashlib.sha256()
+            if file_name and os.path.isfile(file_name):
+                with open(file_name, "rb") as file_obj:
+                    for block in iter(lambda: file_obj.read(HASH_BLOCK_SIZE), b""):
+                        sha.update(block)
+            self.__file_hashes[file_name] = sha.hexdigest()
+        return self.__file_hashes[file_name]
+
+    def __get_source_files(self, build_commands: str):
+        """
+        Returns pairs of compiled source files and lists of their dependencies, or None, if
+        dependencies are unknown.
+        """
+        if build_commands not in self.__source_files:
+            source_files = []
+            if build_commands and os.path.exists(build_commands):
+                with open(build_commands, errors='ignore', encoding="utf8") as file_obj:
+                    for command in json.load(file_obj):
+                        if "deps" not in command:
+                            source_files = None
+                            break
+                        cwd = command.get("cwd", "")
+                        deps = sorted({os.path.normpath(os.path.join(cwd, file))
+                                       for file in command["deps"]})
+                        for file in command.get("in", []):
+                            source_files.append((os.path.normpath(os.path.join(cwd, file)), deps))
+            self.__source_files[build_commands] = \
+                None if source_files is None else sorted(source_files)
+        return self.__source_files[build_commands]
+
+    def __get_sources_hash(self, build_commands: str, subsystems: list):
+        # The same subsystem is prepared for each rule.
+        key = build_commands, tuple(subsystems or [])
+        if key not in self.__sources_hashes:
+            source_files = self.__get_source_files(build_commands)
+            if source_files is None:
+                self.__sources_hashes[key] = None
+                return None
+            files = set()
+            for file, deps in source_files:
+                if not subsystems or any(re.search(subsystem, file) for subsystem in subsystems):
+                    files.add(file)
+                    # Headers are included regardless of subsystem.
+                    files.update(deps)
+            sha = hashlib.sha256()
+            for file in sorted(files):
+                sha.update(f"{file}\0{self.__get_file_hash(file)}\0".encode(
+                    "utf8", errors="ignore"))
+            self.__sources_hashes[key] = sha.hexdigest()
+        return self.__sources_hashes[key]
+
+    def get_sources_hash(self, build_results: dict, subsystems: list):
+        """
+        Compute hash of build commands and source files, which are included into a CIL file. It
+        is computed once for all rules of the subsystem and is passed to get_key.
+        :param build_results: map of source directories to their build commands files.
+        :param subsystems: patterns of source files, which are included into the CIL file.
+        :return: hash or None, if files included by sources are unknown.
+        """
+        sha = hashlib.sha256()
+        for source_dir, build_commands in sorted((build_results or {}).items()):
+            sources_hash = self.__get_sources_hash(build_commands, subsystems)
+            if sources_hash is None:
+                return None
+            for part in [source_dir, self.__get_file_hash(build_commands), sources_hash]:
+                sha.update(part.encode("utf8", errors="ignore"))
+                sha.update(b"\0")
+        return sha.hexdigest()
+
+    def get_key(self, files: list, sources_hash, options):
+        """
+        Compute hash of inputs of a CIL file.
+        :param files: main, model and other files, which are added to the CIL file.
+        :param sources_hash: result of get_sources_hash for the subsystem.
+        :param options: configuration of preparation (must be serializable into JSON).
+        :return: hash or None, if hash of sources is unknown.
+        """
+        if sources_hash is None:
+            return None
+        sha = hashlib.sha256()
+        parts = [json.dumps(options, sort_keys=True), sources_hash]
+        parts.extend(self.__get_file_hash(file) for file in files)
+        for part in parts:
+            sha.update(part.encode("utf8", errors="ignore"))
+            sha.update(b"\0")
+        return sha.hexdigest()
+
+    def check(self, cil_file: str, key: str) -> bool:
+        """
+        Check if the CIL file was prepared with the same inputs. Otherwise, it is considered to be
+        prepared again, and its record is updated only after successful preparation. CIL file
+        without key (its inputs are unknown) is always prepared again.
+        """
+        name = os.path.basename(cil_file)
+        if key and self.__inputs.get(name) == key and os.path.exists(cil_file):
+            return True
+        self.__inputs.pop(name, None)
+        if key:
+            self.__pending[name] = key
+        return False
+
+    def commit(self, cil_file: str) -> None:
+        """
+        Record inputs of successfully prepared CIL file.
+        """
+        name = os.path.basename(cil_file)
+        if name in self.__pending and os.path.exists(cil_file):
+            self.__inputs[name] = self.__pending.pop(name)
+
+    def save(self) -> None:
+        """
+        Write the manifest into its file.
+        """
+        tmp_file = f"{self.file_name}.tmp"
+        with open(tmp_file, "w", encoding="utf8") as file_obj:
+            json.dump(self.__inputs, file_obj, sort_keys=True, indent=2)
+        os.replace(tmp_file, self.file_name)
@@ -0,0 +1,108 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+History of resources, which were spent on verification tasks in previous runs.
+"""
+
+import json
+import os
+
+from components import TAG_CPU_TIME, TAG_WALL_TIME, TAG_MEMORY_USAGE
+
+# Weight of a new measurement in comparison with the history.
+HISTORY_WEIGHT = 0.5
+
+
+class CostHistory:
+    """
+    Persisted costs of verification tasks, which are identified by subsystem, entrypoint,
+    rule and verifier mode.
+    """
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.costs = {}
+        if file_name and os.path.exists(file_name):
+            with open(file_name, encoding="utf8", errors="ignore") as file_obj:
+                try:
+                    self.costs = json.load(file_obj)
+                except ValueError:
+                    self.costs = {}
+        self.__rule_costs = {}
+        self.__update_rule_costs()
+
+    @staticmethod
+    def get_key(subsystem: str, entrypoint: str, rule: str, mode: str) -> str:
+        """
+        Returns a key of a verification task in history.
+        """
+        return ";".join([str(subsystem), str(entrypoint), str(rule), str(mode)])
+
+    def __update_rule_costs(self):
+        # Average CPU time for each rule and mode is used for unknown tasks.
+        sums = {}
+        for key, cost in self.costs.items():
+            rule_key = tuple(key.split(";")[2:])
+            cpu_sum, number = sums.get(rule_key, (0.0, 0))
+            sums[rule_key] = (cpu_sum + cost.get(TAG_CPU_TIME, 0.0), number + 1)
+        self.__rule_costs = {rule_key: cpu_sum / number
+                             for rule_key, (cpu_sum, number) in sums.items()}
+
+    def get_cost(self, subsystem: str, entrypoint: str, rule: str, mode: str) -> dict:
+        """
+        Returns known costs of a verification task (empty dict, if it was never launched).
+        """
+        return self.costs.get(self.get_key(subsystem, entrypoint, rule, mode), {})
+
+    def get_expected_cpu(self, subsystem: str, entrypoint: str, rule: str, mode: str) -> float:
+        """
+        Returns expected CPU time of a verification task. If the task was not launched before,
+        then an average CPU time for this rule and mode is returned.
+        """
+        cost = self.get_cost(subsystem, entrypoint, rule, mode)
+        if cost:
+            return cost.get(TAG_CPU_TIME, 0.0)
+        return self.__rule_costs.get((str(rule), str(mode)), 0.0)
+
+    def add(self, subsystem: str, entrypoint: str, rule: str, mode: str, cpu: float,
+            wall: float, memory: int) -> None:
+        """
+        Add new measurement of a verification task costs.
+        """
+        key = self.get_key(subsystem, entrypoint, rule, mode)
+        new_cost = {TAG_CPU_TIME: cpu, TAG_WALL_TIME: wall, TAG_MEMORY_USAGE: memory}
+        if key in self.costs:
+            for tag, value in new_cost.items():
+                old_value = self.costs[key].get(tag, value)
+                new_cost[tag] = round(HISTORY_WEIGHT * value + (1 - HISTORY_WEIGHT) * old_value,
+                                      2)
+        self.costs[key] = new_cost
+
+    def save(self) -> None:
+        """
+        Write history into the file.
+        """
+        if not self.file_name:
+            return
+        self.__update_rule_costs()
+        tmp_file_name = self.file_name + ".tmp"
+        with open(tmp_file_name, "w", encoding="utf8") as file_obj:
+            json.dump(self.costs, file_obj, sort_keys=True, indent="\t")
+        os.replace(tmp_file_name, self.file_name)
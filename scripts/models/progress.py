@@ -0,0 +1,153 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Progress of verification, which is periodically written into files for external monitoring.
+"""
+
+import json
+import os
+import time
+
+STAGE_PREPARATION = "preparation"
+STAGE_VERIFICATION = "verification"
+STAGE_COVERAGE = "coverage"
+STAGE_FILTERING = "filtering"
+STAGES = [STAGE_PREPARATION, STAGE_VERIFICATION, STAGE_COVERAGE, STAGE_FILTERING]
+
+COUNTER_TOTAL = "total"
+COUNTER_QUEUED = "queued"
+COUNTER_RUNNING = "running"
+COUNTER_FINISHED = "finished"
+COUNTER_FAILED = "failed"
+COUNTERS = [COUNTER_TOTAL, COUNTER_QUEUED, COUNTER_RUNNING, COUNTER_FINISHED, COUNTER_FAILED]
+
+METRICS_EXTENSION = ".prom"
+METRICS_PREFIX = "cv"
+
+
+class Progress:
+    """
+    Number of tasks on each stage of verification (preparation, verifier launches, coverage and
+    filtering of error traces) along with throughput of verifier launches and estimated time to
+    complete them. Progress is written in JSON and OpenMetrics text formats, but not more often
+    than the given interval.
+    """
+
+    def __init__(self, file_name: str, interval: float):
+        self.file_name = file_name
+        self.metrics_file_name = os.path.splitext(file_name)[0] + METRICS_EXTENSION
+        self.interval = interval
+        self.counters = {stage: dict.fromkeys(COUNTERS, 0) for stage in STAGES}
+        self.start_time = time.time()
+        self.__last_write = 0.0
+        # Time of the first verifier launch to compute throughput.
+        self.__launches_start = None
+        self.__cpu_times = self.__get_cpu_times()
+
+    def add(self, stage: str, counter: str, number: int = 1) -> None:
+        """
+        Change the counter of tasks on the given stage.
+        """
+        if stage == STAGE_VERIFICATION and counter == COUNTER_RUNNING and \
+                self.__launches_start is None:
+            self.__launches_start = time.time()
+        self.counters[stage][counter] += number
+
+    def set(self, stage: str, counter: str, number: int) -> None:
+        """
+        Set the counter of tasks on the given stage.
+        """
+        self.counters[stage][counter] = number
+
+    @staticmethod
+    def __get_cpu_times() -> tuple:
+        # Overall and idle CPU time of the host (in ticks).
+        try:
+            with open("/proc/stat", encoding="ascii") as file_obj:
+                values = [int(value) for value in file_obj.readline().split()[1:]]
+        except (OSError, ValueError):
+            return 0, 0
+        return sum(values), values[3] + (values[4] if len(values) > 4 else 0)
+
+    def __get_cpu_utilisation(self) -> float:
+        overall, idle = self.__get_cpu_times()
+        prev_overall, prev_idle = self.__cpu_times
+        self.__cpu_times = overall, idle
+        if overall <= prev_overall:
+            return 0.0
+        return round(1 - (idle - prev_idle) / (overall - prev_overall), 3)
+
+    def get_state(self) -> dict:
+        """
+        Returns current progress.
+        """
+        now = time.time()
+        launches = self.counters[STAGE_VERIFICATION]
+        completed = launches[COUNTER_FINISHED] + launches[COUNTER_FAILED]
+        remaining = max(0, launches[COUNTER_TOTAL] - completed)
+        tasks_per_minute = 0.0
+        eta = None
+        if self.__launches_start is not None and completed:
+            tasks_per_minute = completed * 60 / max(now - self.__launches_start, 1)
+            eta = round(remaining * 60 / tasks_per_minute)
+        return {
+            "timestamp": round(now),
+            "elapsed": round(now - self.start_time),
+            "stages": self.counters,
+            "tasks per minute": round(tasks_per_minute, 2),
+            "cpu utilisation": self.__get_cpu_utilisation(),
+            "eta": eta
+        }
+
+    def write(self, force=False) -> None:
+        """
+        Write current progress into the files, if the interval has passed since the last write.
+        """
+        if not self.file_name or (not force and time.time() - self.__last_write < self.interval):
+            return
+        self.__last_write = time.time()
+        state = self.get_state()
+
+        lines = [f"# TYPE {METRICS_PREFIX}_tasks gauge",
+                 f"# HELP {METRICS_PREFIX}_tasks Number of tasks on each stage."]
+        for stage, counters in state["stages"].items():
+            for counter, value in counters.items():
+                lines.append(f'{METRICS_PREFIX}_tasks{{stage="{stage}",state="{counter}"}} '
+                             f'{value}')
+        lines.extend([
+            f"# TYPE {METRICS_PREFIX}_tasks_per_minute gauge",
+            f"{METRICS_PREFIX}_tasks_per_minute {state['tasks per minute']}",
+            f"# TYPE {METRICS_PREFIX}_cpu_utilisation gauge",
+            f"{METRICS_PREFIX}_cpu_utilisation {state['cpu utilisation']}",
+            f"# TYPE {METRICS_PREFIX}_elapsed_seconds gauge",
+            f"{METRICS_PREFIX}_elapsed_seconds {state['elapsed']}"
+        ])
+        if state["eta"] is not None:
+            lines.extend([f"# TYPE {METRICS_PREFIX}_eta_seconds gauge",
+                          f"{METRICS_PREFIX}_eta_seconds {state['eta']}"])
+        lines.append("# EOF")
+
+        for file_name, content in [(self.file_name, json.dumps(state, indent="\t")),
+                                   (self.metrics_file_name, "\n".join(lines) + "\n")]:
+            tmp_file_name = file_name + ".tmp"
+            with open(tmp_file_name, "w", encoding="utf8") as file_obj:
+                file_obj.write(content)
+            os.replace(tmp_file_name, file_name)
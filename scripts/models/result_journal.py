@@ -0,0 +1,126 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Append-only journal of verification results, which is used to resume interrupted runs.
+"""
+
+import os
+import time
+
+from models.verification_result import VerificationResults
+
+# Journal is synchronized with disk after this number of records or seconds.
+JOURNAL_SYNC_RECORDS = 100
+JOURNAL_SYNC_INTERVAL = 5
+
+
+class ResultJournal:
+    """
+    Stores each verification result as a single line in an append-only file. Records are flushed
+    immediately (so they survive a crash of the launcher), whereas synchronization with disk is
+    performed in batches.
+    """
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.__file = None
+        self.__unsynced = 0
+        self.__last_sync = time.time()
+
+    @staticmethod
+    def get_key(result) -> tuple:
+        """
+        Returns a key of a verification task, which identifies it in the journal.
+        """
+        if isinstance(result, VerificationResults):
+            identifier = result.id
+        else:
+            identifier = result.entry_desc.id
+        # Entry point may be verified in several CIL files.
+        return identifier, result.rule, result.entrypoint, os.path.basename(result.cil_file or "")
+
+    def read(self, config: dict, file_name=None) -> dict:
+        """
+        Read results from the journal (or from the given file in the same format).
+        :return: map of task keys to their latest results.
+        """
+        results = {}
+        file_name = file_name or self.file_name
+        if not os.path.exists(file_name):
+            return results
+        with open(file_name, "r", errors='ignore', encoding="ascii") as file_obj:
+            for line in file_obj:
+                result = VerificationResults(None, config)
+                try:
+                    result.parse_line(line.rstrip("\n"))
+                except (ValueError, IndexError):
+                    # The last record may be incomplete after a crash.
+                    continue
+                results[self.get_key(result)] = result
+        return results
+
+    def add(self, result: VerificationResults) -> None:
+        """
+        Append a new result to the journal.
+        """
+        if not self.__file:
+            is_terminated = True
+            if os.path.exists(self.file_name) and os.path.getsize(self.file_name):
+                with open(self.file_name, "rb") as file_obj:
+                    file_obj.seek(-1, os.SEEK_END)
+                    is_terminated = file_obj.read(1) == b"\n"
+            # pylint: disable=consider-using-with
+            self.__file = open(self.file_name, "a", encoding="ascii")
+            if not is_terminated:
+                # The last record is incomplete after a crash, so it is not continued.
+                self.__file.write("\n")
+        self.__file.write(f"{result};{result.cil_file or ''}\n")
+        self.__file.flush()
+        self.__unsynced += 1
+        if self.__unsynced >= JOURNAL_SYNC_RECORDS or \
+                time.time() - self.__last_sync >= JOURNAL_SYNC_INTERVAL:
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        Synchronize written records with disk.
+        """
+        if self.__file and self.__unsynced:
+            os.fsync(self.__file.fileno())
+        self.__unsynced = 0
+        self.__last_sync = time.time()
+
+    def clear(self) -> None:
+        """
+        Remove all records from the journal.
+        """
+        self.close()
+        if os.path.exists(self.file_name):
+            os.remove(self.file_name)
+
+    def close(self) -> None:
+        """
+        Synchronize the journal with disk and close it.
+        """
+        if self.__file:
+            self.sync()
+            self.__file.close()
+            self.__file = None
@@ -0,0 +1,113 @@
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Cache of verification results, which allows to skip verifier launches for unchanged tasks.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+from components import TERMINATION_OUT_OF_MEMORY, TERMINATION_SUCCESS, TERMINATION_TIMEOUT
+from models.result_journal import ResultJournal
+from models.verification_result import VerificationResults, VerificationTask
+
+# Result of a launch is cached only if it does not depend on the state of the host.
+CACHED_TERMINATION_REASONS = [TERMINATION_SUCCESS, TERMINATION_TIMEOUT, TERMINATION_OUT_OF_MEMORY]
+CACHE_RESULT_FILE = "result.csv"
+HASH_BLOCK_SIZE = 2 ** 20
+
+
+class VerdictCache:
+    """
+    Content-addressed cache of verification results. Each verification task is identified by
+    hash of its CIL file, entrypoint, rule, verifier mode and verifier configuration (options
+    and resource limits). Cached result is stored with all files from its launch directory.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.__file_hashes = {}
+        self.__keys = {}  # Task key -> cache key.
+
+    def __get_file_hash(self, file_name: str) -> str:
+        if file_name not in self.__file_hashes:
+            sha = hashlib.sha256()
+            with open(file_name, "rb") as file_obj:
+                for block in iter(lambda: file_obj.read(HASH_BLOCK_SIZE), b""):
+                    sha.update(block)
+            self.__file_hashes[file_name] = sha.hexdigest()
+        return self.__file_hashes[file_name]
+
+    def __get_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, launch: VerificationTask, verifier_config: str, config: dict,
+            launches_dir: str):
+        """
+        Find cached result for the given launch.
+        :param launch: verification task.
+        :param verifier_config: verifier options and resource limits for the launch.
+        :param config: configuration for the result.
+        :param launches_dir: directory, in which launch directory for the result is created.
+        :return: restored result or None, if there is no such result in cache.
+        """
+        sha = hashlib.sha256()
+        for part in [self.__get_file_hash(launch.cil_file), launch.entrypoint, launch.rule,
+                     launch.mode, str(launch.entry_desc.optimize), verifier_config]:
+            sha.update(part.encode("utf8", errors="ignore"))
+            sha.update(b"\0")
+        key = sha.hexdigest()
+        self.__keys[ResultJournal.get_key(launch)] = key
+
+        cached_dir = self.__get_dir(key)
+        result_file = os.path.join(cached_dir, CACHE_RESULT_FILE)
+        if not os.path.exists(result_file):
+            return None
+        result = VerificationResults(None, config)
+        with open(result_file, encoding="ascii") as file_obj:
+            try:
+                result.parse_line(file_obj.read().rstrip("\n"))
+            except (ValueError, IndexError):
+                return None
+        launch_dir = os.path.abspath(tempfile.mkdtemp(dir=launches_dir))
+        shutil.copytree(cached_dir, launch_dir, dirs_exist_ok=True)
+        os.remove(os.path.join(launch_dir, CACHE_RESULT_FILE))
+        result.work_dir = launch_dir
+        result.cil_file = launch.cil_file
+        return result
+
+    def store(self, result: VerificationResults) -> None:
+        """
+        Put final result of a launch into cache, if its key was previously computed.
+        """
+        key = self.__keys.pop(ResultJournal.get_key(result), None)
+        if not key or result.termination_reason not in CACHED_TERMINATION_REASONS:
+            return
+        cached_dir = self.__get_dir(key)
+        tmp_dir = f"{cached_dir}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        shutil.copytree(result.work_dir, tmp_dir)
+        with open(os.path.join(tmp_dir, CACHE_RESULT_FILE), "w", encoding="ascii") as file_obj:
+            file_obj.write(str(result))
+        shutil.rmtree(cached_dir, ignore_errors=True)
+        os.replace(tmp_dir, cached_dir)
@@ -167,10 +167,12 @@ class VerificationResults:
             self.id = verification_task.entry_desc.id
             self.rule = verification_task.rule
             self.entrypoint = verification_task.entrypoint
+            self.cil_file = verification_task.cil_file
         else:
             self.id = None
             self.rule = None
             self.entrypoint = None
+            self.cil_file = None
         self.cpu = 0
         self.mem = 0
         self.wall = 0
@@ -343,16 +345,19 @@ class VerificationResults:
         self.entrypoint = values[2]
         self.verdict = values[3]
         self.termination_reason = values[4]
-        self.cpu = int(values[5])
-        self.wall = int(values[6])
+        self.cpu = float(values[5])
+        self.wall = float(values[6])
         self.mem = int(values[7])
-        self.relevant = values[8]
+        self.relevant = values[8] == str(True)
         self.initial_traces = int(values[9])
         self.filtered_traces = int(values[10])
         self.work_dir = values[11]
         self.cov_lines = float(values[12])
         self.cov_funcs = float(values[13])
         self.mea_resources[TAG_CPU_TIME] = float(values[14])
+        if len(values) > 15:
+            # CIL file is stored only in the journal of results.
+            self.cil_file = values[15]
 
     def __str__(self):
         return ";".join([_to_str(self.id), _to_str(self.rule), _to_str(self.entrypoint),
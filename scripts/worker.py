@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+#
+# CV is a framework for continuous verification.
+#
+# Copyright (c) 2018-2019 ISP RAS (http://www.ispras.ru)
+# Ivannikov Institute for System Programming of the Russian Academy of Sciences
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""
+Worker script, which solves verification tasks for launchers on other hosts (cv-worker).
+"""
+
+import argparse
+
+from components.worker import DEFAULT_WORKER_ADDRESS, Worker
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--address", "-a", default=DEFAULT_WORKER_ADDRESS,
+                        help="address to listen: <host>:<port> or unix:<socket file> "
+                             "(non-local hosts require a shared token in the config)")
+    parser.add_argument("--processes", "-p", type=int, default=1,
+                        help="maximum number of verification tasks, which are solved in parallel")
+    parser.add_argument("--config", "-c", help="config file with options", default=None)
+    options = parser.parse_args()
+    Worker(options.config).serve(options.address, options.processes)